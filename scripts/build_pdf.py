@@ -0,0 +1,568 @@
+#!/usr/bin/env python3
+"""
+Compile cv.tex against a precompiled LaTeX format of its static preamble.
+The preamble (style/header.tex, style/macros.tex) is dumped once with
+mylatexformat and cached by content hash and TeX version, so warm builds
+skip re-processing the document class and packages.
+
+`--check` runs a single draft-mode pass instead (no PDF, no latexmk rerun
+cycle) and fails on LaTeX errors, overfull boxes or page overflow.
+`--profile` runs the normal latexmk build instrumented, and reports each
+pass (why latexmk reran it, how long it took), the files loaded and the
+warnings as JSON.
+"""
+
+import argparse
+import hashlib
+import glob
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Optional, List, Dict, Any, Tuple
+
+# Import configuration and utilities
+from config import (
+    MAIN_TEX_FILE, LATEX_ENGINE, LATEXMK_FLAGS, STYLE_DIR, FORMAT_CACHE_DIR,
+    CHECK_OUTPUT_DIR, CHECK_MAX_PAGES, CHECK_OVERFULL_TOLERANCE
+)
+from utils import logger, read_file_safe, configure_logging, enter_project_root
+from latex_log import (
+    PAGES_MARKER, LOAD_TIME_MARKER, parse_log_file, parse_fls_file, parse_latexmk_output, summarize_inputs
+)
+
+PREAMBLE_FILES = [
+    os.path.join(STYLE_DIR, "header.tex"),
+    os.path.join(STYLE_DIR, "macros.tex"),
+]
+FORMAT_KEY_LENGTH = 16
+# Slowest files to log after a --profile build (the report has them all)
+PROFILE_TOP_FILES = 10
+
+
+def get_tex_version(engine: str = LATEX_ENGINE) -> Optional[str]:
+    """Return the first line of `engine --version`, or None if TeX is unavailable."""
+    try:
+        result = subprocess.run(
+            [engine, "--version"], capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError) as e:
+        logger.warning(f"Could not determine {engine} version: {e}")
+        return None
+    lines = result.stdout.splitlines()
+    return lines[0].strip() if lines else None
+
+
+def get_preamble(text: str) -> str:
+    """Return everything before \\begin{document} (the whole text if absent)."""
+    end = text.find(r"\begin{document}")
+    return text if end == -1 else text[:end]
+
+
+def compute_format_key(tex_file: str, preamble_files: List[str],
+                       tex_version: str) -> Optional[str]:
+    """
+    Hash the inputs that end up baked into the format file.
+
+    Args:
+        tex_file: Root document whose preamble is dumped
+        preamble_files: Style files loaded by that preamble
+        tex_version: Engine version string (formats are not portable across versions)
+
+    Returns:
+        Short hex digest, or None if any input could not be read
+    """
+    content = read_file_safe(tex_file)
+    if content is None:
+        return None
+
+    digest = hashlib.sha256()
+    digest.update(tex_version.encode("utf-8"))
+    digest.update(get_preamble(content).encode("utf-8"))
+    for path in preamble_files:
+        style = read_file_safe(path)
+        if style is None:
+            return None
+        digest.update(path.encode("utf-8"))
+        digest.update(style.encode("utf-8"))
+    return digest.hexdigest()[:FORMAT_KEY_LENGTH]
+
+
+def get_format_name(tex_file: str, key: str) -> str:
+    """Format (jobname) for a root document and cache key, e.g. cv-1a2b3c..."""
+    stem = os.path.splitext(os.path.basename(tex_file))[0]
+    return f"{stem}-{key}"
+
+
+def remove_stale_formats(tex_file: str, cache_dir: str, keep: str) -> None:
+    """Delete cached formats for tex_file other than `keep`."""
+    stem = os.path.splitext(os.path.basename(tex_file))[0]
+    for path in glob.glob(os.path.join(cache_dir, f"{stem}-*")):
+        if os.path.splitext(os.path.basename(path))[0] != keep:
+            os.remove(path)
+            logger.debug(f"Removed stale format artifact: {path}")
+
+
+def dump_format(tex_file: str, cache_dir: str, fmt_name: str,
+                engine: str = LATEX_ENGINE) -> bool:
+    """Dump the preamble of tex_file into `<cache_dir>/<fmt_name>.fmt`."""
+    os.makedirs(cache_dir, exist_ok=True)
+    cmd = [
+        engine, "-ini", "-interaction=nonstopmode",
+        f"-jobname={fmt_name}", f"-output-directory={cache_dir}",
+        f"&{engine}", "mylatexformat.ltx", tex_file,
+    ]
+    logger.info(f"Dumping preamble format: {fmt_name}.fmt")
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True)
+    except OSError as e:
+        logger.error(f"Could not run {engine}: {e}")
+        return False
+
+    fmt_path = os.path.join(cache_dir, f"{fmt_name}.fmt")
+    if result.returncode != 0 or not os.path.exists(fmt_path):
+        logger.error(f"Format dump failed (see {os.path.join(cache_dir, fmt_name)}.log)")
+        return False
+    return True
+
+
+def ensure_format(tex_file: str = MAIN_TEX_FILE, cache_dir: str = FORMAT_CACHE_DIR,
+                  engine: str = LATEX_ENGINE) -> Optional[str]:
+    """
+    Return the name of an up-to-date precompiled format for tex_file,
+    dumping it first if the style files or TeX version changed.
+
+    Returns:
+        Format name usable with `-fmt=`, or None if no format could be built
+    """
+    tex_version = get_tex_version(engine)
+    if tex_version is None:
+        return None
+
+    key = compute_format_key(tex_file, PREAMBLE_FILES, tex_version)
+    if key is None:
+        return None
+
+    fmt_name = get_format_name(tex_file, key)
+    if os.path.exists(os.path.join(cache_dir, f"{fmt_name}.fmt")):
+        logger.debug(f"Using cached format: {fmt_name}.fmt")
+        return fmt_name
+
+    remove_stale_formats(tex_file, cache_dir, keep=fmt_name)
+    if not dump_format(tex_file, cache_dir, fmt_name, engine):
+        return None
+    return fmt_name
+
+
+def latexmk_command(tex_file: str, fmt_name: Optional[str] = None,
+                    cache_dir: str = FORMAT_CACHE_DIR, engine: str = LATEX_ENGINE,
+                    force: bool = False, flags: Optional[List[str]] = None,
+                    engine_wrapper: str = "") -> Tuple[List[str], Dict[str, str]]:
+    """
+    Build the latexmk command line and environment for compile_pdf().
+
+    Args:
+        flags: latexmk flags (default: config.LATEXMK_FLAGS)
+        engine_wrapper: Command prefixed to the engine call (used to time passes)
+
+    Returns:
+        (command, environment)
+    """
+    cmd = ["latexmk"] + (LATEXMK_FLAGS if flags is None else flags)
+    if force:
+        cmd.append("-g")
+
+    env = os.environ.copy()
+    if fmt_name:
+        # Let kpathsea find the cached format ahead of the system formats
+        env["TEXFORMATS"] = os.path.abspath(cache_dir) + os.pathsep + env.get("TEXFORMATS", "")
+    if fmt_name or engine_wrapper:
+        fmt_flag = f" -fmt={fmt_name}" if fmt_name else ""
+        cmd.append(f"-pdflatex={engine_wrapper}{engine}{fmt_flag} %O %S")
+    cmd.append(tex_file)
+    return cmd, env
+
+
+def compile_pdf(tex_file: str = MAIN_TEX_FILE, fmt_name: Optional[str] = None,
+                cache_dir: str = FORMAT_CACHE_DIR, engine: str = LATEX_ENGINE,
+                force: bool = False, extra_flags: Optional[List[str]] = None) -> bool:
+    """
+    Compile tex_file with latexmk, optionally against a precompiled format.
+
+    Args:
+        tex_file: Root document
+        fmt_name: Format from ensure_format(), or None for a plain compile
+        cache_dir: Directory holding the format file
+        engine: LaTeX engine latexmk should drive
+        force: Recompile even if latexmk considers the PDF up to date
+        extra_flags: Additional latexmk flags (e.g. -outdir)
+    """
+    cmd, env = latexmk_command(tex_file, fmt_name, cache_dir, engine, force,
+                               LATEXMK_FLAGS + (extra_flags or []))
+    try:
+        result = subprocess.run(cmd, env=env)
+    except OSError as e:
+        logger.error(f"Could not run latexmk: {e}")
+        return False
+    return result.returncode == 0
+
+
+def build(tex_file: str = MAIN_TEX_FILE, use_format: bool = True, force: bool = False) -> bool:
+    """Compile tex_file, using the cached preamble format when possible."""
+    fmt_name = ensure_format(tex_file) if use_format else None
+    if use_format and fmt_name is None:
+        logger.warning("Precompiled format unavailable, falling back to a full compile")
+
+    success = compile_pdf(tex_file, fmt_name, force=force)
+    if success:
+        pdf_file = os.path.splitext(tex_file)[0] + ".pdf"
+        logger.info(f"✓ PDF generated: {pdf_file}")
+    else:
+        logger.error(f"Failed to compile {tex_file}")
+    return success
+
+
+def run_draft_pass(tex_file: str = MAIN_TEX_FILE, fmt_name: Optional[str] = None,
+                   output_dir: str = CHECK_OUTPUT_DIR, cache_dir: str = FORMAT_CACHE_DIR,
+                   engine: str = LATEX_ENGINE) -> Optional[str]:
+    """
+    Run one `-draftmode` pass of tex_file (no PDF is written).
+
+    Returns:
+        Path of the .log file, or None if the engine could not be run
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    jobname = os.path.splitext(os.path.basename(tex_file))[0]
+    # Report the shipped page count; draft mode has no "Output written" line
+    hook = (r"\AddToHook{enddocument/afterlastpage}"
+            rf"{{\typeout{{{PAGES_MARKER} \the\ReadonlyShipoutCounter}}}}")
+    cmd = [engine, "-draftmode", "-interaction=nonstopmode", "-file-line-error",
+           f"-output-directory={output_dir}", f"-jobname={jobname}"]
+
+    env = os.environ.copy()
+    # Keep log messages on one line each so they parse reliably
+    env["max_print_line"] = "10000"
+    if fmt_name:
+        cmd.append(f"-fmt={fmt_name}")
+        env["TEXFORMATS"] = os.path.abspath(cache_dir) + os.pathsep + env.get("TEXFORMATS", "")
+    cmd.append(rf"{hook}\input{{{tex_file}}}")
+
+    try:
+        subprocess.run(cmd, env=env, stdin=subprocess.DEVNULL,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except OSError as e:
+        logger.error("Could not run %s: %s", engine, e)
+        return None
+    return os.path.join(output_dir, f"{jobname}.log")
+
+
+def evaluate_check(log: Dict[str, Any], max_pages: int = CHECK_MAX_PAGES,
+                   overfull_tolerance: float = CHECK_OVERFULL_TOLERANCE) -> List[str]:
+    """
+    Compare a parsed log against the check thresholds.
+
+    Returns:
+        One message per problem; empty if the document passes
+    """
+    problems = []
+    for error in log['errors']:
+        location = f"{error['file']}:{error['line']}: " if error['file'] else (
+            f"line {error['line']}: " if error['line'] else "")
+        problems.append(f"error: {location}{error['message']}")
+    for box in log['overfull']:
+        if box['amount'] > overfull_tolerance:
+            where = f" at lines {box['lines'][0]}--{box['lines'][1]}" if box['lines'] else ""
+            problems.append(f"overfull {box['box']} by {box['amount']}pt{where}")
+    if log['pages'] is None:
+        problems.append("page count not reported (did the compile abort?)")
+    elif log['pages'] > max_pages:
+        problems.append(f"{log['pages']} pages, limit is {max_pages}")
+    return problems
+
+
+def check(tex_file: str = MAIN_TEX_FILE, use_format: bool = True,
+          max_pages: int = CHECK_MAX_PAGES,
+          overfull_tolerance: float = CHECK_OVERFULL_TOLERANCE) -> Optional[Dict[str, Any]]:
+    """
+    Fast CI check: one draft-mode pass, then errors, overfull boxes and
+    page count from the log.
+
+    Returns:
+        Report dict (parsed log, problems, seconds), or None if TeX could not run
+    """
+    start = time.perf_counter()
+    fmt_name = ensure_format(tex_file) if use_format else None
+    log_file = run_draft_pass(tex_file, fmt_name)
+    log = parse_log_file(log_file) if log_file else None
+    if log is None:
+        logger.error("Check compile of %s produced no log", tex_file)
+        return None
+
+    report = dict(log, problems=evaluate_check(log, max_pages, overfull_tolerance),
+                  seconds=round(time.perf_counter() - start, 3))
+    for problem in report['problems']:
+        logger.error("%s: %s", tex_file, problem)
+    if not report['problems']:
+        logger.info("✓ %s: %d page(s), no errors (%.2fs)", tex_file, log['pages'], report['seconds'])
+    return report
+
+
+# Report when each file starts and finishes loading, for per-package times
+LOAD_TIME_HOOKS = "".join(
+    rf"\AddToHook{{file/{hook}}}{{\typeout{{{LOAD_TIME_MARKER} {event} \CurrentFileUsed\space\the\pdfelapsedtime}}}}"
+    for hook, event in (("before", "begin"), ("after", "end"))
+)
+
+
+def with_load_time_hooks(cmd: List[str]) -> List[str]:
+    r"""
+    Rewrite an engine command line so the run prints LOAD_TIME_MARKER lines:
+    the source file is \input after installing LOAD_TIME_HOOKS, with the
+    jobname it would have had.
+    """
+    source = cmd[-1]
+    if len(cmd) < 2 or source.startswith(("\\", "&", "-")):
+        return cmd
+    flags = cmd[1:-1]
+    if not any(flag.lstrip("-").startswith("jobname") for flag in flags):
+        flags.append(f"-jobname={os.path.splitext(os.path.basename(source))[0]}")
+    return [cmd[0]] + flags + [rf"{LOAD_TIME_HOOKS}\input{{{source}}}"]
+
+
+def run_timed_pass(timing_file: str, cmd: List[str], trace_loads: bool = False) -> int:
+    """
+    Run one engine pass for --profile and append its wall time to
+    timing_file as a JSON line. latexmk calls this in place of the engine.
+    With trace_loads, the pass also reports per-file load times (see
+    with_load_time_hooks()).
+
+    Returns:
+        The engine's exit code
+    """
+    if trace_loads:
+        cmd = with_load_time_hooks(cmd)
+    start = time.perf_counter()
+    try:
+        returncode = subprocess.run(cmd).returncode
+    except OSError as e:
+        print(f"Could not run {cmd[0]}: {e}", file=sys.stderr)
+        returncode = 127
+    with open(timing_file, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"seconds": round(time.perf_counter() - start, 3),
+                            "returncode": returncode}) + "\n")
+    return returncode
+
+
+def rank_load_times(load_times: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Timed files, most expensive first by the time spent in the file itself."""
+    timed = [entry for entry in load_times if entry['self_seconds'] is not None]
+    return sorted(timed, key=lambda entry: -entry['self_seconds'])
+
+
+def attach_pass_timings(passes: List[Dict[str, Any]], timings: List[Dict[str, Any]],
+                        engine: str = LATEX_ENGINE) -> List[Dict[str, Any]]:
+    """
+    Give each engine pass latexmk reported the time recorded by
+    run_timed_pass(), in order. Other rules (bibtex etc.) are not timed.
+    """
+    passes = list(passes)
+    engine_passes = [p for p in passes if p['rule'] == engine]
+    if len(engine_passes) != len(timings):
+        logger.warning("latexmk reported %d %s passes but %d were timed",
+                       len(engine_passes), engine, len(timings))
+    # Timed passes latexmk's output did not announce are still reported
+    for _ in timings[len(engine_passes):]:
+        entry = {'rule': engine, 'run': None, 'reasons': []}
+        passes.append(entry)
+        engine_passes.append(entry)
+
+    for entry, timing in zip(engine_passes, timings):
+        entry['seconds'] = timing['seconds']
+        entry['returncode'] = timing['returncode']
+    for entry in passes:
+        entry.setdefault('seconds', None)
+    return passes
+
+
+def profile(tex_file: str = MAIN_TEX_FILE, use_format: bool = True, force: bool = False,
+            engine: str = LATEX_ENGINE) -> Optional[Dict[str, Any]]:
+    """
+    Run the latexmk build instrumented: latexmk's output is parsed as it
+    streams for the passes and their rerun reasons, each engine pass is
+    timed, and the final .log and .fls give the warnings and files loaded.
+
+    Returns:
+        Report dict, or None if latexmk could not be run
+    """
+    start = time.perf_counter()
+    fmt_name = ensure_format(tex_file, engine=engine) if use_format else None
+
+    fd, timing_file = tempfile.mkstemp(prefix="passes-", suffix=".jsonl")
+    os.close(fd)
+    wrapper = f'"{sys.executable}" "{os.path.abspath(__file__)}" --trace-loads --timed-pass "{timing_file}" '
+    # -silent would hide the rerun reasons; -recorder writes the .fls
+    flags = [f for f in LATEXMK_FLAGS if f != "-silent"] + ["-recorder"]
+    cmd, env = latexmk_command(tex_file, fmt_name, engine=engine, force=force,
+                               flags=flags, engine_wrapper=wrapper)
+    env["max_print_line"] = "10000"
+
+    try:
+        try:
+            proc = subprocess.Popen(cmd, env=env, stdin=subprocess.DEVNULL,
+                                    stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                    text=True, errors="replace")
+        except OSError as e:
+            logger.error(f"Could not run latexmk: {e}")
+            return None
+
+        stdout = proc.stdout
+        assert stdout is not None  # opened with stdout=PIPE
+
+        def lines():
+            for line in stdout:
+                logger.debug("latexmk: %s", line.rstrip())
+                yield line
+        passes = parse_latexmk_output(lines())
+        returncode = proc.wait()
+
+        with open(timing_file, "r", encoding="utf-8") as f:
+            timings = [json.loads(line) for line in f if line.strip()]
+    finally:
+        os.remove(timing_file)
+
+    stem = os.path.splitext(tex_file)[0]
+    log = parse_log_file(stem + ".log") or {'errors': [], 'overfull': [], 'warnings': [],
+                                            'pages': None, 'load_times': []}
+    fls = parse_fls_file(stem + ".fls") or {'inputs': [], 'outputs': []}
+
+    passes = attach_pass_timings(passes, timings, engine)
+    report = {
+        'tex_file': tex_file,
+        'success': returncode == 0,
+        'seconds': round(time.perf_counter() - start, 3),
+        'engine_seconds': round(sum(t['seconds'] for t in timings), 3),
+        'passes': passes,
+        'pages': log['pages'],
+        'errors': log['errors'],
+        'warnings': log['warnings'],
+        'overfull': log['overfull'],
+        'files': dict(summarize_inputs(fls['inputs']), inputs=fls['inputs'], outputs=fls['outputs']),
+        # From the last pass; with a precompiled format, its preamble packages
+        # are already loaded and do not appear
+        'load_times': rank_load_times(log['load_times']),
+        # Precompiled format used, or None; its packages are not in load_times
+        'format': fmt_name,
+    }
+
+    engine_passes = sum(1 for p in passes if p['rule'] == engine)
+    logger.info("%s %s: %d %s pass(es) in %.2fs, %d files loaded, %d warnings",
+                "✓" if report['success'] else "✗", tex_file, engine_passes, engine,
+                report['seconds'], report['files']['count'], len(report['warnings']))
+    for entry in passes:
+        shown = f"{entry['seconds']:.2f}s" if entry['seconds'] is not None else "untimed"
+        logger.info("  %s run %s: %s - %s", entry['rule'], entry['run'], shown,
+                    "; ".join(entry['reasons']) or "no reason reported")
+    for entry in report['load_times'][:PROFILE_TOP_FILES]:
+        logger.info("  %7.3fs %s (%.3fs including the files it loads)",
+                    entry['self_seconds'], entry['file'], entry['seconds'])
+    if fmt_name:
+        logger.info("  Preamble packages are preloaded in %s.fmt and not timed; "
+                    "profile with --no-format to include them", fmt_name)
+    return report
+
+
+def _timed(func, *args, **kwargs) -> Optional[float]:
+    """Run func and return elapsed seconds, or None if it reported failure."""
+    start = time.perf_counter()
+    ok = func(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+    return elapsed if ok else None
+
+
+def benchmark(tex_file: str = MAIN_TEX_FILE, runs: int = 3) -> Dict[str, Optional[float]]:
+    """
+    Compare compile times: plain latexmk, cold (format dump + compile)
+    and warm (cached format) builds. Each compile is forced.
+
+    Returns:
+        Dict of scenario -> best wall time in seconds (None if it failed)
+    """
+    results: Dict[str, Optional[float]] = {}
+
+    plain = [_timed(compile_pdf, tex_file, None, force=True) for _ in range(runs)]
+    results["plain"] = min((t for t in plain if t is not None), default=None)
+
+    shutil.rmtree(FORMAT_CACHE_DIR, ignore_errors=True)
+    results["cold"] = _timed(build, tex_file, force=True)
+
+    warm = [_timed(build, tex_file, force=True) for _ in range(runs)]
+    results["warm"] = min((t for t in warm if t is not None), default=None)
+
+    logger.info(f"Compile benchmark (best of {runs}, seconds):")
+    for scenario, seconds in results.items():
+        shown = f"{seconds:.2f}" if seconds is not None else "failed"
+        logger.info(f"  {scenario:6s} {shown}")
+    return results
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Compile the resume PDF")
+    parser.add_argument("tex_file", nargs="?", default=MAIN_TEX_FILE)
+    parser.add_argument("--no-format", action="store_true",
+                        help="compile without the precompiled preamble format")
+    parser.add_argument("--force", action="store_true",
+                        help="recompile even if the PDF is up to date")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="report cold versus warm compile times")
+    parser.add_argument("--runs", type=int, default=3,
+                        help="repetitions per benchmark scenario")
+    parser.add_argument("--check", action="store_true",
+                        help="single draft-mode pass: fail on errors, overfull boxes or page overflow")
+    parser.add_argument("--max-pages", type=int, default=CHECK_MAX_PAGES)
+    parser.add_argument("--profile", action="store_true",
+                        help="instrumented latexmk build: passes, rerun reasons, timings, files and warnings")
+    parser.add_argument("--report", help="write the --check/--profile report as JSON to this file "
+                                         "(--profile prints it to stdout otherwise)")
+    # Internal: latexmk runs each engine pass of --profile through this
+    parser.add_argument("--timed-pass", nargs=argparse.REMAINDER, help=argparse.SUPPRESS)
+    parser.add_argument("--trace-loads", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.timed_pass:
+        sys.exit(run_timed_pass(args.timed_pass[0], args.timed_pass[1:], args.trace_loads))
+    configure_logging(stream=sys.stderr if args.profile and not args.report else None)
+    enter_project_root()
+
+    if args.check:
+        report = check(args.tex_file, use_format=not args.no_format, max_pages=args.max_pages)
+        if report is not None and args.report:
+            os.makedirs(os.path.dirname(args.report) or ".", exist_ok=True)
+            with open(args.report, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+        sys.exit(0 if report is not None and not report["problems"] else 1)
+
+    if args.profile:
+        report = profile(args.tex_file, use_format=not args.no_format, force=args.force)
+        if report is not None:
+            if args.report:
+                os.makedirs(os.path.dirname(args.report) or ".", exist_ok=True)
+                with open(args.report, "w", encoding="utf-8") as f:
+                    json.dump(report, f, indent=2)
+            else:
+                json.dump(report, sys.stdout, indent=2)
+                print()
+        sys.exit(0 if report is not None and report["success"] else 1)
+
+    if args.benchmark:
+        results = benchmark(args.tex_file, args.runs)
+        sys.exit(0 if all(t is not None for t in results.values()) else 1)
+
+    if not build(args.tex_file, use_format=not args.no_format, force=args.force):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
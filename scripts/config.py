@@ -27,11 +27,16 @@ GITHUB_USERNAME = "Abhineshhh"
 SECTIONS_DIR = "sections"
 STYLE_DIR = "style"
 DOCS_DIR = "docs"
+# \newcommand / \newenvironment definitions read by the parsers (utils.MacroTable)
+MACROS_FILE = "style/macros.tex"
 
 # Output Files
 OUTPUT_FILES = {
     "json": "docs/resume.json",
-    "latest_pr": "sections/latest_pr.tex"
+    "latest_pr": "sections/latest_pr.tex",
+    "manifest": "docs/manifest.json",
+    "html": "docs/index.html",
+    "text": "docs/resume.txt"
 }
 
 # Resume Content Summary - parsed from sections/summary.tex by utils.get_summary_text()
@@ -75,3 +80,63 @@ OPEN_SOURCE_CONTRIBUTIONS = [
 # API Configuration
 GITHUB_API_TIMEOUT = 10  # seconds
 GITHUB_API_BASE = "https://api.github.com"
+GITHUB_GRAPHQL_URL = f"{GITHUB_API_BASE}/graphql"
+# PR fetch backend: "rest" (search API) or "graphql" (single round trip,
+# requires GITHUB_TOKEN). Overridable with the GITHUB_API_BACKEND env var.
+GITHUB_API_BACKEND = "rest"
+
+# Stale-while-revalidate PR snippet (fetch_latest_pr.py --swr)
+PR_SNIPPET_MAX_STALENESS = 6 * 3600  # seconds a cached latest_pr.tex is used as-is
+PR_FETCH_LATENCY_BUDGET = 2.0  # seconds to wait for GitHub when no fresh snippet exists
+
+# Build Configuration
+MAIN_TEX_FILE = "cv.tex"
+LATEX_ENGINE = "pdflatex"
+LATEXMK_FLAGS = ["-pdf", "-interaction=nonstopmode", "-silent"]
+BUILD_CACHE_DIR = ".cache"
+# Precompiled preamble formats, keyed by style content hash and TeX version
+FORMAT_CACHE_DIR = ".cache/latex-fmt"
+# Draft-mode check compile (build_pdf.py --check): one pass, no PDF
+CHECK_OUTPUT_DIR = "build/check"
+CHECK_MAX_PAGES = 1
+CHECK_OVERFULL_TOLERANCE = 1.0  # pt; smaller overfull boxes are not reported as failures
+
+
+# Publishing - scripts/publish.py copies build outputs into docs/
+# Source -> published path; unchanged content is never rewritten
+PUBLISH_ARTIFACTS = {
+    "cv.pdf": "docs/index.pdf",
+    "docs/resume.json": "docs/resume.json",
+    "docs/index.html": "docs/index.html"
+}
+# Published files that also get precompressed .gz/.br siblings
+PRECOMPRESS_FILES = ["docs/resume.json", "docs/index.html"]
+# Hardlink instead of copying changed artifacts (same filesystem only).
+# Off by default: latexmk rewrites cv.pdf in place, which would also
+# change the published copy before the next publish.
+PUBLISH_HARDLINK = False
+
+# JSON Resume -> LaTeX trees (scripts/generate_latex.py)
+LATEX_OUTPUT_DIR = "build/latex"
+
+# Inverted keyword index over resume trees (scripts/keyword_index.py)
+KEYWORD_INDEX_FILE = ".cache/keyword_index.sqlite"
+
+# Tailored Resume Variants - rendered by scripts/render_variants.py
+# Each variant lists the sections/*.tex files to include, in order, and may
+# override individual sections with a replacement .tex file.
+VARIANTS_OUTPUT_DIR = "build/variants"
+RESUME_VARIANTS = {
+    "backend": {
+        "sections": ["summary", "projects", "skills", "open_source", "education"],
+        "overrides": {}
+    },
+    "open-source": {
+        "sections": ["summary", "open_source", "projects", "skills", "education"],
+        "overrides": {}
+    },
+    "new-grad": {
+        "sections": ["summary", "education", "skills", "projects"],
+        "overrides": {}
+    }
+}
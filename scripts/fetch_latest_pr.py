@@ -4,20 +4,47 @@ Fetch the latest merged PR from GitHub and generate a LaTeX snippet.
 Uses GitHub API with optional authentication for higher rate limits.
 """
 
+import argparse
 import requests
+import subprocess
 import sys
 import os
+import threading
 import time
 
 # Import configuration and utilities
-from config import GITHUB_USERNAME, OUTPUT_FILES, FALLBACK_PR_TEXT, GITHUB_API_TIMEOUT
-from utils import logger, write_file_safe, escape_latex_chars
+from config import (
+    GITHUB_USERNAME, OUTPUT_FILES, FALLBACK_PR_TEXT, GITHUB_API_TIMEOUT,
+    GITHUB_GRAPHQL_URL, GITHUB_API_BACKEND, PR_SNIPPET_MAX_STALENESS,
+    PR_FETCH_LATENCY_BUDGET
+)
+from utils import (
+    logger, write_file_safe, read_file_safe, escape_latex_chars,
+    configure_logging, enter_project_root
+)
 
 OUTPUT_FILE = OUTPUT_FILES['latest_pr']
 FALLBACK_TEXT = FALLBACK_PR_TEXT
 MAX_RETRIES = 3
 RETRY_DELAY = 2  # seconds
 
+# Merged PRs plus repository metadata in one round trip; only fields we use
+GRAPHQL_QUERY = """
+query($q: String!, $n: Int!) {
+  search(query: $q, type: ISSUE, first: $n) {
+    nodes {
+      ... on PullRequest {
+        title
+        url
+        repository {
+          nameWithOwner
+        }
+      }
+    }
+  }
+}
+"""
+
 def get_github_headers():
     """Get GitHub API headers with optional authentication."""
     headers = {
@@ -108,6 +135,105 @@ def get_latest_merged_pr():
     return None, None, None
 
 
+def parse_graphql_pr(data):
+    """
+    Extract the latest merged PR from a GraphQL search response.
+    
+    Returns:
+        Dict with keys: title, url, repo - or None if the response holds no PR
+    """
+    nodes = data['data']['search']['nodes']
+    # Non-PR nodes come back as empty objects from the inline fragment
+    prs = [node for node in nodes if node]
+    if not prs:
+        return None
+    
+    pr = prs[0]
+    return {
+        'title': pr['title'],
+        'url': pr['url'],
+        'repo': pr['repository']['nameWithOwner']
+    }
+
+
+def get_latest_merged_pr_graphql(graphql_url=GITHUB_GRAPHQL_URL):
+    """
+    Fetch the latest merged PR and its repository metadata with a single
+    GraphQL query. Returns the same (title, url, repo) triple as
+    get_latest_merged_pr so it can feed generate_latex_snippet directly.
+    """
+    headers = get_github_headers()
+    if 'Authorization' not in headers:
+        logger.warning("GitHub GraphQL API requires GITHUB_TOKEN, falling back to REST")
+        return get_latest_merged_pr()
+    
+    payload = {
+        'query': GRAPHQL_QUERY,
+        'variables': {
+            'q': f"author:{GITHUB_USERNAME} type:pr is:merged sort:updated-desc",
+            'n': 1
+        }
+    }
+    
+    for attempt in range(1, MAX_RETRIES + 1):
+        try:
+            logger.info(f"Fetching latest PR via GraphQL for: {GITHUB_USERNAME} (attempt {attempt}/{MAX_RETRIES})")
+            response = requests.post(graphql_url, json=payload, headers=headers, timeout=GITHUB_API_TIMEOUT)
+            response.raise_for_status()
+            try:
+                data = response.json()
+            except ValueError as e:
+                # A body that is not JSON will not improve on retry
+                logger.error(f"GraphQL response is not JSON: {e}")
+                return None, None, None
+            
+            if data.get('errors'):
+                messages = '; '.join(err.get('message', str(err)) for err in data['errors'])
+                logger.error(f"GraphQL error: {messages}")
+                return None, None, None
+            
+            pr = parse_graphql_pr(data)
+            if not pr:
+                logger.warning("No merged PRs found for this user")
+                return None, None, None
+            
+            logger.info(f"✓ Found PR: {pr['repo']} - {pr['title']}")
+            return escape_latex_chars(pr['title']), pr['url'], pr['repo']
+        
+        except requests.exceptions.HTTPError as e:
+            logger.error(f"HTTP error {response.status_code}: {e}")
+            if attempt < MAX_RETRIES and response.status_code >= 500:
+                logger.info(f"Retrying in {RETRY_DELAY} seconds...")
+                time.sleep(RETRY_DELAY)
+            else:
+                return None, None, None
+        
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Network error: {e}")
+            if attempt < MAX_RETRIES:
+                logger.info(f"Retrying in {RETRY_DELAY} seconds...")
+                time.sleep(RETRY_DELAY)
+            else:
+                logger.error("Max retries reached due to network errors")
+                return None, None, None
+        
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            logger.error(f"Error parsing GraphQL PR data: {e}")
+            return None, None, None
+    
+    return None, None, None
+
+
+def fetch_latest_pr():
+    """Fetch the latest merged PR with the configured backend (rest or graphql)."""
+    backend = os.environ.get('GITHUB_API_BACKEND', GITHUB_API_BACKEND).lower()
+    if backend == 'graphql':
+        return get_latest_merged_pr_graphql(os.environ.get('GITHUB_GRAPHQL_URL', GITHUB_GRAPHQL_URL))
+    if backend != 'rest':
+        logger.warning(f"Unknown GITHUB_API_BACKEND '{backend}', using rest")
+    return get_latest_merged_pr()
+
+
 def generate_latex_snippet(title, url, repo):
     """Generate LaTeX snippet for the latest PR."""
     if title and url and repo:
@@ -118,14 +244,126 @@ def generate_latex_snippet(title, url, repo):
         return FALLBACK_TEXT
 
 
+def is_good_snippet(content):
+    """True if content is a real PR snippet (not empty or the fallback text)."""
+    return bool(content and content.strip()) and content.strip() != FALLBACK_TEXT.strip()
+
+
+def get_cached_snippet_age(filepath=OUTPUT_FILE):
+    """Age in seconds of the last good snippet at filepath, or None if there is none."""
+    if not os.path.exists(filepath):
+        return None
+    if not is_good_snippet(read_file_safe(filepath)):
+        return None
+    return max(0.0, time.time() - os.path.getmtime(filepath))
+
+
+def write_snippet(latex_snippet, filepath=OUTPUT_FILE):
+    """Write the snippet atomically, so a concurrent LaTeX run never reads a partial file."""
+    tmp_path = f"{filepath}.tmp"
+    if not write_file_safe(tmp_path, latex_snippet + '\n'):
+        return False
+    os.replace(tmp_path, filepath)
+    return True
+
+
+def fetch_within_budget(budget, fetch=fetch_latest_pr):
+    """
+    Run fetch in a daemon thread and wait at most `budget` seconds.
+    
+    Returns:
+        The (title, url, repo) triple, or None if the budget ran out
+    """
+    result = {}
+    worker = threading.Thread(target=lambda: result.update(pr=fetch()), daemon=True)
+    worker.start()
+    worker.join(budget)
+    return result.get('pr')
+
+
+def spawn_background_refresh():
+    """Refresh the snippet in a detached process that outlives this build step."""
+    try:
+        subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), '--refresh'],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+        logger.info("Refreshing latest PR in the background for the next build")
+    except OSError as e:
+        logger.warning(f"Could not start background refresh: {e}")
+
+
+def refresh():
+    """Fetch and write the snippet, never replacing a good snippet with fallback text."""
+    title, url, repo = fetch_latest_pr()
+    if not title:
+        logger.info(f"No PR data, keeping existing {OUTPUT_FILE}")
+        return
+    if write_snippet(generate_latex_snippet(title, url, repo)):
+        logger.info(f"Latest PR: {repo} - {title}")
+
+
+def main_swr(max_staleness, budget):
+    """
+    Stale-while-revalidate: use a fresh enough cached snippet immediately and
+    refresh it in the background; otherwise wait at most `budget` seconds.
+    """
+    age = get_cached_snippet_age()
+    if age is not None and age <= max_staleness:
+        logger.info(f"Using cached {OUTPUT_FILE} ({age:.0f}s old)")
+        spawn_background_refresh()
+        return
+    
+    pr = fetch_within_budget(budget)
+    timed_out = pr is None
+    if timed_out:
+        logger.warning(f"GitHub did not respond within the {budget:g}s latency budget")
+        pr = (None, None, None)
+    
+    # Write this run's result before starting the refresh, so a fast
+    # refresh is never overwritten by the fallback text
+    title, url, repo = pr
+    if not title and age is not None:
+        logger.info(f"Using stale cached {OUTPUT_FILE} ({age:.0f}s old)")
+    elif not write_snippet(generate_latex_snippet(title, url, repo)):
+        logger.error(f"Failed to write {OUTPUT_FILE}")
+        sys.exit(1)
+    elif title:
+        logger.info(f"Latest PR: {repo} - {title}")
+    else:
+        logger.info("Using fallback text (no PR data available)")
+    
+    if timed_out:
+        spawn_background_refresh()
+
+
 def main():
     """Main function."""
+    parser = argparse.ArgumentParser(description="Fetch the latest merged PR as a LaTeX snippet")
+    parser.add_argument('--swr', action='store_true',
+                        help="use a recent cached snippet immediately and refresh it in the background")
+    parser.add_argument('--max-staleness', type=float, default=PR_SNIPPET_MAX_STALENESS,
+                        help="seconds a cached snippet may be used without waiting (with --swr)")
+    parser.add_argument('--latency-budget', type=float, default=PR_FETCH_LATENCY_BUDGET,
+                        help="seconds to wait for GitHub when no fresh snippet exists (with --swr)")
+    parser.add_argument('--refresh', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    configure_logging()
+    enter_project_root()
+    
     if GITHUB_USERNAME == "yourusername":
         logger.warning("Please update GITHUB_USERNAME in scripts/config.py")
         logger.info("Using fallback text instead.")
         title, url, repo = None, None, None
+    elif args.refresh:
+        refresh()
+        return
+    elif args.swr:
+        main_swr(args.max_staleness, args.latency_budget)
+        return
     else:
-        title, url, repo = get_latest_merged_pr()
+        title, url, repo = fetch_latest_pr()
     
     latex_snippet = generate_latex_snippet(title, url, repo)
     
@@ -0,0 +1,503 @@
+#!/usr/bin/env python3
+"""
+Render an HTML (or plain-text) preview of the resume without LaTeX.
+Walks cv.tex and its section inputs once, mapping \\section, \\cventry,
+itemize lists and inline \\textbf/\\textit/\\href to HTML. Other macros
+from style/macros.tex are expanded inline during the same walk. The PDF
+remains the canonical output; this is for fast edit-preview loops and web
+serving.
+"""
+
+import abc
+import argparse
+import html
+import os
+import re
+import sys
+from typing import Optional, List, Dict, Tuple, Type
+
+# Import configuration and utilities
+from utils import (
+    logger, read_file_safe, write_file_safe, find_matching_brace, extract_latex_args,
+    get_macro_table, cventry_fields, Macro, ExpansionBudget, Context, get_default_context, configure_logging
+)
+
+
+# Next token worth looking at: a command, a group, a tie, dashes or a blank line
+SPECIAL_RE = re.compile(r'\\|[{}~]|---?|\n[ \t]*\n')
+COMMAND_RE = re.compile(r'\\(?:([A-Za-z]+)\*?|(.))', re.DOTALL)
+OPTIONAL_ARG_RE = re.compile(r'[ \t]*\[[^\]]*\]')
+EMPTY_GROUP_RE = re.compile(r'\{\}')
+COMMENT_RE = re.compile(r'(?<!\\)%.*')
+WHITESPACE_RE = re.compile(r'\s+')
+
+# User environments (e.g. itemizecompact) expand to these via the macro table
+LIST_ENVIRONMENTS = {'itemize': 'ul', 'enumerate': 'ol'}
+WORD_SYMBOLS = {
+    'textbar': '|', 'textbackslash': '\\', 'textasciitilde': '~',
+    'textasciicircum': '^', 'quad': ' ', 'qquad': ' ', 'ldots': '…', 'LaTeX': 'LaTeX',
+}
+# Commands whose arguments are layout-only and dropped from the preview
+IGNORED_WITH_ARGS = {
+    'vspace': 1, 'hspace': 1, 'pagestyle': 1, 'thispagestyle': 1,
+    'faIcon': 1, 'setlength': 2,
+}
+
+
+class PreviewRenderer(abc.ABC):
+    """
+    Single-pass LaTeX walker shared by the HTML and text renderers.
+    Subclasses supply the output markup for each construct: the abstract
+    hooks below, plus any of the defaulted ones they want to change.
+    """
+
+    wrappers: Dict[str, Tuple[str, str]] = {}
+
+    def __init__(self, root_dir: Optional[str] = None, ctx: Optional[Context] = None):
+        if ctx is None:
+            ctx = Context(root_dir) if root_dir else get_default_context()
+        self.ctx = ctx
+        self.root_dir = ctx.root_dir
+        self.personal_info = ctx.config.PERSONAL_INFO
+        self.macros = get_macro_table(ctx=ctx)
+        # Shared by every macro expanded while rendering, so a recursive
+        # definition stops with one warning instead of a RecursionError
+        self.budget = ExpansionBudget(ctx=self.ctx)
+        self.in_section = False
+        self.in_par = False
+        # Open list environments: [tag, item_open]
+        self.lists: List[List] = []
+
+    # Output hooks -------------------------------------------------------
+
+    def text(self, raw: str) -> str:
+        return WHITESPACE_RE.sub(' ', raw)
+
+    def line_break(self) -> str:
+        return "\n"
+
+    def nbsp(self) -> str:
+        return " "
+
+    def open_par(self) -> str:
+        return ""
+
+    def close_par(self) -> str:
+        return "\n\n"
+
+    @abc.abstractmethod
+    def section(self, title: str) -> str:
+        """Open a \\section; end_section() closes it."""
+
+    def end_section(self) -> str:
+        return ""
+
+    @abc.abstractmethod
+    def cventry(self, title: str, tech: str, link: str, details: str) -> str:
+        """A rendered \\cventry: title, tech list, link and rendered body."""
+
+    @abc.abstractmethod
+    def href(self, url: str, label: str) -> str:
+        """A link."""
+
+    def hfill(self) -> str:
+        return " "
+
+    @abc.abstractmethod
+    def list_start(self, tag: str) -> str:
+        """Open a list; tag is the HTML list tag (ul/ol)."""
+
+    @abc.abstractmethod
+    def list_end(self, tag: str) -> str:
+        """Close a list opened with list_start()."""
+
+    @abc.abstractmethod
+    def item_start(self, tag: str) -> str:
+        """Open an \\item of the innermost list."""
+
+    def item_end(self) -> str:
+        return ""
+
+    @abc.abstractmethod
+    def header(self) -> str:
+        """Name and contact line from the context's PERSONAL_INFO."""
+
+    def document(self, body: str) -> str:
+        return body
+
+    # State helpers ------------------------------------------------------
+
+    def _para_end(self) -> str:
+        if self.in_par:
+            self.in_par = False
+            return self.close_par()
+        return ""
+
+    def _item_end(self) -> str:
+        if self.lists and self.lists[-1][1]:
+            self.lists[-1][1] = False
+            return self.item_end()
+        return ""
+
+    # Walker -------------------------------------------------------------
+
+    def render(self, text: str) -> str:
+        """Render a LaTeX fragment, updating block state as it goes."""
+        out: List[str] = []
+        pos = 0
+        while True:
+            match = SPECIAL_RE.search(text, pos)
+            if not match:
+                out.append(self.text(text[pos:]))
+                break
+            out.append(self.text(text[pos:match.start()]))
+            token = match.group()
+
+            if token == '\\':
+                pos = self._command(text, match.start(), out)
+            elif token == '{':
+                end = find_matching_brace(text, match.end())
+                if end == -1:
+                    pos = match.end()
+                    continue
+                out.append(self.render(text[match.end():end - 1]))
+                pos = end
+            elif token == '}':
+                pos = match.end()
+            elif token == '~':
+                out.append(self.nbsp())
+                pos = match.end()
+            elif token.startswith('--'):
+                out.append('—' if token == '---' else '–')
+                pos = match.end()
+            else:
+                out.append(self._para_end())
+                pos = match.end()
+        return "".join(out)
+
+    def _args(self, text: str, pos: int, count: int) -> Tuple[List[str], int]:
+        args, end = extract_latex_args(text, pos, count)
+        if args is None:
+            return [''] * count, pos
+        return args, end
+
+    def _macro_args(self, text: str, pos: int, macro: Macro) -> Tuple[Optional[List[str]], int]:
+        args, end, error = macro.read_args(text, pos)
+        if error is not None:
+            self.ctx.logger.warning("\\%s: %s", macro.name, error[1])
+            return None, pos
+        return args, end
+
+    def _command(self, text: str, start: int, out: List[str]) -> int:
+        """Render the command at text[start] into out; return the position after it."""
+        match = COMMAND_RE.match(text, start)
+        if not match:
+            return start + 1
+        pos = match.end()
+
+        symbol = match.group(2)
+        if symbol is not None:
+            if symbol == '\\':
+                opt = OPTIONAL_ARG_RE.match(text, pos)
+                out.append(self.line_break())
+                return opt.end() if opt else pos
+            out.append(' ' if symbol in ',;: \n' else self.text(symbol))
+            return pos
+
+        name = match.group(1)
+        if name in self.wrappers:
+            args, pos = self._args(text, pos, 1)
+            before, after = self.wrappers[name]
+            out.append(before + self.render(args[0]) + after)
+        elif name == 'href':
+            (url, label), pos = self._args(text, pos, 2)
+            out.append(self.href(url, self.render(label)))
+        elif name == 'url':
+            (url,), pos = self._args(text, pos, 1)
+            out.append(self.href(url, self.text(url)))
+        elif name == 'section':
+            (title,), pos = self._args(text, pos, 1)
+            out.append(self._para_end())
+            if self.in_section:
+                out.append(self.end_section())
+            self.in_section = True
+            out.append(self.section(self.render(title)))
+        elif name == 'cventry' and name in self.macros.commands:
+            args, pos = self._macro_args(text, pos, self.macros.commands[name])
+            if args is None:
+                return pos
+            out.append(self._para_end())
+            fields = cventry_fields(self.macros.commands[name], args, self.ctx)
+            out.append(self.cventry(self.render(fields['title']), self.render(fields['tech']),
+                                    self.render(fields['link']), self.render(fields['content']) + self._para_end()))
+        elif name == 'begin':
+            (env,), pos = self._args(text, pos, 1)
+            if env in LIST_ENVIRONMENTS:
+                opt = OPTIONAL_ARG_RE.match(text, pos)
+                pos = opt.end() if opt else pos
+                out.append(self._para_end())
+                tag = LIST_ENVIRONMENTS[env]
+                self.lists.append([tag, False])
+                out.append(self.list_start(tag))
+            elif env in self.macros.environments:
+                args, pos = self._macro_args(text, pos, self.macros.environments[env])
+                if args is not None:
+                    out.append(self._render_expansion(env, self.macros.environments[env].expand(args)))
+        elif name == 'end':
+            (env,), pos = self._args(text, pos, 1)
+            if env in LIST_ENVIRONMENTS and self.lists:
+                out.append(self._para_end() + self._item_end())
+                out.append(self.list_end(self.lists.pop()[0]))
+            elif env in self.macros.environments:
+                out.append(self._render_expansion(env, self.macros.environments[env].expand_end()))
+        elif name == 'item':
+            opt = OPTIONAL_ARG_RE.match(text, pos)
+            pos = opt.end() if opt else pos
+            if self.lists:
+                out.append(self._para_end() + self._item_end())
+                self.lists[-1][1] = True
+                out.append(self.item_start(self.lists[-1][0]))
+        elif name == 'input':
+            (path,), pos = self._args(text, pos, 1)
+            out.append(self.render(self._read_input(path)))
+        elif name == 'noindent':
+            if not self.in_par and not self.lists:
+                self.in_par = True
+                out.append(self.open_par())
+        elif name == 'par':
+            out.append(self._para_end())
+        elif name == 'hfill':
+            out.append(self.hfill())
+        elif name == 'makeheader':
+            out.append(self.header())
+        elif name in WORD_SYMBOLS:
+            out.append(self.text(WORD_SYMBOLS[name]))
+            group = EMPTY_GROUP_RE.match(text, pos)
+            pos = group.end() if group else pos
+        elif name in IGNORED_WITH_ARGS:
+            _, pos = self._args(text, pos, IGNORED_WITH_ARGS[name])
+        elif name in self.macros.commands:
+            # Any other user macro: render its expansion in place
+            macro = self.macros.commands[name]
+            args, pos = self._macro_args(text, pos, macro)
+            if args is not None:
+                out.append(self._render_expansion(name, macro.expand(args)))
+        # Anything else: drop the command name and render its arguments as text
+        return pos
+
+    def _render_expansion(self, name: str, body: str) -> str:
+        """Render a user macro's expansion; nothing once the budget is spent."""
+        if not self.budget.take(name):
+            return ""
+        self.budget.depth += 1
+        try:
+            return self.render(body)
+        finally:
+            self.budget.depth -= 1
+
+    def _read_input(self, path: str) -> str:
+        if not path.endswith('.tex'):
+            path += '.tex'
+        content = read_file_safe(self.ctx.path(path), ctx=self.ctx)
+        return COMMENT_RE.sub('', content) if content else ""
+
+    def render_document(self, tex_file: Optional[str] = None) -> Optional[str]:
+        """Render the body of a root document (\\begin{document} ... \\end{document})."""
+        content = read_file_safe(self.ctx.path(tex_file or self.ctx.config.MAIN_TEX_FILE), ctx=self.ctx)
+        if content is None:
+            return None
+        content = COMMENT_RE.sub('', content)
+        start = content.find(r'\begin{document}')
+        end = content.find(r'\end{document}')
+        body = content[start + len(r'\begin{document}'):end if end != -1 else None] if start != -1 else content
+
+        self.budget = ExpansionBudget(ctx=self.ctx)
+        rendered = self.render(body) + self._para_end()
+        if self.in_section:
+            rendered += self.end_section()
+            self.in_section = False
+        return self.document(rendered)
+
+
+class HtmlRenderer(PreviewRenderer):
+    """Render the resume as a standalone HTML page."""
+
+    wrappers = {
+        'textbf': ('<strong>', '</strong>'), 'textit': ('<em>', '</em>'),
+        'emph': ('<em>', '</em>'), 'underline': ('<u>', '</u>'),
+        'texttt': ('<code>', '</code>'), 'textsc': ('<span class="sc">', '</span>'),
+    }
+
+    def text(self, raw: str) -> str:
+        return html.escape(WHITESPACE_RE.sub(' ', raw), quote=False)
+
+    def line_break(self) -> str:
+        return "<br>\n"
+
+    def nbsp(self) -> str:
+        return "&nbsp;"
+
+    def open_par(self) -> str:
+        return "<p>"
+
+    def close_par(self) -> str:
+        return "</p>\n"
+
+    def section(self, title: str) -> str:
+        return f'<section>\n<h2>{title}</h2>\n'
+
+    def end_section(self) -> str:
+        return "</section>\n"
+
+    def cventry(self, title: str, tech: str, link: str, details: str) -> str:
+        return (
+            f'<div class="cventry">\n<div class="cventry-head"><strong>{title}</strong> | '
+            f'<em>{tech}</em><span class="cventry-link">{link}</span></div>\n{details}</div>\n'
+        )
+
+    def href(self, url: str, label: str) -> str:
+        return f'<a href="{html.escape(url.strip())}">{label}</a>'
+
+    def hfill(self) -> str:
+        return '<span class="hfill"></span>'
+
+    def list_start(self, tag: str) -> str:
+        return f"<{tag}>\n"
+
+    def list_end(self, tag: str) -> str:
+        return f"</{tag}>\n"
+
+    def item_start(self, tag: str) -> str:
+        return "<li>"
+
+    def item_end(self) -> str:
+        return "</li>\n"
+
+    def header(self) -> str:
+        links = [
+            self.href(self.personal_info[key], label)
+            for key, label in (('linkedin', 'LinkedIn'), ('github', 'GitHub'), ('website', 'Portfolio'))
+            if self.personal_info.get(key)
+        ]
+        if self.personal_info.get('email'):
+            links.append(self.href(f"mailto:{self.personal_info['email']}", 'Email'))
+        return (
+            f'<header>\n<h1>{html.escape(self.personal_info["name"])}</h1>\n'
+            f'<p class="contact">{" | ".join(links)}</p>\n</header>\n'
+        )
+
+    def document(self, body: str) -> str:
+        name = html.escape(self.personal_info['name'])
+        return HTML_PAGE.format(title=f"{name} - Resume", body=body)
+
+
+class TextRenderer(PreviewRenderer):
+    """Render the resume as plain text."""
+
+    wrappers = {name: ('', '') for name in ('textbf', 'textit', 'emph', 'underline', 'texttt', 'textsc')}
+
+    def section(self, title: str) -> str:
+        title = title.strip().upper()
+        return f"\n{title}\n{'=' * len(title)}\n"
+
+    def cventry(self, title: str, tech: str, link: str, details: str) -> str:
+        head = " | ".join(part.strip() for part in (title, tech, link) if part.strip())
+        return f"\n{head}\n{details}"
+
+    def hfill(self) -> str:
+        return " | "
+
+    def href(self, url: str, label: str) -> str:
+        url = url.strip()
+        label = label.strip()
+        return label if label == url or url.startswith('mailto:') else f"{label} <{url}>"
+
+    def list_start(self, tag: str) -> str:
+        return "\n"
+
+    def list_end(self, tag: str) -> str:
+        return "\n"
+
+    def item_start(self, tag: str) -> str:
+        return "\n- "
+
+    def header(self) -> str:
+        contacts = [self.personal_info.get(key) for key in ('email', 'linkedin', 'github', 'website')]
+        return f"{self.personal_info['name']}\n{' | '.join(c for c in contacts if c)}\n"
+
+    def document(self, body: str) -> str:
+        # Normalise the spacing produced by adjacent blocks
+        lines = [re.sub(r' {2,}', ' ', line).strip() for line in body.splitlines()]
+        return re.sub(r'\n{3,}', '\n\n', "\n".join(lines)).strip() + "\n"
+
+
+HTML_PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<style>
+body {{ max-width: 52rem; margin: 2rem auto; padding: 0 1rem; font: 15px/1.45 "Latin Modern Roman", Georgia, serif; color: #111; }}
+header {{ text-align: center; }}
+h1 {{ margin: 0 0 .3rem; font-size: 2.2rem; }}
+h2 {{ font-variant: small-caps; font-size: 1.35rem; border-bottom: 1px solid #111; margin: 1.1rem 0 .5rem; }}
+a {{ color: blue; text-decoration: none; }}
+p {{ margin: .2rem 0; }}
+ul, ol {{ margin: .15rem 0 .5rem; padding-left: 1.2rem; }}
+li {{ margin: 1px 0; }}
+.cventry {{ margin-bottom: .6rem; }}
+.cventry-link, .hfill + * {{ float: right; }}
+.sc {{ font-variant: small-caps; }}
+</style>
+</head>
+<body>
+{body}</body>
+</html>
+"""
+
+
+def generate_preview(html_file: Optional[str] = None, text_file: Optional[str] = None,
+                     root_dir: Optional[str] = None, ctx: Optional[Context] = None,
+                     text: bool = False) -> bool:
+    """
+    Write the HTML preview and, if text_file is given or text is set, the
+    plain-text one. Returns success.
+    Default paths come from the context's OUTPUT_FILES; relative output
+    paths resolve against the tree's root directory.
+    """
+    if ctx is None:
+        ctx = Context(root_dir) if root_dir else get_default_context()
+    outputs: List[Tuple[Type[PreviewRenderer], str]] = [
+        (HtmlRenderer, html_file or ctx.config.OUTPUT_FILES['html'])
+    ]
+    if text_file or text:
+        outputs.append((TextRenderer, text_file or ctx.config.OUTPUT_FILES['text']))
+    ok = True
+    for renderer_class, output_file in outputs:
+        output_file = ctx.path(output_file)
+        rendered = renderer_class(ctx=ctx).render_document()
+        ok = rendered is not None and write_file_safe(output_file, rendered, ctx=ctx) and ok
+    return ok
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Render an HTML/plain-text resume preview")
+    parser.add_argument("--root", help="resume tree to render (default: this repository)")
+    parser.add_argument("--html", help="HTML output file (default: <root>/docs/index.html)")
+    parser.add_argument("--text", nargs="?", const="", default=None,
+                        help="also write plain text (default path: <root>/docs/resume.txt)")
+    args = parser.parse_args()
+    configure_logging()
+
+    # Paths given on the command line are relative to the working directory
+    html_file = os.path.abspath(args.html) if args.html else None
+    text_file = os.path.abspath(args.text) if args.text else None
+    if not generate_preview(html_file, text_file, args.root, text=args.text is not None):
+        logger.error("Failed to render preview")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
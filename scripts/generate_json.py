@@ -3,47 +3,62 @@
 Generate JSON Resume from LaTeX sections.
 Follows JSON Resume Schema: https://jsonresume.org/schema/
 Parses data from LaTeX files and config.
+
+Every function takes an optional utils.Context (tree root, config,
+logger); without one they use this repository and config.py.
 """
 
+import argparse
 import json
-import os
+import sys
+from typing import Any, Dict
 
-# Import configuration and utilities
-from config import PERSONAL_INFO, OUTPUT_FILES, SECTIONS_DIR, OPEN_SOURCE_CONTRIBUTIONS
+# Import utilities
 from utils import (
-    logger, read_file_safe, write_file_safe,
-    parse_cventry, clean_latex_to_plain, get_summary_text
+    read_file_safe, write_file_safe, parse_cventry, clean_latex_to_plain,
+    get_summary_text, get_macro_table, get_default_context, Context, configure_logging,
+    parse_skill_lines
 )
+from validate_resume import validate_resume
+
+# Schema-formatted fields (ISO 8601 dates, URIs) that are omitted rather
+# than written as "" when unknown, since "" is not a valid date or URI
+OPTIONAL_FORMATTED_FIELDS = ("url", "startDate", "endDate", "date", "releaseDate")
 
-OUTPUT_FILE = OUTPUT_FILES['json']
+# Sections whose JSON Resume data comes from config/fixed data rather than
+# their .tex file, so a variant override cannot reach the JSON output
+JSON_FIXED_SECTIONS = ("education", "open_source")
 
 
-def parse_projects_from_latex():
-    """Parse project data from projects.tex file."""
-    filepath = os.path.join(SECTIONS_DIR, "projects.tex")
-    content = read_file_safe(filepath)
+def parse_projects_from_latex(filepath=None, ctx=None):
+    """Parse project data from projects.tex (or the given section file)."""
+    ctx = ctx or get_default_context()
+    filepath = filepath or ctx.path(ctx.config.SECTIONS_DIR, "projects.tex")
+    content = read_file_safe(filepath, ctx=ctx)
     
     if not content:
         return []
     
-    entries = parse_cventry(content)
+    macros = get_macro_table(ctx=ctx)
+    entries = parse_cventry(content, filepath, macros, ctx)
     projects = []
     
     for entry in entries:
         # Extract bullet points from content
         highlights = []
-        content_plain = clean_latex_to_plain(entry['content'])
+        content_plain = clean_latex_to_plain(entry['content'], macros, ctx)
         for line in content_plain.split('\n'):
             line = line.strip()
             if line and not line.startswith('\\'):
                 highlights.append(line)
         
         # Extract tech keywords
-        tech_keywords = [t.strip() for t in entry['tech'].split(',')]
+        tech_keywords = [t.strip() for t in clean_latex_to_plain(entry['tech'], macros, ctx).split(',')]
+        title = clean_latex_to_plain(entry['title'], macros, ctx)
         
         project = {
-            "name": entry['title'],
-            "description": highlights[0] if highlights else entry['title'],
+            "name": title,
+            "description": highlights[0] if highlights else title,
             "highlights": highlights,
             "keywords": tech_keywords,
             "startDate": "",
@@ -58,59 +73,113 @@ def parse_projects_from_latex():
     return projects
 
 
-def parse_open_source_from_config():
+def parse_skills_from_latex(filepath=None, ctx=None):
+    """Parse skill groups from skills.tex (or the given section file)."""
+    ctx = ctx or get_default_context()
+    filepath = filepath or ctx.path(ctx.config.SECTIONS_DIR, "skills.tex")
+    content = read_file_safe(filepath, ctx=ctx)
+    
+    if not content:
+        return []
+    
+    macros = get_macro_table(ctx=ctx)
+    skills = []
+    for label, items in parse_skill_lines(content):
+        keywords = [clean_latex_to_plain(item, macros, ctx) for item in items]
+        skills.append({
+            "name": clean_latex_to_plain(label, macros, ctx).rstrip(':').strip(),
+            "level": "",
+            "keywords": [kw for kw in keywords if kw]
+        })
+    
+    return skills
+
+
+def parse_open_source_from_config(ctx=None):
     """Get open source contributions from config.py."""
     # Return structured data from config for JSON Resume format
     # Note: The actual LaTeX file uses a different format (paragraph + latest PR)
     # This structured data is specifically for JSON Resume schema compliance
-    return OPEN_SOURCE_CONTRIBUTIONS
+    return (ctx or get_default_context()).config.OPEN_SOURCE_CONTRIBUTIONS
 
 
-def generate_json_resume():
-    """Generate JSON Resume file."""
+def drop_empty_fields(data: Any) -> Any:
+    """Recursively drop empty OPTIONAL_FORMATTED_FIELDS values (returns copies)."""
+    if isinstance(data, dict):
+        return {
+            key: drop_empty_fields(value) for key, value in data.items()
+            if not (key in OPTIONAL_FORMATTED_FIELDS and value == "")
+        }
+    if isinstance(data, list):
+        return [drop_empty_fields(item) for item in data]
+    return data
+
+
+def get_section_file(section, overrides=None, ctx=None):
+    """Path of a section's .tex file, honouring per-variant overrides."""
+    if overrides and section in overrides:
+        return overrides[section]
+    ctx = ctx or get_default_context()
+    return ctx.path(ctx.config.SECTIONS_DIR, f"{section}.tex")
+
+
+def build_resume_data(sections=None, overrides=None, ctx=None) -> Dict[str, Any]:
+    """
+    Build the JSON Resume document.
     
-    logger.info("Generating JSON resume...")
+    Args:
+        sections: Section names to include (default: all); excluded
+            sections are left empty in the output
+        overrides: Optional mapping of section name -> replacement .tex file
+        ctx: Tree, config and logger to use (default: this repository)
+    """
+    ctx = ctx or get_default_context()
+    personal_info = ctx.config.PERSONAL_INFO
+    
+    def included(section):
+        return sections is None or section in sections
     
     # Parse projects from LaTeX
-    projects = parse_projects_from_latex()
-    volunteer = parse_open_source_from_config()
+    projects = parse_projects_from_latex(get_section_file("projects", overrides, ctx), ctx) if included("projects") else []
+    volunteer = parse_open_source_from_config(ctx) if included("open_source") else []
+    skills = parse_skills_from_latex(get_section_file("skills", overrides, ctx), ctx) if included("skills") else []
     
     # Get summary from summary.tex
-    summary_text = get_summary_text()
+    summary_text = get_summary_text(get_section_file("summary", overrides, ctx), ctx) if included("summary") else ""
     
     # Build resume data
     resume_data = {
         "basics": {
-            "name": PERSONAL_INFO['name'],
-            "label": PERSONAL_INFO['title'],
+            "name": personal_info['name'],
+            "label": personal_info['title'],
             "image": "",
-            "email": PERSONAL_INFO['email'],
-            "phone": PERSONAL_INFO.get('phone', ''),
-            "url": PERSONAL_INFO['website'],
+            "email": personal_info['email'],
+            "phone": personal_info.get('phone', ''),
+            "url": personal_info['website'],
             "summary": summary_text,
             "location": {
                 "address": "",
                 "postalCode": "",
-                "city": PERSONAL_INFO['location'].get('city', ''),
-                "countryCode": PERSONAL_INFO['location'].get('country_code', 'IN'),
-                "region": PERSONAL_INFO['location'].get('region', '')
+                "city": personal_info['location'].get('city', ''),
+                "countryCode": personal_info['location'].get('country_code', 'IN'),
+                "region": personal_info['location'].get('region', '')
             },
             "profiles": [
                 {
                     "network": "LinkedIn",
-                    "username": PERSONAL_INFO['linkedin'].split('/')[-1],
-                    "url": PERSONAL_INFO['linkedin']
+                    "username": personal_info['linkedin'].split('/')[-1],
+                    "url": personal_info['linkedin']
                 },
                 {
                     "network": "GitHub",
-                    "username": PERSONAL_INFO['github'].split('/')[-1],
-                    "url": PERSONAL_INFO['github']
+                    "username": personal_info['github'].split('/')[-1],
+                    "url": personal_info['github']
                 }
             ]
         },
         "work": [],
         "volunteer": volunteer,
-        "education": [
+        "education": [] if not included("education") else [
             {
                 "institution": "Maharshi Dayanand University",
                 "url": "",
@@ -131,28 +200,7 @@ def generate_json_resume():
         "awards": [],
         "certificates": [],
         "publications": [],
-        "skills": [
-            {
-                "name": "Languages",
-                "level": "",
-                "keywords": ["Java", "C", "C++", "Python", "SQL", "JavaScript"]
-            },
-            {
-                "name": "Frameworks & Libraries",
-                "level": "",
-                "keywords": ["Spring Boot", "Spring MVC", "Spring Data JPA", "Spring Security", "Hibernate", "Maven"]
-            },
-            {
-                "name": "Databases",
-                "level": "",
-                "keywords": ["MySQL", "PostgreSQL", "MongoDB"]
-            },
-            {
-                "name": "Tools & Technologies",
-                "level": "",
-                "keywords": ["Git", "Docker", "Postman", "Linux", "Swagger", "Firebase"]
-            }
-        ],
+        "skills": skills,
         "languages": [
             {
                 "language": "English",
@@ -164,19 +212,49 @@ def generate_json_resume():
         "projects": projects
     }
     
+    return drop_empty_fields(resume_data)
+
+
+def generate_json_resume(output_file=None, sections=None, overrides=None, ctx=None):
+    """Generate JSON Resume file (default: the context's docs/resume.json)."""
+    ctx = ctx or get_default_context()
+    logger = ctx.logger
+    output_file = output_file or ctx.path(ctx.config.OUTPUT_FILES['json'])
+    
+    logger.info("Generating JSON resume...")
+    
+    resume_data = build_resume_data(sections, overrides, ctx)
+    
+    violations = validate_resume(resume_data)
+    for path, message in violations:
+        logger.warning("Schema violation at %s: %s", path, message)
+    
     # Write JSON file
-    success = write_file_safe(OUTPUT_FILE, json.dumps(resume_data, indent=2, ensure_ascii=False))
+    success = write_file_safe(output_file, json.dumps(resume_data, indent=2, ensure_ascii=False), ctx=ctx)
     
     if success:
-        logger.info(f"JSON resume generated successfully")
-        logger.info(f"  Projects parsed: {len(projects)}")
-        logger.info(f"  Validate at: https://jsonresume.org/schema/")
+        logger.info("JSON resume generated successfully")
+        logger.info("  Projects parsed: %d", len(resume_data['projects']))
+        logger.info("  Schema: %s", f"{len(violations)} violations" if violations else "valid")
     else:
         logger.error("Failed to generate JSON resume")
         return None
     
-    return OUTPUT_FILE
+    return output_file
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Generate a JSON Resume from the LaTeX sections")
+    parser.add_argument("--root", help="resume tree to read (default: this repository)")
+    parser.add_argument("--output", help="output file (default: <root>/docs/resume.json)")
+    args = parser.parse_args()
+    configure_logging()
+
+    ctx = Context(args.root) if args.root else get_default_context()
+    if not generate_json_resume(args.output, ctx=ctx):
+        sys.exit(1)
 
 
 if __name__ == "__main__":
-    generate_json_resume()
+    main()
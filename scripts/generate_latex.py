@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Generate LaTeX sections from JSON Resume documents.
+The reverse of generate_json.py: renders projects.tex (as \\cventry blocks,
+see style/macros.tex), skills.tex, education.tex and summary.tex for one
+document or an NDJSON stream of many, one output tree per document.
+
+Long batches can keep an append-only progress journal (--journal): each
+finished tree is recorded with a hash of its input document, so a restarted
+run skips completed work. --shard i/N splits the documents across machines
+with no coordination beyond the shared input.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from typing import Optional, List, Dict, Any, Tuple
+
+# Import configuration and utilities
+from config import LATEX_OUTPUT_DIR
+from utils import (
+    logger, write_file_safe, ensure_dir_exists, escape_latex_many, log_context, iter_documents,
+    add_logging_arguments, configure_logging_from_args, get_default_context
+)
+
+# Templates are bound once at import time and reused for every document
+PROJECTS_HEADER = "% Projects section\n\\section{Projects}\n"
+CVENTRY = "\n\\cventry{{{title}}}{{{tech}}}{{{link}}}{{\n{details}}}\n".format
+HREF = "\\href{{{url}}}{{{text}}}".format
+ITEMIZE = "\\begin{{itemizecompact}}\n{items}\\end{{itemizecompact}}\n".format
+ITEM = "  \\item {0}\n".format
+
+SKILLS_HEADER = "% Skills section\n\\section{Skills}\n\n"
+SKILL_LINE = "\\noindent\\textbf{{{name}:}} {keywords}".format
+SKILL_SEPARATOR = "\\\\[2pt]\n"
+
+EDUCATION_HEADER = "% Education section\n\\section{Education}\n"
+EDUCATION_ENTRY = (
+    "\n\\noindent\\textbf{{{institution}}} \\hfill \\textit{{{dates}}}\\\\\n"
+    "\\textit{{{degree}}} \\hfill \\textbf{{{score}}}\n"
+).format
+COURSES_ITEM = "\\textbf{{Academic Focus:}} {0}".format
+
+SUMMARY = "% Summary section\n\\section{{Summary}}\n\\noindent {0}\n".format
+EMPTY_SECTION = "% {0} section (no entries)\n".format
+
+
+def _escape_url(url: str) -> str:
+    """Escape the characters \\href cannot take verbatim."""
+    return url.replace('\\', '').replace('%', r'\%').replace('#', r'\#')
+
+
+def render_projects(projects: List[Dict[str, Any]]) -> str:
+    """Render JSON Resume projects as \\cventry blocks."""
+    if not projects:
+        return EMPTY_SECTION("Projects")
+
+    parts = [PROJECTS_HEADER]
+    for project in projects:
+        highlights = [str(h) for h in project.get('highlights') or []]
+        keywords = [str(k) for k in project.get('keywords') or []]
+        # One translate call per project covers every text field
+        title, tech, *items = escape_latex_many(
+            [str(project.get('name', '')), ", ".join(keywords)] + highlights
+        )
+
+        url = project.get('url') or ""
+        link = HREF(url=_escape_url(url), text="GitHub" if "github.com" in url else "Link") if url else ""
+        details = ITEMIZE(items="".join(ITEM(item) for item in items)) if items else ""
+        parts.append(CVENTRY(title=title, tech=tech, link=link, details=details))
+    return "".join(parts)
+
+
+def render_skills(skills: List[Dict[str, Any]]) -> str:
+    """Render JSON Resume skills as one bold-labelled line per group."""
+    if not skills:
+        return EMPTY_SECTION("Skills")
+
+    lines = []
+    for skill in skills:
+        name, keywords = escape_latex_many(
+            [str(skill.get('name', '')), ", ".join(str(k) for k in skill.get('keywords') or [])]
+        )
+        lines.append(SKILL_LINE(name=name, keywords=keywords))
+    return SKILLS_HEADER + SKILL_SEPARATOR.join(lines) + "\n"
+
+
+def render_education(education: List[Dict[str, Any]]) -> str:
+    """Render JSON Resume education entries."""
+    if not education:
+        return EMPTY_SECTION("Education")
+
+    parts = [EDUCATION_HEADER]
+    for entry in education:
+        institution, study_type, area, start, end, score, courses = escape_latex_many([
+            str(entry.get(key) or '') for key in
+            ('institution', 'studyType', 'area', 'startDate', 'endDate', 'score')
+        ] + [", ".join(str(c) for c in entry.get('courses') or [])])
+
+        dates = " - ".join(d for d in (start, end) if d)
+        degree = " in ".join(d for d in (study_type, area) if d)
+        parts.append(EDUCATION_ENTRY(institution=institution, dates=dates, degree=degree, score=score))
+        if courses:
+            parts.append(ITEMIZE(items=ITEM(COURSES_ITEM(courses))))
+    return "".join(parts)
+
+
+def render_summary(basics: Dict[str, Any]) -> str:
+    """Render basics.summary as the Summary section."""
+    summary = str(basics.get('summary') or '').strip()
+    if not summary:
+        return EMPTY_SECTION("Summary")
+    return SUMMARY(escape_latex_many([summary])[0])
+
+
+def render_sections(resume: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Render all supported sections of one JSON Resume document.
+
+    Returns:
+        Dict of section name (summary, projects, skills, education) -> LaTeX
+    """
+    return {
+        "summary": render_summary(resume.get('basics') or {}),
+        "projects": render_projects(resume.get('projects') or []),
+        "skills": render_skills(resume.get('skills') or []),
+        "education": render_education(resume.get('education') or []),
+    }
+
+
+def slugify(text: str) -> str:
+    """Lowercase, dash-separated identifier for output directories."""
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+
+
+def get_resume_id(resume: Dict[str, Any], index: int, seen: Dict[str, int]) -> str:
+    """Unique tree id for a document: slug of basics.name, else resume-<index>."""
+    base = slugify(str((resume.get('basics') or {}).get('name') or '')) or f"resume-{index}"
+    seen[base] = seen.get(base, 0) + 1
+    return base if seen[base] == 1 else f"{base}-{seen[base]}"
+
+
+def write_tree(resume_id: str, sections: Dict[str, str], output_dir: str) -> bool:
+    """Write rendered sections to <output_dir>/<resume_id>/sections/."""
+    tree_dir = os.path.join(output_dir, resume_id, "sections")
+    return all(
+        write_file_safe(os.path.join(tree_dir, f"{name}.tex"), content)
+        for name, content in sections.items()
+    )
+
+
+def document_hash(resume: Dict[str, Any]) -> str:
+    """Content hash of a document, independent of key order and formatting."""
+    canonical = json.dumps(resume, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """Parse an `i/N` shard spec (1 <= i <= N) into (i, N)."""
+    try:
+        index, total = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"shard must look like i/N, got {value!r}")
+    if not 1 <= index <= total:
+        raise argparse.ArgumentTypeError(f"shard index must be between 1 and {total}, got {index}")
+    return index, total
+
+
+class ProgressJournal:
+    """
+    Append-only record of completed trees: one JSON line per tree with its
+    id and input hash. Lines are flushed as they are written, so after an
+    interruption at most the tree being written is redone; a torn last
+    line is ignored and cut off on load.
+    """
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self.completed: Dict[str, str] = {}
+        if os.path.exists(filepath):
+            complete = 0  # bytes up to the end of the last whole line
+            with open(filepath, 'rb') as f:
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        break
+                    complete += len(line)
+                    try:
+                        entry = json.loads(line)
+                        self.completed[entry['id']] = entry['hash']
+                    except (json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError):
+                        continue
+                torn = f.seek(0, os.SEEK_END) != complete
+            if torn:
+                # Drop the torn tail so the next record starts on its own line
+                with open(filepath, 'r+b') as f:
+                    f.truncate(complete)
+        ensure_dir_exists(filepath)
+        self._file = open(filepath, 'a', encoding='utf-8')
+
+    def is_done(self, resume_id: str, digest: str) -> bool:
+        return self.completed.get(resume_id) == digest
+
+    def record(self, resume_id: str, digest: str) -> None:
+        self._file.write(json.dumps({'id': resume_id, 'hash': digest}) + '\n')
+        self._file.flush()
+        self.completed[resume_id] = digest
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> 'ProgressJournal':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def generate_latex(source: str, output_dir: Optional[str] = None,
+                   ndjson: Optional[bool] = None, journal_file: Optional[str] = None,
+                   shard: Tuple[int, int] = (1, 1)) -> Dict[str, int]:
+    """
+    Render LaTeX section trees for every document in source.
+
+    Args:
+        source: JSON / NDJSON file path, or '-' for stdin
+        output_dir: Root directory receiving one tree per document
+            (default: LATEX_OUTPUT_DIR in the repository)
+        ndjson: Treat source as NDJSON (default: by .ndjson/.jsonl extension)
+        journal_file: Progress journal; trees it records with an unchanged
+            input hash (and still on disk) are skipped
+        shard: (i, N) to only render every N-th document, starting with
+            the i-th. Tree ids are assigned over the whole input, so they
+            do not depend on the sharding.
+
+    Returns:
+        Counts of generated, skipped and failed documents
+    """
+    if ndjson is None:
+        ndjson = source.endswith(('.ndjson', '.jsonl'))
+    output_dir = output_dir or get_default_context().path(LATEX_OUTPUT_DIR)
+    shard_index, shard_count = shard
+
+    counts = {"generated": 0, "skipped": 0, "failed": 0}
+    seen: Dict[str, int] = {}
+    journal = ProgressJournal(journal_file) if journal_file else None
+    try:
+        for ordinal, (index, resume) in enumerate(iter_documents(source, ndjson)):
+            resume_id = get_resume_id(resume, index, seen) if isinstance(resume, dict) else None
+            if ordinal % shard_count != shard_index - 1:
+                continue
+            if resume is None or resume_id is None:
+                counts["failed"] += 1
+                continue
+
+            digest = document_hash(resume) if journal else ""
+            if journal and journal.is_done(resume_id, digest) and os.path.isdir(os.path.join(output_dir, resume_id)):
+                counts["skipped"] += 1
+                continue
+
+            with log_context(tree=resume_id, line=index):
+                if write_tree(resume_id, render_sections(resume), output_dir):
+                    counts["generated"] += 1
+                    if journal:
+                        journal.record(resume_id, digest)
+                else:
+                    counts["failed"] += 1
+    finally:
+        if journal:
+            journal.close()
+
+    logger.info("Generated %d LaTeX trees (%d already done, %d failed) in %s",
+                counts['generated'], counts['skipped'], counts['failed'], output_dir)
+    return counts
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Generate LaTeX sections from JSON Resume documents")
+    parser.add_argument("source", help="JSON Resume file, NDJSON stream, or - for stdin")
+    parser.add_argument("--output-dir", help=f"default: <repository>/{LATEX_OUTPUT_DIR}")
+    parser.add_argument("--ndjson", action="store_true", default=None,
+                        help="read one document per line (default for .ndjson/.jsonl)")
+    parser.add_argument("--journal", help="progress journal; completed trees are skipped on restart")
+    parser.add_argument("--shard", type=parse_shard, default=(1, 1), metavar="i/N",
+                        help="render only shard i of N (1-based)")
+    add_logging_arguments(parser)
+    args = parser.parse_args()
+    configure_logging_from_args(args)
+
+    try:
+        counts = generate_latex(args.source, args.output_dir, args.ndjson, args.journal, args.shard)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.error(f"Could not read {args.source}: {e}")
+        sys.exit(1)
+    if counts["failed"] or not (counts["generated"] or counts["skipped"]):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
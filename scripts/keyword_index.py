@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+Inverted keyword index over resume trees.
+Indexes the tech lists of \\cventry projects and the skills section of
+every tree (a directory containing sections/), persists it in SQLite -
+postings included, so a query reads only the postings of its keywords -
+and answers AND/OR keyword queries. Trees are re-indexed incrementally: only
+those whose section files changed since the last build are re-parsed, optionally on a thread pool.
+"""
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+
+# Import configuration and utilities
+from config import SECTIONS_DIR, KEYWORD_INDEX_FILE
+from utils import (
+    logger, read_file_safe, ensure_dir_exists, parse_cventry, split_latex_list, parse_skill_lines,
+    add_logging_arguments, configure_logging_from_args, get_default_context
+)
+
+INDEX_VERSION = 3
+INDEXED_FILES = ("projects.tex", "skills.tex")
+SCOPES = ("projects", "skills")
+# Postings counted when picking the rarest keyword of an AND query
+FREQUENCY_PROBE_LIMIT = 10000
+
+LATEX_SYMBOL_RE = re.compile(r'\\([&%$#_{}])')
+LATEX_COMMAND_RE = re.compile(r'\\[A-Za-z]+\*?|[{}]')
+
+
+def normalize_keyword(text: str) -> str:
+    """Canonical form of a keyword: LaTeX stripped, case-folded, single-spaced."""
+    text = LATEX_SYMBOL_RE.sub(r'\1', text)
+    text = LATEX_COMMAND_RE.sub('', text)
+    return ' '.join(text.split()).strip(' .;:').casefold()
+
+
+def split_keywords(text: str) -> List[str]:
+    """Split a comma-separated list, ignoring commas inside parentheses."""
+    return [kw for kw in (normalize_keyword(p) for p in split_latex_list(text)) if kw]
+
+
+def extract_project_keywords(content: str, filename: str = "<string>") -> List[List[Any]]:
+    """
+    [title, normalized tech keywords] for every \\cventry, in order.
+    Projects are identified by position, so equal titles stay distinct.
+    """
+    return [
+        [normalize_keyword(entry['title']), split_keywords(entry['tech'])]
+        for entry in parse_cventry(content, filename)
+    ]
+
+
+def extract_skill_keywords(content: str) -> List[str]:
+    """Normalized keywords from `\\textbf{Label:} a, b, c` lines of a skills section."""
+    keywords: List[str] = []
+    for _, items in parse_skill_lines(content):
+        keywords.extend(kw for kw in (normalize_keyword(item) for item in items) if kw)
+    return sorted(set(keywords))
+
+
+def get_tree_signature(tree: str) -> List[Any]:
+    """Cheap change detector: (mtime_ns, size) of each indexed section file."""
+    signature: List[Any] = []
+    for name in INDEXED_FILES:
+        try:
+            stat = os.stat(os.path.join(tree, SECTIONS_DIR, name))
+            signature.append([stat.st_mtime_ns, stat.st_size])
+        except OSError:
+            signature.append(None)
+    return signature
+
+
+def read_tree_entry(tree: str, signature: List[Any]) -> Dict[str, Any]:
+    """
+    Parse a tree's indexed section files into its forward entry.
+    Touches no shared state, so trees can be read concurrently.
+    """
+    projects_file = os.path.join(tree, SECTIONS_DIR, "projects.tex")
+    projects_tex = read_file_safe(projects_file) if signature[0] else None
+    skills_tex = read_file_safe(os.path.join(tree, SECTIONS_DIR, "skills.tex")) if signature[1] else None
+    return {
+        'signature': signature,
+        'projects': extract_project_keywords(projects_tex, projects_file) if projects_tex else [],
+        'skills': extract_skill_keywords(skills_tex) if skills_tex else [],
+    }
+
+
+def find_trees(roots: Iterable[str]) -> List[str]:
+    """Every directory under roots that contains sections/projects.tex or sections/skills.tex."""
+    trees = []
+    for root in roots:
+        for dirpath, dirnames, _ in os.walk(root):
+            if SECTIONS_DIR in dirnames and any(
+                os.path.exists(os.path.join(dirpath, SECTIONS_DIR, name)) for name in INDEXED_FILES
+            ):
+                trees.append(os.path.abspath(dirpath))
+            dirnames[:] = [d for d in dirnames if d != SECTIONS_DIR and not d.startswith('.')]
+    return sorted(trees)
+
+
+def _is_within(path: str, root: str) -> bool:
+    """True if path is root or lies beneath it."""
+    try:
+        rel = os.path.relpath(os.path.abspath(path), os.path.abspath(root))
+    except ValueError:  # different drives on Windows
+        return False
+    return rel == os.curdir or not rel.startswith(os.pardir)
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS trees (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    signature TEXT NOT NULL,
+    titles TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    keyword TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    tree INTEGER NOT NULL,
+    project INTEGER NOT NULL,
+    PRIMARY KEY (keyword, scope, tree, project)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_by_tree ON postings (tree);
+"""
+
+
+class KeywordIndex:
+    """
+    Inverted index: keyword -> resume trees (and keyword -> projects),
+    stored in SQLite.
+
+    Trees are keyed by absolute path. Each tree row keeps its signature
+    and project titles, so updates are incremental: a changed tree's
+    postings are deleted before the new ones are inserted. Queries look
+    up the postings of their keywords only, so their cost does not grow
+    with the size of the index file.
+
+    Changes are written to the database in a transaction that save()
+    commits; an index that is closed without saving is left as it was.
+    """
+
+    def __init__(self, filepath: str = ":memory:"):
+        self.filepath = filepath
+        if filepath != ":memory:":
+            ensure_dir_exists(filepath)
+        self.db = sqlite3.connect(filepath)
+        try:
+            self.db.executescript(SCHEMA)
+            version = self.db.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+            if version is None:
+                self.db.execute("INSERT INTO meta VALUES ('version', ?)", (str(INDEX_VERSION),))
+                self.db.commit()
+            elif version[0] != str(INDEX_VERSION):
+                raise sqlite3.DatabaseError(f"index version {version[0]}, expected {INDEX_VERSION}")
+        except sqlite3.DatabaseError:
+            self.db.close()
+            raise
+
+    def close(self) -> None:
+        self.db.close()
+
+    # Building -----------------------------------------------------------
+
+    def _signatures(self) -> Dict[str, List[Any]]:
+        return {path: json.loads(sig) for path, sig in self.db.execute("SELECT path, signature FROM trees")}
+
+    def remove_tree(self, tree: str) -> bool:
+        """Drop a tree and its postings. Returns True if it was indexed."""
+        row = self.db.execute("SELECT id FROM trees WHERE path = ?", (os.path.abspath(tree),)).fetchone()
+        if row is None:
+            return False
+        self.db.execute("DELETE FROM postings WHERE tree = ?", row)
+        self.db.execute("DELETE FROM trees WHERE id = ?", row)
+        return True
+
+    def _set_tree(self, tree: str, entry: Dict[str, Any]) -> None:
+        self.remove_tree(tree)
+        titles = [title for title, _ in entry['projects']]
+        tree_id = self.db.execute(
+            "INSERT INTO trees (path, signature, titles) VALUES (?, ?, ?)",
+            (tree, json.dumps(entry['signature']), json.dumps(titles))
+        ).lastrowid
+        rows = {(kw, 'projects', tree_id, n)
+                for n, (_, keywords) in enumerate(entry['projects'], 1) for kw in keywords}
+        rows.update((kw, 'skills', tree_id, 0) for kw in entry['skills'])
+        self.db.executemany("INSERT INTO postings VALUES (?, ?, ?, ?)", rows)
+
+    def update_tree(self, tree: str) -> bool:
+        """(Re)index a tree if its section files changed. Returns True if re-indexed."""
+        tree = os.path.abspath(tree)
+        signature = get_tree_signature(tree)
+        row = self.db.execute("SELECT signature FROM trees WHERE path = ?", (tree,)).fetchone()
+        if row is not None and json.loads(row[0]) == signature:
+            return False
+        self._set_tree(tree, read_tree_entry(tree, signature))
+        return True
+
+    def update(self, roots: Iterable[str], jobs: int = 1) -> Dict[str, int]:
+        """
+        Bring the index in line with the trees under roots: index new and
+        changed trees, and drop indexed trees under roots that disappeared.
+
+        With jobs > 1, changed trees are parsed on a thread pool; the
+        index itself is only modified from the calling thread, in tree
+        order, so the result does not depend on jobs.
+        """
+        roots = [os.path.abspath(root) for root in roots]
+        found = find_trees(roots)
+        indexed = self._signatures()
+        counts = {'indexed': 0, 'unchanged': 0, 'removed': 0}
+
+        changed = []
+        for tree in found:
+            signature = get_tree_signature(tree)
+            if indexed.get(tree) == signature:
+                counts['unchanged'] += 1
+            else:
+                changed.append((tree, signature))
+
+        if jobs > 1 and len(changed) > 1:
+            with ThreadPoolExecutor(max_workers=jobs) as pool:
+                entries = pool.map(lambda item: read_tree_entry(*item), changed)
+                for (tree, _), entry in zip(changed, entries):
+                    self._set_tree(tree, entry)
+        else:
+            for tree, signature in changed:
+                self._set_tree(tree, read_tree_entry(tree, signature))
+        counts['indexed'] = len(changed)
+
+        found_set = set(found)
+        for tree in indexed:
+            if tree not in found_set and any(_is_within(tree, root) for root in roots):
+                self.remove_tree(tree)
+                counts['removed'] += 1
+        return counts
+
+    # Querying -----------------------------------------------------------
+
+    def query(self, keywords: List[str], mode: str = 'and', scope: str = 'all',
+              level: str = 'resume') -> List[str]:
+        """
+        Find resumes (or projects) matching keywords.
+
+        Args:
+            keywords: Raw keywords; normalized like indexed ones
+            mode: 'and' (all keywords) or 'or' (any keyword)
+            scope: 'projects', 'skills' or 'all'
+            level: 'resume' for tree paths, or 'project' for "tree::<n>"
+                ids (n-th project, see project_title()) where a single
+                project carries the keywords
+
+        Returns:
+            Sorted matching ids
+        """
+        terms = sorted({t for t in (normalize_keyword(kw) for kw in keywords) if t})
+        if not terms:
+            return []
+
+        if level == 'project':
+            scopes: Tuple[str, ...] = ('projects',)
+            select, same = "t.path || '::' || p.project", "q.tree = p.tree AND q.project = p.project"
+        else:
+            scopes = SCOPES if scope == 'all' else (scope,)
+            select, same = "t.path", "q.tree = p.tree"
+        in_scopes = f"IN ({','.join('?' * len(scopes))})"
+        sql = f"SELECT DISTINCT {select} FROM postings p JOIN trees t ON t.id = p.tree WHERE p.scope {in_scopes}"
+
+        if mode == 'or':
+            sql += f" AND p.keyword IN ({','.join('?' * len(terms))})"
+            params = list(scopes) + terms
+        else:
+            # Scan the rarest keyword's postings and probe the others per tree,
+            # so the work is bounded by the rarest keyword
+            terms.sort(key=lambda t: self._estimate_frequency(t, scopes))
+            sql += " AND p.keyword = ?"
+            params = list(scopes) + terms[:1]
+            for term in terms[1:]:
+                sql += f" AND EXISTS (SELECT 1 FROM postings q WHERE {same} AND q.keyword = ? AND q.scope {in_scopes})"
+                params += [term, *scopes]
+        return sorted(row[0] for row in self.db.execute(sql, params))
+
+    def _estimate_frequency(self, term: str, scopes: Tuple[str, ...]) -> int:
+        """Postings of term, counted up to FREQUENCY_PROBE_LIMIT."""
+        return self.db.execute(
+            f"SELECT COUNT(*) FROM (SELECT 1 FROM postings WHERE keyword = ?"
+            f" AND scope IN ({','.join('?' * len(scopes))}) LIMIT ?)",
+            (term, *scopes, FREQUENCY_PROBE_LIMIT)
+        ).fetchone()[0]
+
+    def project_title(self, project_id: str) -> Optional[str]:
+        """Normalized title of a "tree::<n>" project id."""
+        tree, _, n = project_id.rpartition('::')
+        row = self.db.execute("SELECT titles FROM trees WHERE path = ?", (tree,)).fetchone()
+        titles = json.loads(row[0]) if row else []
+        return titles[int(n) - 1] if n.isdigit() and 0 < int(n) <= len(titles) else None
+
+    def stats(self) -> Dict[str, int]:
+        """Number of indexed trees and distinct keywords."""
+        trees = self.db.execute("SELECT COUNT(*) FROM trees").fetchone()[0]
+        keywords = self.db.execute("SELECT COUNT(DISTINCT keyword) FROM postings").fetchone()[0]
+        return {'trees': trees, 'keywords': keywords}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Full contents of the index, for inspection and comparison."""
+        postings: Dict[str, Dict[str, List[str]]] = {scope: {} for scope in SCOPES}
+        project_postings: Dict[str, List[str]] = {}
+        rows = self.db.execute(
+            "SELECT p.keyword, p.scope, t.path, p.project FROM postings p JOIN trees t ON t.id = p.tree"
+            " ORDER BY p.keyword, t.path, p.project"
+        )
+        for kw, scope, tree, n in rows:
+            docs = postings[scope].setdefault(kw, [])
+            if not docs or docs[-1] != tree:
+                docs.append(tree)
+            if scope == 'projects':
+                project_postings.setdefault(kw, []).append(f"{tree}::{n}")
+        trees = {
+            path: {'signature': json.loads(sig), 'titles': json.loads(titles)}
+            for path, sig, titles in self.db.execute("SELECT path, signature, titles FROM trees")
+        }
+        return {'version': INDEX_VERSION, 'trees': trees, 'postings': postings,
+                'project_postings': project_postings}
+
+    # Persistence --------------------------------------------------------
+
+    def save(self, filepath: Optional[str] = None) -> bool:
+        """Commit pending changes; with a different filepath, write a copy of the index there."""
+        try:
+            self.db.commit()
+            if filepath is None or os.path.abspath(filepath) == os.path.abspath(self.filepath):
+                return True
+            ensure_dir_exists(filepath)
+            tmp_path = f"{filepath}.tmp"
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            target = sqlite3.connect(tmp_path)
+            try:
+                self.db.backup(target)
+            finally:
+                target.close()
+            os.replace(tmp_path, filepath)
+            return True
+        except (sqlite3.Error, OSError) as e:
+            logger.error("Could not save keyword index %s: %s", filepath or self.filepath, e)
+            return False
+
+    @classmethod
+    def load(cls, filepath: Optional[str] = None) -> 'KeywordIndex':
+        """Open a saved index (created if missing); rebuilt empty if it is unreadable."""
+        filepath = filepath or get_default_context().path(KEYWORD_INDEX_FILE)
+        try:
+            return cls(filepath)
+        except sqlite3.DatabaseError as e:
+            logger.warning("Could not load keyword index %s (%s), rebuilding", filepath, e)
+            os.remove(filepath)
+            return cls(filepath)
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Build and query the resume keyword index")
+    parser.add_argument("--index", help=f"index file (default: <repository>/{KEYWORD_INDEX_FILE})")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="index (or incrementally update) resume trees")
+    build.add_argument("roots", nargs="*", default=["."], help="directories containing resume trees")
+    build.add_argument("--jobs", type=int, default=1, help="threads parsing changed trees")
+
+    query = sub.add_parser("query", help="find resumes by keyword")
+    query.add_argument("keywords", nargs="+")
+    query.add_argument("--any", action="store_true", help="OR instead of AND")
+    query.add_argument("--scope", choices=("all",) + SCOPES, default="all")
+    query.add_argument("--same-project", action="store_true",
+                       help="match keywords within a single project")
+    for command in (build, query):
+        add_logging_arguments(command)
+    args = parser.parse_args()
+    configure_logging_from_args(args)
+
+    args.index = args.index or get_default_context().path(KEYWORD_INDEX_FILE)
+    index = KeywordIndex.load(args.index)
+
+    if args.command == "build":
+        counts = index.update(args.roots, jobs=args.jobs)
+        stats = index.stats()
+        logger.info(
+            "Keyword index: %d indexed, %d unchanged, %d removed (%d trees, %d keywords)",
+            counts['indexed'], counts['unchanged'], counts['removed'], stats['trees'], stats['keywords']
+        )
+        if not index.save():
+            sys.exit(1)
+        return
+
+    start = time.perf_counter()
+    results = index.query(
+        args.keywords, mode='or' if args.any else 'and', scope=args.scope,
+        level='project' if args.same_project else 'resume'
+    )
+    logger.debug("Query took %.2f ms", (time.perf_counter() - start) * 1000)
+    for result in results:
+        print(f"{result}\t{index.project_title(result)}" if args.same_project else result)
+    if not results:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Parse TeX .log files into structured results.
+Extracts errors (with -file-line-error locations), overfull boxes, warnings
+and the number of pages shipped out, so builds can be checked without
+opening the PDF. Also parses the -recorder .fls file list and latexmk's
+own output (which passes ran, and why).
+"""
+
+import os
+import re
+from typing import Optional, List, Dict, Any, Iterable
+
+# Printed by the check compile from the enddocument/afterlastpage hook;
+# draft mode writes no PDF, so there is no "Output written" line to read
+PAGES_MARKER = "Pages shipped:"
+PAGES_MARKER_RE = re.compile(rf'^{re.escape(PAGES_MARKER)} (\d+)')
+OUTPUT_WRITTEN_RE = re.compile(r'^Output written on .*\((\d+) pages?')
+NO_PAGES_RE = re.compile(r'^No pages of output\.')
+# Printed from the file/before and file/after hooks by the profile compile,
+# with \pdfelapsedtime (1/65536 s since the run started)
+LOAD_TIME_MARKER = "Load time:"
+LOAD_TIME_RE = re.compile(rf'^{re.escape(LOAD_TIME_MARKER)} (?P<event>begin|end) (?P<file>\S+) (?P<ticks>\d+)$')
+ELAPSED_TIME_UNIT = 65536
+
+FILE_LINE_ERROR_RE = re.compile(r'^(?P<file>[^\s:!][^:]*\.(?:tex|sty|cls|cfg|def|ltx)):(?P<line>\d+): (?P<message>.*)$')
+BANG_ERROR_RE = re.compile(r'^! (?P<message>.*)$')
+ERROR_LINE_RE = re.compile(r'^l\.(\d+)')
+# Lines after "! message" searched for its "l.<n>" location
+ERROR_CONTEXT_LINES = 8
+OVERFULL_RE = re.compile(
+    r'^Overfull \\(?P<box>[hv])box \((?P<amount>[\d.]+)pt too (?:wide|high)\)'
+    r'(?:.*? at lines? (?P<start>\d+)(?:--(?P<end>\d+))?)?'
+)
+
+# "LaTeX Warning: ...", "Package hyperref Warning: ...", "pdfTeX warning (ext4): ..."
+WARNING_RE = re.compile(
+    r'^(?P<source>(?:Package|Class|Module) \S+|LaTeX(?: Font)?|pdfTeX) [Ww]arning(?: \([^)]*\))?: (?P<message>.*)$'
+)
+# Packages and classes continue a warning on lines prefixed with their name and
+# padded to the message column: "(hyperref)                removing ..."
+WARNING_CONTINUATION_SOURCES = ('Package ', 'Class ', 'Module ', 'LaTeX Font')
+INPUT_LINE_RE = re.compile(r'on input line (\d+)\.?$')
+
+# latexmk progress lines (4.6x wording and the "Reasons for rerun" of 4.7x+)
+LATEXMK_RULE_RE = re.compile(r"^Rule '(?P<rule>[^']+)':\s*(?P<text>.*)$")
+LATEXMK_RUN_RE = re.compile(r"^Run number (?P<run>\d+) of rule '(?P<rule>[^']+)'")
+LATEXMK_SEPARATOR_RE = re.compile(r'^-{4,}$')
+
+
+def parse_log(lines: Iterable[str]) -> Dict[str, Any]:
+    """
+    Parse a TeX log, one line at a time.
+
+    Returns:
+        Dict with `errors` (file, line, message), `overfull` boxes (box,
+        amount in pt, source lines), `warnings` (source, message, input
+        line), `pages` (None if not reported) and `load_times` - per file
+        loaded, in load order, the seconds spent loading it with and
+        without the files it loaded in turn (only when the compile
+        printed LOAD_TIME_MARKER lines)
+    """
+    errors: List[Dict[str, Any]] = []
+    overfull: List[Dict[str, Any]] = []
+    pages: Optional[int] = None
+    warnings: List[Dict[str, Any]] = []
+    pending: Optional[Dict[str, Any]] = None  # "! ..." error awaiting its l.<n> line
+    pending_lines = 0
+    warning: Optional[Dict[str, Any]] = None  # warning that may continue on the next line
+    continuation, column = "", 0  # its continuation prefix and message column
+    load_times: List[Dict[str, Any]] = []
+    loading: List[List[Any]] = []  # open files: [entry, start ticks, ticks spent in nested files]
+
+    for line in lines:
+        line = line.rstrip('\n')
+
+        if warning is not None:
+            if (line.startswith(continuation) and len(line) > column and not line[column].isspace()
+                    and not line[len(continuation):column].strip()):
+                warning['message'] += ' ' + line[column:].strip()
+                _set_input_line(warning)
+                continue
+            warning = None
+
+        match = WARNING_RE.match(line)
+        if match:
+            source = match.group('source')
+            warning = {'source': source, 'message': match.group('message'), 'line': None}
+            _set_input_line(warning)
+            warnings.append(warning)
+            if source.startswith(WARNING_CONTINUATION_SOURCES):
+                continuation, column = f"({source.split()[-1]})", match.start('message')
+            else:
+                warning = None
+            continue
+
+        match = LOAD_TIME_RE.match(line)
+        if match:
+            ticks = int(match.group('ticks'))
+            if match.group('event') == 'begin':
+                entry = {'file': match.group('file'), 'seconds': None, 'self_seconds': None}
+                load_times.append(entry)
+                loading.append([entry, ticks, 0])
+            elif any(item[0]['file'] == match.group('file') for item in loading):
+                # Unwind to the matching begin; files that never reported an end stay untimed
+                entry, start, nested = loading.pop()
+                while entry['file'] != match.group('file'):
+                    entry, start, nested = loading.pop()
+                spent = ticks - start
+                entry['seconds'] = round(spent / ELAPSED_TIME_UNIT, 4)
+                entry['self_seconds'] = round((spent - nested) / ELAPSED_TIME_UNIT, 4)
+                if loading:
+                    loading[-1][2] += spent
+            continue
+
+        match = FILE_LINE_ERROR_RE.match(line)
+        if match:
+            pending = None
+            errors.append({'file': match.group('file'), 'line': int(match.group('line')),
+                           'message': match.group('message')})
+            continue
+
+        match = BANG_ERROR_RE.match(line)
+        if match:
+            pending = {'file': None, 'line': None, 'message': match.group('message')}
+            pending_lines = ERROR_CONTEXT_LINES
+            errors.append(pending)
+            continue
+
+        if pending is not None:
+            match = ERROR_LINE_RE.match(line)
+            pending_lines -= 1
+            if match or not pending_lines:
+                if match:
+                    pending['line'] = int(match.group(1))
+                pending = None
+                continue
+
+        match = OVERFULL_RE.match(line)
+        if match:
+            start = match.group('start')
+            overfull.append({
+                'box': f"{match.group('box')}box",
+                'amount': float(match.group('amount')),
+                'lines': [int(start), int(match.group('end') or start)] if start else None,
+            })
+            continue
+
+        match = PAGES_MARKER_RE.match(line) or OUTPUT_WRITTEN_RE.match(line)
+        if match:
+            pages = int(match.group(1))
+        elif NO_PAGES_RE.match(line):
+            pages = 0
+
+    return {'errors': errors, 'overfull': overfull, 'warnings': warnings, 'pages': pages,
+            'load_times': load_times}
+
+
+def _set_input_line(warning: Dict[str, Any]) -> None:
+    match = INPUT_LINE_RE.search(warning['message'])
+    if match:
+        warning['line'] = int(match.group(1))
+
+
+def parse_log_file(filepath: str) -> Optional[Dict[str, Any]]:
+    """Parse a .log file; None if it cannot be read."""
+    try:
+        # TeX logs are in the input encoding, which is not always UTF-8
+        with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
+            return parse_log(f)
+    except OSError:
+        return None
+
+
+def parse_fls(lines: Iterable[str]) -> Dict[str, List[str]]:
+    """
+    Parse a -recorder .fls file.
+
+    Returns:
+        Dict with the distinct `inputs` and `outputs`, in first-use order.
+        Paths under the compile directory (PWD) are made relative to it.
+    """
+    root = None
+    # dicts keep first-use order and drop repeats
+    files: Dict[str, Dict[str, None]] = {'INPUT': {}, 'OUTPUT': {}}
+    for line in lines:
+        kind, _, path = line.rstrip('\n').partition(' ')
+        if kind == 'PWD':
+            root = path.rstrip('/') + '/'
+        elif kind in files and path:
+            if root and path.startswith(root):
+                path = path[len(root):]
+            if not os.path.isabs(path):
+                path = os.path.normpath(path)
+            files[kind].setdefault(path)
+    return {'inputs': list(files['INPUT']), 'outputs': list(files['OUTPUT'])}
+
+
+def parse_fls_file(filepath: str) -> Optional[Dict[str, List[str]]]:
+    """Parse a .fls file; None if it cannot be read."""
+    try:
+        with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
+            return parse_fls(f)
+    except OSError:
+        return None
+
+
+def summarize_inputs(inputs: List[str]) -> Dict[str, Any]:
+    """Counts per file extension, plus the classes, packages and project files loaded."""
+    by_extension: Dict[str, int] = {}
+    for path in inputs:
+        ext = os.path.splitext(path)[1] or '(none)'
+        by_extension[ext] = by_extension.get(ext, 0) + 1
+
+    def stems(ext: str) -> List[str]:
+        return sorted({os.path.splitext(os.path.basename(p))[0] for p in inputs if p.endswith(ext)})
+
+    return {
+        'count': len(inputs),
+        'by_extension': dict(sorted(by_extension.items(), key=lambda kv: (-kv[1], kv[0]))),
+        'classes': stems('.cls'),
+        'packages': stems('.sty'),
+        'project': [p for p in inputs if not os.path.isabs(p)],
+    }
+
+
+def parse_latexmk_output(lines: Iterable[str]) -> List[Dict[str, Any]]:
+    """
+    Parse latexmk's output (not -silent) as it streams, one line at a time.
+
+    Returns:
+        One dict per rule run, in order: `rule`, `run` (latexmk's run
+        number for that rule) and `reasons` - what latexmk said made the
+        rule out of date, e.g. "Changed files or newly in use/created: cv.aux"
+    """
+    passes: List[Dict[str, Any]] = []
+    reasons: List[List[str]] = []  # [heading, items...]
+    collecting = False
+
+    for line in lines:
+        line = line.rstrip('\n')
+
+        match = LATEXMK_RUN_RE.match(line)
+        if match:
+            passes.append({
+                'rule': match.group('rule'),
+                'run': int(match.group('run')),
+                'reasons': [
+                    reason[0] + (' ' + ', '.join(reason[1:]) if reason[0].endswith(':') else '')
+                    for reason in reasons if len(reason) > 1 or not reason[0].endswith(':')
+                ],
+            })
+            reasons, collecting = [], False
+            continue
+
+        match = LATEXMK_RULE_RE.match(line)
+        if match:
+            reasons, collecting = [], True
+            text = match.group('text').strip()
+            if text and text != 'Reasons for rerun':
+                reasons.append([text])
+            continue
+
+        if not collecting:
+            continue
+        text = line.strip()
+        if not text or LATEXMK_SEPARATOR_RE.match(text):
+            continue
+        if text.startswith('Latexmk:'):
+            collecting = False
+            continue
+        if len(text) > 1 and text[0] == text[-1] == "'":
+            text = text[1:-1]
+        if text.endswith(':') or not reasons or not reasons[-1][0].endswith(':'):
+            reasons.append([text])
+        else:
+            reasons[-1].append(text)
+
+    return passes
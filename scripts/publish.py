@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Publish build outputs into docs/ for static hosting.
+Artifacts are compared by SHA-256 and only rewritten when their content
+changed. A manifest with content hashes supports cache-busting, and
+precompressed .gz/.br siblings let the host serve compressed bytes directly.
+"""
+
+import argparse
+import functools
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+from typing import Optional, List, Dict, Any, Callable, Tuple
+
+# Import configuration and utilities
+from config import (
+    DOCS_DIR, OUTPUT_FILES, PUBLISH_ARTIFACTS, PRECOMPRESS_FILES, PUBLISH_HARDLINK
+)
+from utils import (
+    logger, file_logger, ensure_dir_exists, add_logging_arguments, configure_logging_from_args,
+    enter_project_root
+)
+
+try:
+    import brotli
+except ImportError:  # optional: .br siblings are skipped without it
+    brotli = None
+
+MANIFEST_FILE = OUTPUT_FILES['manifest']
+VERSION_LENGTH = 12
+HASH_CHUNK_SIZE = 1 << 16
+
+
+def file_sha256(filepath: str) -> Optional[str]:
+    """Return the hex SHA-256 of a file, or None if it does not exist."""
+    if not os.path.exists(filepath):
+        return None
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def write_bytes_atomic(filepath: str, data: bytes) -> None:
+    """Write data via a temp file and rename, so readers never see partial files."""
+    ensure_dir_exists(filepath)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(filepath) or '.', prefix='.publish-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def write_if_changed(filepath: str, data: bytes) -> bool:
+    """Write data unless the file already holds exactly these bytes. Returns True if written."""
+    if file_sha256(filepath) == hashlib.sha256(data).hexdigest():
+        return False
+    write_bytes_atomic(filepath, data)
+    return True
+
+
+def publish_file(src: str, dest: str, link: bool = PUBLISH_HARDLINK) -> Optional[str]:
+    """
+    Publish src at dest unless dest already has identical content.
+
+    Returns:
+        "unchanged", "linked" or "copied", or None if src is missing
+    """
+    src_hash = file_sha256(src)
+    if src_hash is None:
+        logger.error(f"Artifact not found: {src}")
+        return None
+
+    if os.path.abspath(src) == os.path.abspath(dest) or file_sha256(dest) == src_hash:
+        return "unchanged"
+
+    ensure_dir_exists(dest)
+    tmp_path = os.path.join(os.path.dirname(dest) or '.', f".publish-{os.path.basename(dest)}")
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    status = "copied"
+    if link:
+        try:
+            os.link(src, tmp_path)
+            status = "linked"
+        except OSError as e:
+            logger.debug(f"Hardlink failed for {src} ({e}), copying instead")
+    if status == "copied":
+        shutil.copy2(src, tmp_path)
+    os.replace(tmp_path, dest)
+    return status
+
+
+def precompress(filepath: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Write .gz (and .br, if brotli is installed) siblings of filepath.
+    Output is deterministic, so unchanged input leaves the siblings untouched.
+
+    Returns:
+        Dict of encoding -> {"file", "size"} for the siblings written or kept
+    """
+    with open(filepath, 'rb') as f:
+        data = f.read()
+
+    compressors: Dict[str, Tuple[str, Callable[[bytes], bytes]]] = {
+        "gzip": (".gz", functools.partial(gzip.compress, compresslevel=9, mtime=0))
+    }
+    if brotli is not None:
+        compressors["br"] = (".br", functools.partial(brotli.compress, quality=11))
+    else:
+        logger.warning("brotli not installed, skipping .br output (pip install brotli)")
+
+    encodings = {}
+    for encoding, (suffix, compress) in compressors.items():
+        sibling = filepath + suffix
+        if write_if_changed(sibling, compress(data)):
+            file_logger.info("✓ Generated: %s", sibling)
+        encodings[encoding] = {
+            "file": os.path.basename(sibling),
+            "size": os.path.getsize(sibling),
+        }
+    return encodings
+
+
+def build_manifest(files: List[str], encodings: Dict[str, Dict[str, Dict[str, Any]]],
+                   docs_dir: str = DOCS_DIR) -> Dict[str, Any]:
+    """
+    Build the manifest of published files.
+    Keys are paths relative to docs_dir; `version` is a short content hash
+    suitable for cache-busting query strings (e.g. resume.json?v=<version>).
+    """
+    manifest: Dict[str, Any] = {"files": {}}
+    for filepath in sorted(files):
+        sha = file_sha256(filepath)
+        if sha is None:
+            continue
+        rel = os.path.relpath(filepath, docs_dir).replace(os.sep, '/')
+        entry: Dict[str, Any] = {
+            "sha256": sha,
+            "size": os.path.getsize(filepath),
+            "version": sha[:VERSION_LENGTH],
+        }
+        if filepath in encodings:
+            entry["encodings"] = encodings[filepath]
+        manifest["files"][rel] = entry
+    return manifest
+
+
+def publish(artifacts: Dict[str, str] = PUBLISH_ARTIFACTS,
+            compress_files: List[str] = PRECOMPRESS_FILES,
+            manifest_file: str = MANIFEST_FILE, link: bool = PUBLISH_HARDLINK) -> bool:
+    """Publish artifacts, precompress, and refresh the manifest. Returns success."""
+    ok = True
+    for src, dest in artifacts.items():
+        status = publish_file(src, dest, link)
+        if status is None:
+            ok = False
+        elif status == "unchanged":
+            logger.debug(f"Unchanged: {dest}")
+        else:
+            file_logger.info("✓ Published (%s): %s", status, dest)
+
+    encodings = {}
+    for filepath in compress_files:
+        if os.path.exists(filepath):
+            encodings[filepath] = precompress(filepath)
+
+    manifest = build_manifest(list(artifacts.values()), encodings,
+                              os.path.dirname(manifest_file) or '.')
+    data = (json.dumps(manifest, indent=2) + '\n').encode('utf-8')
+    if write_if_changed(manifest_file, data):
+        file_logger.info("✓ Generated: %s", manifest_file)
+    return ok
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Publish build outputs into docs/")
+    add_logging_arguments(parser)
+    configure_logging_from_args(parser.parse_args())
+    enter_project_root()
+    if not publish():
+        logger.error("Publishing failed")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Render tailored resume variants in parallel.
+Each variant (see RESUME_VARIANTS in config.py) selects and orders the
+sections/*.tex files to include. Variants compile on a process pool, each
+in its own temporary build directory, and produce their own PDF and JSON.
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Optional, List, Dict, Any
+
+# Import configuration and utilities
+from config import MAIN_TEX_FILE, RESUME_VARIANTS, VARIANTS_OUTPUT_DIR
+from utils import (
+    logger, read_file_safe, write_file_safe, validate_file_exists,
+    configure_logging, enter_project_root
+)
+from build_pdf import ensure_format, compile_pdf
+from generate_json import get_section_file, generate_json_resume, JSON_FIXED_SECTIONS
+
+# Matches one `\input{sections/<name>.tex}` line in the root document
+SECTION_INPUT_RE = re.compile(r'^[ \t]*\\input\{sections/([\w-]+?)(?:\.tex)?\}[ \t]*\n?', re.MULTILINE)
+
+
+def render_variant_tex(base_tex: str, sections: List[str],
+                       overrides: Optional[Dict[str, str]] = None) -> str:
+    """
+    Build a variant's root document from the base cv.tex.
+    The base document's section inputs are replaced, in place, by the
+    variant's sections in the requested order.
+
+    Raises:
+        ValueError: If the base document has no section inputs to replace
+    """
+    matches = list(SECTION_INPUT_RE.finditer(base_tex))
+    if not matches:
+        raise ValueError("No \\input{sections/...} lines found in base document")
+
+    # \input paths stay relative so the document compiles from the repository root
+    inputs = "".join(
+        f"\\input{{{os.path.relpath(get_section_file(section, overrides)).replace(os.sep, '/')}}}\n"
+        for section in sections
+    )
+
+    # Keep anything between the original inputs (comments etc.)
+    between = "".join(
+        base_tex[prev.end():cur.start()] for prev, cur in zip(matches, matches[1:])
+    )
+    return base_tex[:matches[0].start()] + inputs + between + base_tex[matches[-1].end():]
+
+
+def validate_variant(name: str, spec: Dict[str, Any]) -> List[str]:
+    """Return a list of problems with a variant spec (empty if valid)."""
+    problems = []
+    sections = spec.get("sections")
+    if not sections:
+        return [f"{name}: no sections listed"]
+
+    overrides = spec.get("overrides") or {}
+    for section in sections:
+        if not os.path.exists(get_section_file(section, overrides)):
+            problems.append(f"{name}: section file not found: {get_section_file(section, overrides)}")
+    for section in overrides:
+        if section not in sections:
+            problems.append(f"{name}: override for unused section '{section}'")
+        elif section in JSON_FIXED_SECTIONS:
+            problems.append(f"{name}: override for '{section}' would not reach the JSON Resume")
+    return problems
+
+
+def render_variant(name: str, spec: Dict[str, Any], base_tex: str,
+                   fmt_name: Optional[str], output_dir: str) -> Dict[str, Any]:
+    """
+    Render a single variant in an isolated build directory.
+    Runs in a worker process.
+
+    Returns:
+        Dict with keys: name, pdf, json (output paths or None), build_dir
+    """
+    sections = spec["sections"]
+    overrides = spec.get("overrides") or {}
+    result: Dict[str, Any] = {"name": name, "pdf": None, "json": None, "build_dir": None}
+
+    build_dir = tempfile.mkdtemp(prefix=f"resume-{name}-")
+    result["build_dir"] = build_dir
+    tex_file = os.path.join(build_dir, f"cv-{name}.tex")
+    if not write_file_safe(tex_file, render_variant_tex(base_tex, sections, overrides)):
+        return result
+
+    # Sources are resolved from the project root; aux files stay in build_dir
+    if compile_pdf(tex_file, fmt_name, force=True, extra_flags=[f"-outdir={build_dir}"]):
+        pdf_file = os.path.join(output_dir, f"{name}.pdf")
+        shutil.copy2(os.path.join(build_dir, f"cv-{name}.pdf"), pdf_file)
+        result["pdf"] = pdf_file
+    else:
+        logger.error(f"Variant '{name}' failed to compile (build dir kept: {build_dir})")
+
+    result["json"] = generate_json_resume(os.path.join(output_dir, f"{name}.json"), sections, overrides)
+
+    if result["pdf"]:
+        shutil.rmtree(build_dir, ignore_errors=True)
+        result["build_dir"] = None
+    return result
+
+
+def render_variants(variants: Dict[str, Dict[str, Any]], output_dir: str = VARIANTS_OUTPUT_DIR,
+                    jobs: Optional[int] = None, use_format: bool = True) -> List[Dict[str, Any]]:
+    """
+    Render variants in parallel on a process pool.
+
+    Args:
+        variants: Mapping of variant name -> spec (sections, overrides)
+        output_dir: Directory receiving <name>.pdf and <name>.json
+        jobs: Worker processes (default: one per CPU)
+        use_format: Compile against the precompiled preamble format
+
+    Returns:
+        One result dict per variant (see render_variant)
+    """
+    base_tex = read_file_safe(MAIN_TEX_FILE)
+    if base_tex is None:
+        return []
+
+    problems = [p for name, spec in variants.items() for p in validate_variant(name, spec)]
+    if problems:
+        for problem in problems:
+            logger.error(problem)
+        return []
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Variants share cv.tex's preamble, so one format serves them all
+    fmt_name = ensure_format(MAIN_TEX_FILE) if use_format else None
+
+    results = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {
+            pool.submit(render_variant, name, spec, base_tex, fmt_name, output_dir): name
+            for name, spec in variants.items()
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            status = "✓" if result["pdf"] and result["json"] else "✗"
+            logger.info(f"{status} Variant {result['name']}: pdf={result['pdf']} json={result['json']}")
+            results.append(result)
+
+    return sorted(results, key=lambda r: r["name"])
+
+
+def load_variants(spec_file: Optional[str]) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Load variant specs from a JSON file, or config.RESUME_VARIANTS if None."""
+    if spec_file is None:
+        return RESUME_VARIANTS
+    if not validate_file_exists(spec_file):
+        return None
+    content = read_file_safe(spec_file)
+    try:
+        return json.loads(content) if content else None
+    except json.JSONDecodeError as e:
+        logger.error(f"Invalid variant spec {spec_file}: {e}")
+        return None
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Render tailored resume variants")
+    parser.add_argument("names", nargs="*", help="variants to render (default: all)")
+    parser.add_argument("--spec", help="JSON file of variant specs (default: config.RESUME_VARIANTS)")
+    parser.add_argument("--output-dir", default=VARIANTS_OUTPUT_DIR)
+    parser.add_argument("--jobs", type=int, default=None, help="parallel workers")
+    parser.add_argument("--no-format", action="store_true",
+                        help="compile without the precompiled preamble format")
+    args = parser.parse_args()
+    configure_logging()
+    enter_project_root()
+
+    variants = load_variants(args.spec)
+    if not variants:
+        logger.error("No variants to render")
+        sys.exit(1)
+
+    unknown = [name for name in args.names if name not in variants]
+    if unknown:
+        logger.error(f"Unknown variant(s): {', '.join(unknown)}")
+        sys.exit(1)
+    if args.names:
+        variants = {name: variants[name] for name in args.names}
+
+    results = render_variants(variants, args.output_dir, args.jobs, not args.no_format)
+    if len(results) != len(variants) or not all(r["pdf"] and r["json"] for r in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,26 +2,208 @@
 """
 Utility functions for resume generation scripts.
 Includes logging, validation, and LaTeX parsing helpers.
+
+Importing this module has no side effects: it neither changes directory
+nor configures logging. Entry points call configure_logging(), and the
+parse/generate APIs take an explicit Context for paths, config and logger.
 """
 
 import os
 import re
 import sys
+import bisect
+import json
+import queue
+import atexit
 import logging
-from typing import Optional, List, Tuple, Dict, Any
+import threading
+import logging.handlers
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional, List, Tuple, Dict, Set, Any, Iterator, Iterable, Collection
 
-# Ensure scripts are run from project root
-if os.path.basename(os.getcwd()) == 'scripts':
-    os.chdir('..')
+# Repository root; config paths (sections/, style/, docs/) are relative to it
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(levelname)s: %(message)s',
-    stream=sys.stdout
-)
+LOG_FORMAT = '%(levelname)s: %(message)s'
 
 logger = logging.getLogger(__name__)
+# Per-file "✓ Generated" lines; silenced by configure_logging(quiet=True)
+file_logger = logging.getLogger(f"{__name__}.files")
+
+# Fields merged into every record (e.g. the resume tree being processed)
+_log_context: ContextVar[Dict[str, Any]] = ContextVar('log_context', default={})
+_log_handler: Optional[logging.Handler] = None
+_log_listener: Optional[logging.handlers.QueueListener] = None
+_atexit_registered = False
+# Guards the shared caches below (macro tables, default context) so they
+# can be filled from worker threads, including on free-threaded Python
+_cache_lock = threading.Lock()
+
+
+class ContextFilter(logging.Filter):
+    """Attach the current log_context() fields to each record as `context`."""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.context = _log_context.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line, including context fields."""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        entry.update(getattr(record, 'context', None) or {})
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+@contextmanager
+def log_context(**fields: Any) -> Iterator[None]:
+    """Add fields (e.g. tree='jane-doe') to every log record emitted in this block."""
+    token = _log_context.set({**_log_context.get(), **fields})
+    try:
+        yield
+    finally:
+        _log_context.reset(token)
+
+
+def stop_logging() -> None:
+    """Flush and stop the background log listener, if any."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
+def configure_logging(level: int = logging.INFO, json_format: bool = False,
+                      quiet: bool = False, use_queue: bool = False, stream=None) -> None:
+    """
+    (Re)configure root logging for the scripts.
+    
+    Args:
+        level: Root log level
+        json_format: Emit structured JSON lines instead of "LEVEL: message"
+        quiet: Suppress the per-file "✓ Generated" lines
+        use_queue: Hand records to a QueueHandler and write them from a
+            background listener thread, so log I/O never blocks the caller
+        stream: Output stream (default: stdout)
+    """
+    global _log_handler, _log_listener, _atexit_registered
+    
+    root = logging.getLogger()
+    stop_logging()
+    if _log_handler is not None:
+        root.removeHandler(_log_handler)
+    
+    handler: logging.Handler = logging.StreamHandler(stream or sys.stdout)
+    handler.setFormatter(JsonFormatter() if json_format else logging.Formatter(LOG_FORMAT))
+    
+    if use_queue:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _log_listener = logging.handlers.QueueListener(log_queue, handler)
+        _log_listener.start()
+        if not _atexit_registered:
+            atexit.register(stop_logging)
+            _atexit_registered = True
+        handler = logging.handlers.QueueHandler(log_queue)
+    
+    # Context is captured in the emitting thread, before any queue hand-off
+    handler.addFilter(ContextFilter())
+    _log_handler = handler
+    root.addHandler(handler)
+    root.setLevel(level)
+    file_logger.setLevel(logging.WARNING if quiet else logging.NOTSET)
+
+
+def add_logging_arguments(parser) -> None:
+    """Add the shared logging flags to an argparse parser."""
+    group = parser.add_argument_group('logging')
+    group.add_argument('--verbose', action='store_true', help="enable debug logging")
+    group.add_argument('--quiet', action='store_true', help="suppress per-file '✓ Generated' lines")
+    group.add_argument('--log-json', action='store_true', help="emit structured JSON log lines")
+    group.add_argument('--log-queue', action='store_true',
+                       help="write logs from a background thread so they never block processing")
+
+
+def configure_logging_from_args(args) -> None:
+    """Apply the flags added by add_logging_arguments()."""
+    configure_logging(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        json_format=args.log_json,
+        quiet=args.quiet,
+        use_queue=args.log_queue
+    )
+
+
+class Context:
+    """
+    Explicit state for the parse and generate APIs, instead of the process
+    working directory and module globals.
+    
+    Attributes:
+        root_dir: Resume tree that config-relative paths (sections/...,
+            docs/...) resolve against
+        config: Module or object providing the config.py settings
+        logger: Logger the APIs report through
+        file_logger: Its "files" child, for the per-file "✓ Generated" lines
+        macros_file: style/macros.tex to parse with; trees derived with
+            for_tree() share their parent's
+    
+    Contexts are not modified after creation, so one can be shared by
+    any number of threads.
+    """
+    
+    def __init__(self, root_dir: str = PROJECT_ROOT, config: Any = None,
+                 logger: Optional[logging.Logger] = None, macros_file: Optional[str] = None):
+        if config is None:
+            import config as default_config
+            config = default_config
+        self.root_dir = os.path.abspath(root_dir)
+        self.config = config
+        self.logger = logger if logger is not None else logging.getLogger(__name__)
+        self.file_logger = self.logger.getChild('files')
+        self.macros_file = macros_file or self.path(config.MACROS_FILE)
+    
+    def path(self, *parts: str) -> str:
+        """Resolve a config-relative path against root_dir."""
+        return os.path.join(self.root_dir, *parts)
+    
+    def for_tree(self, root_dir: str) -> 'Context':
+        """Context for another resume tree, keeping config, logger and macros."""
+        return Context(root_dir, self.config, self.logger, self.macros_file)
+
+
+_default_context: Optional[Context] = None
+
+
+def get_default_context() -> Context:
+    """Context for this repository (PROJECT_ROOT with config.py)."""
+    global _default_context
+    with _cache_lock:
+        if _default_context is None:
+            _default_context = Context()
+        return _default_context
+
+
+def _logger(ctx: Optional[Context]) -> logging.Logger:
+    """The context's logger, or this module's without one."""
+    return ctx.logger if ctx is not None else logger
+
+
+def enter_project_root() -> None:
+    """
+    For command-line entry points only: run from the repository root so
+    config-relative paths work wherever the script was started from.
+    """
+    os.chdir(PROJECT_ROOT)
 
 
 def setup_logger(name: str, verbose: bool = False) -> logging.Logger:
@@ -31,50 +213,52 @@ def setup_logger(name: str, verbose: bool = False) -> logging.Logger:
     return log
 
 
-def ensure_dir_exists(filepath: str) -> None:
+def ensure_dir_exists(filepath: str, ctx: Optional[Context] = None) -> None:
     """Ensure the directory for the given filepath exists."""
     directory = os.path.dirname(filepath)
     if directory:
         os.makedirs(directory, exist_ok=True)
-        logger.debug(f"Ensured directory exists: {directory}")
+        _logger(ctx).debug("Ensured directory exists: %s", directory)
 
 
-def validate_file_exists(filepath: str) -> bool:
+def validate_file_exists(filepath: str, ctx: Optional[Context] = None) -> bool:
     """Check if a file exists and log warning if not."""
     if not os.path.exists(filepath):
-        logger.warning(f"File not found: {filepath}")
+        _logger(ctx).warning("File not found: %s", filepath)
         return False
     return True
 
 
-def read_file_safe(filepath: str, encoding: str = 'utf-8') -> Optional[str]:
+def read_file_safe(filepath: str, encoding: str = 'utf-8', ctx: Optional[Context] = None) -> Optional[str]:
     """Safely read a file and return its content, or None if error."""
+    log = _logger(ctx)
     try:
-        if not validate_file_exists(filepath):
+        if not validate_file_exists(filepath, ctx):
             return None
         with open(filepath, 'r', encoding=encoding) as f:
             content = f.read()
-        logger.debug(f"Successfully read: {filepath} ({len(content)} chars)")
+        log.debug("Successfully read: %s (%d chars)", filepath, len(content))
         return content
     except Exception as e:
-        logger.error(f"Error reading {filepath}: {e}")
+        log.error("Error reading %s: %s", filepath, e)
         return None
 
 
-def write_file_safe(filepath: str, content: str, encoding: str = 'utf-8') -> bool:
+def write_file_safe(filepath: str, content: str, encoding: str = 'utf-8',
+                    ctx: Optional[Context] = None) -> bool:
     """Safely write content to a file."""
     try:
-        ensure_dir_exists(filepath)
+        ensure_dir_exists(filepath, ctx)
         with open(filepath, 'w', encoding=encoding) as f:
             f.write(content)
-        logger.info(f"✓ Generated: {filepath}")
+        (ctx.file_logger if ctx is not None else file_logger).info("✓ Generated: %s", filepath)
         return True
     except Exception as e:
-        logger.error(f"Error writing {filepath}: {e}")
+        _logger(ctx).error("Error writing %s: %s", filepath, e)
         return False
 
 
-def find_matching_brace(text: str, start_pos: int) -> int:
+def find_matching_brace(text: str, start_pos: int, limit: Optional[int] = None) -> int:
     """
     Find the position of the matching closing brace.
     Handles nested braces and escaped characters properly.
@@ -82,111 +266,443 @@ def find_matching_brace(text: str, start_pos: int) -> int:
     Args:
         text: The text to search in
         start_pos: Position after the opening brace
+        limit: Stop searching at this position (default: end of text)
     
     Returns:
-        Position of matching closing brace, or -1 if not found
+        Position after the matching closing brace, or -1 if not found
     """
-    if not text or start_pos >= len(text):
+    limit = len(text) if limit is None else min(limit, len(text))
+    if not text or start_pos >= limit:
         return -1
     
     count = 1
     pos = start_pos
     
-    while pos < len(text) and count > 0:
+    while pos < limit:
         char = text[pos]
-        
-        # Count consecutive backslashes before current position
-        num_backslashes = 0
-        temp_pos = pos - 1
-        while temp_pos >= 0 and text[temp_pos] == '\\':
-            num_backslashes += 1
-            temp_pos -= 1
-        
-        # Character is escaped only if preceded by odd number of backslashes
-        is_escaped = (num_backslashes % 2 == 1)
-        
-        # Check braces only if not escaped
-        if not is_escaped:
-            if char == '{':
-                count += 1
-            elif char == '}':
-                count -= 1
-        
+        if char == '\\':
+            # A backslash escapes the next character (including another backslash)
+            pos += 2
+            continue
+        if char == '{':
+            count += 1
+        elif char == '}':
+            count -= 1
+            if count == 0:
+                return pos + 1
         pos += 1
     
-    return pos if count == 0 else -1
+    return -1
 
 
-def extract_latex_args(text: str, start: int, num_args: int) -> Tuple[Optional[List[str]], int]:
+def scan_latex_args(text: str, start: int, num_args: int,
+                    limit: Optional[int] = None) -> Tuple[Optional[List[str]], int, Optional[Tuple[int, str]]]:
     """
-    Extract N arguments from a LaTeX command.
-    
-    Args:
-        text: The text containing LaTeX
-        start: Starting position (after command name)
-        num_args: Number of arguments to extract
+    Read num_args brace-delimited arguments without looking past limit.
     
     Returns:
-        Tuple of (list of arguments, end position) or (None, start) if failed
+        (arguments, end position, None) on success, or
+        (None, start, (error offset, message)) on failure
     """
-    if not text or start >= len(text) or num_args <= 0:
-        logger.warning(f"Invalid arguments for extract_latex_args: text_len={len(text) if text else 0}, start={start}, num_args={num_args}")
-        return None, start
-    
+    limit = len(text) if limit is None else min(limit, len(text))
     args = []
     pos = start
     
     for arg_num in range(1, num_args + 1):
         # Skip whitespace
-        while pos < len(text) and text[pos] in ' \n\t':
+        arg_end = pos
+        while pos < limit and text[pos] in ' \n\t':
             pos += 1
         
-        if pos >= len(text):
-            logger.warning(f"Unexpected end of text while extracting argument {arg_num}/{num_args}")
-            return None, start
+        if pos >= limit:
+            # Report where the argument was expected, not where the search stopped
+            return None, start, (arg_end, f"missing argument {arg_num}/{num_args}")
         
         if text[pos] != '{':
-            logger.warning(f"Expected '{{' at position {pos} for argument {arg_num}/{num_args}, found '{text[pos]}'")
-            return None, start
+            return None, start, (pos, f"expected '{{' for argument {arg_num}/{num_args}, found {text[pos]!r}")
         
-        # Find matching brace
-        end = find_matching_brace(text, pos + 1)
+        end = find_matching_brace(text, pos + 1, limit)
         if end == -1:
-            logger.warning(f"Unmatched brace at position {pos} for argument {arg_num}/{num_args}")
-            return None, start
+            return None, start, (pos, f"unmatched brace in argument {arg_num}/{num_args}")
         
         args.append(text[pos + 1:end - 1])
         pos = end
     
+    return args, pos, None
+
+
+def extract_latex_args(text: str, start: int, num_args: int) -> Tuple[Optional[List[str]], int]:
+    """
+    Extract N arguments from a LaTeX command.
+    
+    Args:
+        text: The text containing LaTeX
+        start: Starting position (after command name)
+        num_args: Number of arguments to extract
+    
+    Returns:
+        Tuple of (list of arguments, end position) or (None, start) if failed
+    """
+    if not text or start >= len(text) or num_args <= 0:
+        logger.warning("Invalid arguments for extract_latex_args: text_len=%d, start=%d, num_args=%d",
+                       len(text) if text else 0, start, num_args)
+        return None, start
+    
+    args, pos, error = scan_latex_args(text, start, num_args)
+    if error is not None:
+        logger.warning("%s at position %d", error[1], error[0])
     return args, pos
 
 
+# Single-pass translation table, so replacements are never re-escaped
+LATEX_ESCAPE_TABLE = str.maketrans({
+    '\\': r'\textbackslash{}',
+    '_': r'\_',
+    '&': r'\&',
+    '#': r'\#',
+    '%': r'\%',
+    '$': r'\$',
+    '{': r'\{',
+    '}': r'\}',
+    '^': r'\^{}',
+    '~': r'\textasciitilde{}'
+})
+# Joins strings for escape_latex_many; never touched by the escape table
+_ESCAPE_SEPARATOR = '\x00'
+
+
 def escape_latex_chars(text: str) -> str:
     """Escape special LaTeX characters."""
-    latex_escapes = {
-        '\\': r'\textbackslash{}',
-        '_': r'\_',
-        '&': r'\&',
-        '#': r'\#',
-        '%': r'\%',
-        '$': r'\$',
-        '{': r'\{',
-        '}': r'\}',
-        '^': r'\^{}',
-        '~': r'\textasciitilde{}'
-    }
-    for char, escape in latex_escapes.items():
-        text = text.replace(char, escape)
-    return text
-
-
-def clean_latex_to_plain(text: str) -> str:
+    return text.translate(LATEX_ESCAPE_TABLE)
+
+
+def escape_latex_many(texts: List[str]) -> List[str]:
+    """
+    Escape many strings with a single translate call.
+    Cheaper than escaping item by item when rendering large batches.
+    """
+    if not texts:
+        return []
+    escaped = _ESCAPE_SEPARATOR.join(texts).translate(LATEX_ESCAPE_TABLE).split(_ESCAPE_SEPARATOR)
+    if len(escaped) != len(texts):
+        # An input contained the separator itself
+        return [escape_latex_chars(text) for text in texts]
+    return escaped
+
+
+# User macros ------------------------------------------------------------
+
+DEFINITION_RE = re.compile(r'\\(?:new|renew|provide)(command|environment)\*?\s*')
+OPTIONAL_VALUE_RE = re.compile(r'\s*\[([^\]]*)\]')
+PARAMETER_RE = re.compile(r'#([1-9#])')
+CONTROL_RE = re.compile(r'\\(?:([A-Za-z@]+)|.)', re.DOTALL)
+COMMAND_NAME_RE = re.compile(r'\{?\s*\\([A-Za-z@]+)\s*\}?')
+COMMENT_RE = re.compile(r'(?<!\\)%.*')
+# One `\textbf{Label:} a, b, c` line of a skills section
+SKILL_LINE_RE = re.compile(r'\\textbf\{([^}]*)\}(.*?)(?=\\\\|\\noindent|$)', re.DOTALL)
+MAX_EXPANSION_DEPTH = 32
+# Macro uses expanded for one piece of text, over all branches
+MAX_EXPANSIONS = 10000
+
+
+def blank_comments(text: str) -> str:
+    """Replace % comments by spaces, keeping every other character's offset."""
+    return COMMENT_RE.sub(lambda m: ' ' * len(m.group()), text)
+
+
+class Macro:
+    """
+    A compiled \newcommand (or one side of a \newenvironment).
+
+    The body is split once into literal text and parameter slots, so
+    expanding a use is a join rather than a search-and-replace.
+    """
+    
+    __slots__ = ('name', 'arity', 'default', 'body', 'end_body', '_parts', '_end_parts')
+    
+    def __init__(self, name: str, arity: int, default: Optional[str], body: str,
+                 end_body: Optional[str] = None):
+        self.name = name
+        self.arity = arity
+        self.default = default  # value of the optional first argument, if it has one
+        self.body = body
+        self.end_body = end_body
+        self._parts = self._compile(body)
+        self._end_parts = self._compile(end_body) if end_body is not None else []
+    
+    @staticmethod
+    def _compile(body: str) -> List[Any]:
+        """Split a body into literal strings and 0-based argument indexes."""
+        parts: List[Any] = []
+        pos = 0
+        for match in PARAMETER_RE.finditer(body):
+            parts.append(body[pos:match.start()])
+            parts.append('#' if match.group(1) == '#' else int(match.group(1)) - 1)
+            pos = match.end()
+        parts.append(body[pos:])
+        return parts
+    
+    @staticmethod
+    def _fill(parts: List[Any], args: List[str]) -> str:
+        return "".join(
+            part if isinstance(part, str) else (args[part] if part < len(args) else "")
+            for part in parts
+        )
+    
+    def expand(self, args: List[str]) -> str:
+        return self._fill(self._parts, args)
+    
+    def expand_end(self) -> str:
+        return self._fill(self._end_parts, [])
+    
+    def read_args(self, text: str, pos: int, limit: Optional[int] = None
+                  ) -> Tuple[Optional[List[str]], int, Optional[Tuple[int, str]]]:
+        """
+        Read this macro's arguments at text[pos], like scan_latex_args, with
+        an optional [first] argument when the definition gives a default.
+        """
+        args: List[str] = []
+        required = self.arity
+        if self.default is not None and required:
+            optional = OPTIONAL_VALUE_RE.match(text, pos, limit if limit is not None else len(text))
+            if optional:
+                args.append(optional.group(1))
+                pos = optional.end()
+            else:
+                args.append(self.default)
+            required -= 1
+        if not required:
+            return args, pos, None
+        rest, end, error = scan_latex_args(text, pos, required, limit)
+        if rest is None:
+            return None, pos, error
+        return args + rest, end, None
+
+
+class MacroTable:
+    """
+    User macros defined with \newcommand / \newenvironment (and their
+    renew/provide variants), by name.
+
+    Parsers look up arities here instead of hardcoding them, and expand()
+    replaces every use of a user macro by its body in one scan, so text
+    using a newly defined macro needs no parser changes.
+    """
+    
+    def __init__(self):
+        self.commands: Dict[str, Macro] = {}
+        self.environments: Dict[str, Macro] = {}
+    
+    @classmethod
+    def from_text(cls, text: str, ctx: Optional[Context] = None) -> 'MacroTable':
+        """Compile every definition in a LaTeX source."""
+        table = cls()
+        text = COMMENT_RE.sub('', text)
+        pos = 0
+        while True:
+            match = DEFINITION_RE.search(text, pos)
+            if not match:
+                break
+            pos = match.end()
+            if match.group(1) == 'command':
+                name_match = COMMAND_NAME_RE.match(text, pos)
+                if not name_match:
+                    continue
+                name, pos = name_match.group(1), name_match.end()
+            else:
+                args, end, _ = scan_latex_args(text, pos, 1)
+                if args is None:
+                    continue
+                name, pos = args[0].strip(), end
+            
+            arity, default = 0, None
+            option = OPTIONAL_VALUE_RE.match(text, pos)
+            if option:
+                arity, pos = int(option.group(1) or 0), option.end()
+                option = OPTIONAL_VALUE_RE.match(text, pos)
+                if option:
+                    default, pos = option.group(1), option.end()
+            
+            bodies, end, error = scan_latex_args(text, pos, 2 if match.group(1) == 'environment' else 1)
+            if bodies is None:
+                if error is not None:
+                    _logger(ctx).warning("Could not read the body of macro %s: %s", name, error[1])
+                continue
+            pos = end
+            if match.group(1) == 'command':
+                table.commands[name] = Macro(name, arity, default, bodies[0])
+            else:
+                table.environments[name] = Macro(name, arity, default, bodies[0], bodies[1])
+        return table
+    
+    @classmethod
+    def load(cls, filepath: Optional[str] = None, ctx: Optional[Context] = None) -> 'MacroTable':
+        """Macro table of a file (default: the context's style/macros.tex); empty if unreadable."""
+        content = read_file_safe(filepath or (ctx or get_default_context()).macros_file, ctx=ctx)
+        return cls.from_text(content, ctx) if content else cls()
+    
+    def arity(self, name: str) -> Optional[int]:
+        """Number of arguments of a user command, or None if it is not defined."""
+        macro = self.commands.get(name)
+        return macro.arity if macro else None
+    
+    def expand(self, text: str, keep: Iterable[str] = (),
+               budget: Optional['ExpansionBudget'] = None, ctx: Optional[Context] = None) -> str:
+        """
+        Replace uses of user commands and environments by their bodies.
+        
+        Args:
+            text: LaTeX source
+            keep: Names (commands or environments) to leave in place, e.g.
+                structural macros a caller extracts itself
+            budget: Limits on nesting and total expansions (default: a
+                fresh ExpansionBudget); uses past them are left as written
+            ctx: Context whose logger reports a spent budget
+        """
+        keep = keep if isinstance(keep, (set, frozenset)) else frozenset(keep)
+        return self._expand(text, keep, budget or ExpansionBudget(ctx=ctx))
+    
+    def _expand(self, text: str, keep: Collection[str], budget: 'ExpansionBudget') -> str:
+        out: List[str] = []
+        pos = 0
+        while True:
+            match = CONTROL_RE.search(text, pos)
+            if not match:
+                out.append(text[pos:])
+                break
+            name = match.group(1)
+            out.append(text[pos:match.start()])
+            pos = match.end()
+            
+            if name in ('begin', 'end'):
+                env, env_end, _ = scan_latex_args(text, pos, 1)
+                macro = self.environments.get(env[0].strip()) if env is not None else None
+                if macro is None or macro.name in keep:
+                    out.append(match.group())
+                    continue
+                if name == 'end':
+                    out.append(self._expand_body(macro, macro.expand_end(), keep, budget)
+                               if budget.take(macro.name) else text[match.start():env_end])
+                    pos = env_end
+                    continue
+                args_start = env_end
+            else:
+                macro = self.commands.get(name) if name is not None and name not in keep else None
+                if macro is None:
+                    out.append(match.group())
+                    continue
+                args_start = pos
+            
+            args, end, _ = macro.read_args(text, args_start)
+            if args is None:
+                # Leave a malformed use as it is rather than guessing
+                out.append(match.group())
+                continue
+            out.append(self._expand_body(macro, macro.expand(args), keep, budget)
+                       if budget.take(macro.name) else text[match.start():end])
+            pos = end
+        return "".join(out)
+    
+    def _expand_body(self, macro: Macro, body: str, keep: Collection[str], budget: 'ExpansionBudget') -> str:
+        budget.depth += 1
+        try:
+            return self._expand(body, keep, budget)
+        finally:
+            budget.depth -= 1
+
+
+class ExpansionBudget:
+    """
+    Limits shared by every expansion made for one piece of text: how deep
+    macro bodies may nest and how many macro uses may be expanded in all.
+    
+    The total bounds the work even when each branch stays shallow, e.g.
+    \\newcommand{\\x}{a\\x\\x} doubles its uses at every level. Once either
+    limit is hit, one warning is logged and no further use is expanded.
+    """
+    
+    def __init__(self, max_depth: int = MAX_EXPANSION_DEPTH, max_expansions: int = MAX_EXPANSIONS,
+                 ctx: Optional[Context] = None):
+        self.logger = _logger(ctx)
+        self.max_depth = max_depth
+        self.max_expansions = max_expansions
+        self.remaining = max_expansions
+        self.depth = 0
+        self.exhausted = False
+    
+    def take(self, name: str) -> bool:
+        """Account for expanding one use of macro `name`; False once a limit is hit."""
+        if not self.exhausted and (self.depth >= self.max_depth or self.remaining <= 0):
+            self.exhausted = True
+            self.logger.warning("Stopped expanding \\%s: macros nested deeper than %d levels or expanded "
+                           "more than %d times (recursive definition?)",
+                           name, self.max_depth, self.max_expansions)
+        if self.exhausted:
+            return False
+        self.remaining -= 1
+        return True
+
+
+_macro_tables: Dict[Tuple[str, logging.Logger], MacroTable] = {}
+
+
+def get_macro_table(filepath: Optional[str] = None, ctx: Optional[Context] = None) -> MacroTable:
+    """
+    Shared MacroTable for a file (default: the context's), compiled on first
+    use. Tables are shared per file and logger, so compile warnings reach
+    the logger of the context that asked.
+    """
+    ctx = ctx or get_default_context()
+    key = (os.path.abspath(filepath or ctx.macros_file), ctx.logger)
+    with _cache_lock:
+        table = _macro_tables.get(key)
+    if table is None:
+        # Compile outside the lock; a racing thread's identical table may win
+        table = MacroTable.load(key[0], ctx)
+        with _cache_lock:
+            table = _macro_tables.setdefault(key, table)
+    return table
+
+
+# Meaning of \cventry's arguments by position; how many it takes comes
+# from its definition in style/macros.tex
+CVENTRY_FIELDS = ('title', 'tech', 'link', 'content')
+_warned_cventry_definitions: Set[Tuple[str, int, str]] = set()
+
+
+def cventry_fields(macro: Macro, args: List[str], ctx: Optional[Context] = None) -> Dict[str, str]:
+    """
+    Name the arguments of a \\cventry use by position (CVENTRY_FIELDS).
+    
+    A definition taking a different number of arguments is reported once:
+    arguments past the known fields are ignored and missing fields are "".
+    """
+    log = _logger(ctx)
+    if macro.arity != len(CVENTRY_FIELDS):
+        key = (log.name, macro.arity, macro.body)
+        with _cache_lock:
+            first = key not in _warned_cventry_definitions
+            _warned_cventry_definitions.add(key)
+        if first:
+            log.warning("\\cventry takes %d arguments but is read as %d (%s); "
+                           "update CVENTRY_FIELDS to match its definition",
+                           macro.arity, len(CVENTRY_FIELDS), ", ".join(CVENTRY_FIELDS))
+    fields: Dict[str, str] = dict.fromkeys(CVENTRY_FIELDS, "")
+    fields.update(zip(CVENTRY_FIELDS, args))
+    return fields
+
+
+def clean_latex_to_plain(text: str, macros: Optional[MacroTable] = None,
+                         ctx: Optional[Context] = None) -> str:
     """
     Convert LaTeX to plain text by removing/converting commands.
+    User macros (see MacroTable) are expanded first, so text using them
+    reduces to the standard commands handled here.
     Basic version - doesn't handle complex structures.
     """
-    # Remove comments
-    text = re.sub(r'%.*', '', text)
+    # Remove comments (but not escaped \%)
+    text = COMMENT_RE.sub('', text)
+    text = (macros if macros is not None else get_macro_table(ctx=ctx)).expand(text, ctx=ctx)
     
     # Convert common commands
     text = re.sub(r'\\textbf\{([^}]+)\}', r'\1', text)
@@ -201,75 +717,79 @@ def clean_latex_to_plain(text: str) -> str:
     text = re.sub(r'\\item', '', text)
     text = re.sub(r'\\textbar\{\}', '|', text)
     
-    # Remove environments
-    text = re.sub(r'\\begin\{[^}]+\}', '', text)
+    # Remove environments (and their [options])
+    text = re.sub(r'\\begin\{[^}]+\}(\[[^\]]*\])?', '', text)
     text = re.sub(r'\\end\{[^}]+\}', '', text)
     
+    # Unescape special characters
+    text = re.sub(r'\\([%&#_$])', r'\1', text)
+    
     # Clean whitespace
     text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
     
     return text.strip()
 
 
-def parse_cventry(text: str) -> List[Dict[str, str]]:
+def parse_cventry(text: str, filename: str = "<string>",
+                  macros: Optional[MacroTable] = None, ctx: Optional[Context] = None) -> List[Dict[str, str]]:
     """
     Parse all \\cventry commands from LaTeX text.
+    Malformed entries are skipped and logged with their line and column;
+    see LatexParser.parse_cventries.
     
     Args:
         text: LaTeX content containing cventry commands
+        filename: Name used in diagnostics
+        macros: Macro table (default: the context's style/macros.tex)
+        ctx: Context whose macros and logger to use (default: this repository)
     
     Returns:
         List of dicts with keys: title, tech, link_url, link_text, content
     """
+    log = _logger(ctx)
     if not text:
-        logger.warning("Empty text provided to parse_cventry")
+        log.warning("Empty text provided to parse_cventry")
         return []
     
-    entries = []
-    pos = 0
-    entry_num = 0
+    parser = LatexParser(text, filename, macros, ctx)
+    entries = parser.parse_cventries()
+    for error in parser.get_errors():
+        log.warning("%s", error)
     
-    while True:
-        match = re.search(r'\\cventry', text[pos:])
-        if not match:
-            break
-        
-        entry_num += 1
-        match_pos = pos + match.end()
-        
-        # Extract 4 arguments
-        args, end_pos = extract_latex_args(text, match_pos, 4)
-        
-        if args and len(args) == 4:
-            title, tech, link_content, content = args
-            
-            # Parse href from link if present
-            link_match = re.search(r'\\href\{([^}]+)\}\{([^}]+)\}', link_content)
-            if link_match:
-                url = link_match.group(1)
-                link_text = link_match.group(2)
-            else:
-                url = ""
-                link_text = link_content
-            
-            entries.append({
-                'title': title.strip(),
-                'tech': tech.strip(),
-                'link_url': url.strip(),
-                'link_text': link_text.strip(),
-                'content': content.strip()
-            })
-            pos = end_pos
-            logger.debug(f"Successfully parsed cventry #{entry_num}: {title}")
-        else:
-            # Failed to parse, skip this occurrence
-            logger.warning(f"Failed to parse cventry #{entry_num} at position {match_pos}")
-            pos = match_pos + 1
-    
-    logger.info(f"Parsed {len(entries)} cventry commands successfully")
+    log.debug("Parsed %d cventry commands successfully", len(entries))
     return entries
 
 
+def split_latex_list(text: str) -> List[str]:
+    """Split a comma-separated list, ignoring commas inside parentheses; parts are stripped."""
+    parts, depth, current = [], 0, []
+    for char in text:
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth = max(0, depth - 1)
+        elif char == ',' and depth == 0:
+            parts.append(''.join(current))
+            current = []
+            continue
+        current.append(char)
+    parts.append(''.join(current))
+    return [part.strip() for part in parts if part.strip()]
+
+
+def parse_skill_lines(text: str) -> List[Tuple[str, List[str]]]:
+    """
+    Parse the `\\textbf{Label:} a, b, c` lines of a skills section.
+    
+    Returns:
+        (label, items) pairs, still in LaTeX
+    """
+    return [
+        (match.group(1), split_latex_list(match.group(2)))
+        for match in SKILL_LINE_RE.finditer(COMMENT_RE.sub('', text))
+    ]
+
+
 def validate_url(url: str) -> bool:
     """Basic URL validation."""
     url_pattern = re.compile(
@@ -289,11 +809,42 @@ def validate_email(email: str) -> bool:
 
 
 class LatexParser:
-    """Enhanced LaTeX parser with error handling."""
+    """
+    Enhanced LaTeX parser with error handling.
     
-    def __init__(self, text: str):
+    Errors are collected rather than raised, as "file:line:col: message"
+    strings; positions come from a line-offset table built once per text.
+    """
+    
+    BOUNDARY_RE = re.compile(r'\\(cventry|section)(?![A-Za-z])')
+    HREF_RE = re.compile(r'\\href\{([^}]+)\}\{([^}]+)\}')
+    
+    def __init__(self, text: str, filename: str = "<string>", macros: Optional[MacroTable] = None,
+                 ctx: Optional[Context] = None):
         self.text = text
-        self.errors = []
+        self.filename = filename
+        self.ctx = ctx
+        self.logger = _logger(ctx)
+        self.macros = macros if macros is not None else get_macro_table(ctx=ctx)
+        self.errors: List[str] = []
+        self._line_offsets: Optional[List[int]] = None
+    
+    def position(self, offset: int) -> Tuple[int, int]:
+        """1-based (line, column) of a character offset."""
+        if self._line_offsets is None:
+            offsets = [0]
+            newline = self.text.find('\n')
+            while newline != -1:
+                offsets.append(newline + 1)
+                newline = self.text.find('\n', newline + 1)
+            self._line_offsets = offsets
+        line = bisect.bisect_right(self._line_offsets, offset)
+        return line, offset - self._line_offsets[line - 1] + 1
+    
+    def error(self, offset: int, message: str) -> None:
+        """Record an error at a character offset."""
+        line, column = self.position(offset)
+        self.errors.append(f"{self.filename}:{line}:{column}: {message}")
     
     def parse_section(self, section_name: str) -> Optional[str]:
         """Extract content from a specific section."""
@@ -303,6 +854,61 @@ class LatexParser:
             return match.group(1).strip()
         return None
     
+    def parse_cventries(self) -> List[Dict[str, str]]:
+        """
+        Parse every \\cventry, recovering from malformed ones.
+        
+        An entry's arguments may not extend past the next \\cventry or
+        \\section, so an unmatched brace costs one scan up to that
+        boundary and parsing resumes there: no region is scanned twice.
+        
+        Returns:
+            Successfully parsed entries (see parse_cventry); failures are
+            available from get_errors()
+        """
+        text = self.text
+        # Boundaries are found with comments blanked out (offsets unchanged),
+        # so a commented-out \cventry or \section cannot split an entry
+        boundaries = [(m.start(), m.end(), m.group(1))
+                      for m in self.BOUNDARY_RE.finditer(blank_comments(text))]
+        entries = []
+        cventry = self.macros.commands.get('cventry')
+        if cventry is None:
+            cventry = Macro('cventry', len(CVENTRY_FIELDS), None, '')
+        
+        for i, (start, end, command) in enumerate(boundaries):
+            if command != 'cventry':
+                continue
+            limit = boundaries[i + 1][0] if i + 1 < len(boundaries) else len(text)
+            args, _, error = cventry.read_args(text, end, limit)
+            if args is None:
+                if error is not None:
+                    self.error(error[0], f"\\cventry: {error[1]}")
+                continue
+            
+            fields = cventry_fields(cventry, args, self.ctx)
+            title, tech, content, link_content = fields['title'], fields['tech'], fields['content'], fields['link']
+            
+            # Parse href from link if present
+            link_match = self.HREF_RE.search(link_content)
+            if link_match:
+                url = link_match.group(1)
+                link_text = link_match.group(2)
+            else:
+                url = ""
+                link_text = link_content
+            
+            entries.append({
+                'title': title.strip(),
+                'tech': tech.strip(),
+                'link_url': url.strip(),
+                'link_text': link_text.strip(),
+                'content': content.strip()
+            })
+            self.logger.debug("Successfully parsed cventry #%d: %s", len(entries), title)
+        
+        return entries
+    
     def get_errors(self) -> List[str]:
         """Return any parsing errors encountered."""
         return self.errors
@@ -331,24 +937,48 @@ def get_file_info(filepath: str) -> Optional[Dict[str, Any]]:
             'modified': stat.st_mtime
         }
     except Exception as e:
-        logger.error(f"Error getting file info for {filepath}: {e}")
+        logger.error("Error getting file info for %s: %s", filepath, e)
         return None
 
 
-def get_summary_text() -> str:
+def iter_documents(source: str, ndjson: bool) -> Iterator[Tuple[int, Optional[Dict[str, Any]]]]:
+    """
+    Yield (line number, document) from a JSON file, an NDJSON file, or '-' for stdin.
+    Unparseable NDJSON lines yield (line number, None) so callers can count them.
+    """
+    stream = sys.stdin if source == '-' else open(source, 'r', encoding='utf-8')
+    try:
+        if not ndjson:
+            yield 1, json.load(stream)
+            return
+        for line_num, line in enumerate(stream, 1):
+            if not line.strip():
+                continue
+            try:
+                yield line_num, json.loads(line)
+            except json.JSONDecodeError as e:
+                logger.error("%s:%d: invalid JSON: %s", source, line_num, e)
+                yield line_num, None
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+def get_summary_text(filepath: Optional[str] = None, ctx: Optional[Context] = None) -> str:
     """
-    Parse summary text from sections/summary.tex.
+    Parse summary text from sections/summary.tex (or the given file).
     Returns the summary content without section header.
     Falls back to config.SUMMARY_TEXT if parsing fails.
     """
-    from config import SUMMARY_TEXT, SECTIONS_DIR
+    ctx = ctx or get_default_context()
+    log = ctx.logger
     
-    filepath = os.path.join(SECTIONS_DIR, "summary.tex")
-    content = read_file_safe(filepath)
+    filepath = filepath or ctx.path(ctx.config.SECTIONS_DIR, "summary.tex")
+    content = read_file_safe(filepath, ctx=ctx)
     
     if not content:
-        logger.warning(f"Could not read {filepath}, using fallback summary")
-        return SUMMARY_TEXT
+        log.warning("Could not read %s, using fallback summary", filepath)
+        return ctx.config.SUMMARY_TEXT
     
     # Remove section header and LaTeX commands
     # Pattern: \section{Summary} followed by \noindent and the actual text
@@ -358,9 +988,9 @@ def get_summary_text() -> str:
     if match:
         summary = match.group(1).strip()
         # Clean up LaTeX formatting
-        summary = clean_latex_to_plain(summary)
-        logger.debug(f"Parsed summary from {filepath}")
+        summary = clean_latex_to_plain(summary, get_macro_table(ctx=ctx), ctx)
+        log.debug("Parsed summary from %s", filepath)
         return summary
     else:
-        logger.warning(f"Could not parse summary from {filepath}, using fallback")
-        return SUMMARY_TEXT
+        log.warning("Could not parse summary from %s, using fallback", filepath)
+        return ctx.config.SUMMARY_TEXT
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Offline JSON Resume schema validation.
+The schema (resume_schema.json, JSON Resume v1.0.0) is compiled once into a
+tree of small checker functions - $refs resolved, patterns compiled - so
+validating a document is a plain walk with no schema interpretation. Works
+on a single document or an NDJSON batch and reports every violation with
+its path, e.g. $.projects[0].startDate.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Import configuration and utilities
+from config import OUTPUT_FILES
+from utils import (
+    logger, read_file_safe, iter_documents, validate_email,
+    add_logging_arguments, configure_logging_from_args, get_default_context
+)
+
+SCHEMA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resume_schema.json")
+
+# (path, message)
+Violation = Tuple[str, str]
+Checker = Callable[[Any, str, List[Violation]], None]
+
+IDENTIFIER_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+URI_RE = re.compile(r'^[A-Za-z][A-Za-z0-9+.-]*:[^\s]*$')
+
+TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    'string': lambda v: isinstance(v, str),
+    'object': lambda v: isinstance(v, dict),
+    'array': lambda v: isinstance(v, list),
+    'boolean': lambda v: isinstance(v, bool),
+    'integer': lambda v: isinstance(v, int) and not isinstance(v, bool),
+    'number': lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    'null': lambda v: v is None,
+}
+
+FORMAT_CHECKS: Dict[str, Callable[[str], bool]] = {
+    'email': validate_email,
+    'uri': lambda v: URI_RE.match(v) is not None,
+}
+
+
+def json_type(value: Any) -> str:
+    """JSON type name of a Python value, for error messages."""
+    for name in ('null', 'boolean', 'integer', 'number', 'string', 'array', 'object'):
+        if TYPE_CHECKS[name](value):
+            return name
+    return type(value).__name__
+
+
+def child_path(path: str, key: Any) -> str:
+    """Extend a JSONPath-style path with an object key or array index."""
+    if isinstance(key, int):
+        return f"{path}[{key}]"
+    if IDENTIFIER_RE.match(key):
+        return f"{path}.{key}"
+    return f"{path}[{json.dumps(key)}]"
+
+
+class SchemaCompiler:
+    """
+    Compile a JSON Schema (the draft-07 subset the resume schema uses) into
+    a checker function.
+
+    Supported keywords: $ref (local), type, enum, pattern, format,
+    properties, required, additionalProperties and items. Unknown keywords
+    are ignored, like annotations.
+    """
+
+    def __init__(self, root: Dict[str, Any]):
+        self.root = root
+        self._refs: Dict[str, Checker] = {}
+
+    def compile(self, node: Optional[Dict[str, Any]] = None) -> Checker:
+        node = self.root if node is None else node
+        if '$ref' in node:
+            return self._compile_ref(node['$ref'])
+
+        checks: List[Checker] = []
+        if 'type' in node:
+            checks.append(self._compile_type(node['type']))
+        if 'enum' in node:
+            checks.append(self._compile_enum(node['enum']))
+        if 'pattern' in node:
+            checks.append(self._compile_pattern(node['pattern']))
+        if node.get('format') in FORMAT_CHECKS:
+            checks.append(self._compile_format(node['format']))
+        if any(k in node for k in ('properties', 'required', 'additionalProperties')):
+            checks.append(self._compile_object(node))
+        if 'items' in node:
+            checks.append(self._compile_items(node['items']))
+
+        if len(checks) == 1:
+            return checks[0]
+
+        def check_all(value: Any, path: str, errors: List[Violation]) -> None:
+            for check in checks:
+                check(value, path, errors)
+        return check_all
+
+    def _compile_ref(self, ref: str) -> Checker:
+        if ref in self._refs:
+            return self._refs[ref]
+        if not ref.startswith('#/'):
+            raise ValueError(f"Only local $refs are supported: {ref}")
+
+        # Register a forwarding checker first so recursive schemas terminate
+        target: List[Checker] = []
+        self._refs[ref] = lambda value, path, errors: target[0](value, path, errors)
+        node = self.root
+        for part in ref[2:].split('/'):
+            node = node[part.replace('~1', '/').replace('~0', '~')]
+        target.append(self.compile(node))
+        self._refs[ref] = target[0]
+        return target[0]
+
+    @staticmethod
+    def _compile_type(types: Any) -> Checker:
+        names = [types] if isinstance(types, str) else list(types)
+        tests = [TYPE_CHECKS[name] for name in names]
+        expected = " or ".join(names)
+
+        def check_type(value: Any, path: str, errors: List[Violation]) -> None:
+            if not any(test(value) for test in tests):
+                errors.append((path, f"expected {expected}, got {json_type(value)}"))
+        return check_type
+
+    @staticmethod
+    def _compile_enum(options: List[Any]) -> Checker:
+        def check_enum(value: Any, path: str, errors: List[Violation]) -> None:
+            if value not in options:
+                errors.append((path, f"{value!r} is not one of {options!r}"))
+        return check_enum
+
+    @staticmethod
+    def _compile_pattern(pattern: str) -> Checker:
+        regex = re.compile(pattern)
+
+        def check_pattern(value: Any, path: str, errors: List[Violation]) -> None:
+            if isinstance(value, str) and not regex.search(value):
+                errors.append((path, f"{value!r} does not match {pattern}"))
+        return check_pattern
+
+    @staticmethod
+    def _compile_format(name: str) -> Checker:
+        test = FORMAT_CHECKS[name]
+
+        def check_format(value: Any, path: str, errors: List[Violation]) -> None:
+            if isinstance(value, str) and not test(value):
+                errors.append((path, f"{value!r} is not a valid {name}"))
+        return check_format
+
+    def _compile_object(self, node: Dict[str, Any]) -> Checker:
+        properties = {key: self.compile(sub) for key, sub in node.get('properties', {}).items()}
+        required = list(node.get('required', []))
+        additional = node.get('additionalProperties', True)
+        extra: Optional[Checker] = self.compile(additional) if isinstance(additional, dict) else None
+
+        def check_object(value: Any, path: str, errors: List[Violation]) -> None:
+            if not isinstance(value, dict):
+                return
+            for key in required:
+                if key not in value:
+                    errors.append((path, f"missing required property {key!r}"))
+            for key, item in value.items():
+                check = properties.get(key)
+                if check is not None:
+                    check(item, child_path(path, key), errors)
+                elif additional is False:
+                    errors.append((child_path(path, key), "unexpected property"))
+                elif extra is not None:
+                    extra(item, child_path(path, key), errors)
+        return check_object
+
+    def _compile_items(self, items: Dict[str, Any]) -> Checker:
+        check_item = self.compile(items)
+
+        def check_items(value: Any, path: str, errors: List[Violation]) -> None:
+            if isinstance(value, list):
+                for i, item in enumerate(value):
+                    check_item(item, f"{path}[{i}]", errors)
+        return check_items
+
+
+def load_schema(schema_file: str = SCHEMA_FILE) -> Dict[str, Any]:
+    """Load a JSON Schema file."""
+    content = read_file_safe(schema_file)
+    if content is None:
+        raise OSError(f"Could not read schema {schema_file}")
+    return json.loads(content)
+
+
+_validators: Dict[str, Checker] = {}
+_validators_lock = threading.Lock()
+
+
+def get_validator(schema_file: str = SCHEMA_FILE) -> Checker:
+    """
+    Compiled checker for a schema file, compiled on first use only.
+    Checkers hold no state, so one can be called from any thread.
+    """
+    with _validators_lock:
+        if schema_file not in _validators:
+            _validators[schema_file] = SchemaCompiler(load_schema(schema_file)).compile()
+        return _validators[schema_file]
+
+
+def validate_resume(resume: Any, schema_file: str = SCHEMA_FILE) -> List[Violation]:
+    """
+    Validate a JSON Resume document.
+
+    Returns:
+        (path, message) for every violation; empty if the document is valid
+    """
+    errors: List[Violation] = []
+    get_validator(schema_file)(resume, "$", errors)
+    return errors
+
+
+def validate_source(source: str, ndjson: Optional[bool] = None,
+                    schema_file: str = SCHEMA_FILE) -> Dict[str, int]:
+    """
+    Validate every document in a JSON / NDJSON file (or '-' for stdin),
+    logging each violation as source:line: path: message.
+
+    Returns:
+        Counts of valid, invalid and unparseable documents
+    """
+    if ndjson is None:
+        ndjson = source.endswith(('.ndjson', '.jsonl'))
+
+    check = get_validator(schema_file)
+    counts = {"valid": 0, "invalid": 0, "failed": 0}
+    for line_num, resume in iter_documents(source, ndjson):
+        if resume is None:
+            counts["failed"] += 1
+            continue
+        errors: List[Violation] = []
+        check(resume, "$", errors)
+        if not errors:
+            counts["valid"] += 1
+            continue
+        counts["invalid"] += 1
+        for path, message in errors:
+            logger.error("%s:%d: %s: %s", source, line_num, path, message)
+
+    logger.info("%s: %d valid, %d invalid, %d unparseable",
+                source, counts['valid'], counts['invalid'], counts['failed'])
+    return counts
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Validate JSON Resume documents against the schema offline")
+    parser.add_argument("sources", nargs="*",
+                        help=f"JSON Resume files, NDJSON streams, or - for stdin "
+                             f"(default: <repository>/{OUTPUT_FILES['json']})")
+    parser.add_argument("--ndjson", action="store_true", default=None,
+                        help="read one document per line (default for .ndjson/.jsonl)")
+    parser.add_argument("--schema", default=SCHEMA_FILE, help="JSON Schema file")
+    add_logging_arguments(parser)
+    args = parser.parse_args()
+    configure_logging_from_args(args)
+
+    ok = True
+    for source in args.sources or [get_default_context().path(OUTPUT_FILES['json'])]:
+        try:
+            counts = validate_source(source, args.ndjson, args.schema)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error("Could not read %s: %s", source, e)
+            ok = False
+            continue
+        ok = ok and not counts["invalid"] and not counts["failed"]
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the precompiled-format PDF build.
+Run with: python -m pytest tests/
+Or: python tests/test_build_pdf.py
+"""
+
+import sys
+import os
+import json
+import tempfile
+
+# Add parent directory to path to import scripts
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from build_pdf import (
+    get_preamble, compute_format_key, get_format_name, remove_stale_formats, evaluate_check,
+    attach_pass_timings, run_timed_pass, with_load_time_hooks, rank_load_times
+)
+
+
+def _write(path, content):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+def test_get_preamble():
+    """Test preamble extraction stops at \\begin{document}."""
+    text = "\\input{style/header.tex}\n\\begin{document}\nBody\n\\end{document}"
+    assert get_preamble(text) == "\\input{style/header.tex}\n"
+    assert get_preamble("no document") == "no document"
+
+
+def test_format_key_tracks_inputs():
+    """Test the format key changes with style files, preamble and TeX version."""
+    with tempfile.TemporaryDirectory() as tmp:
+        tex = os.path.join(tmp, 'cv.tex')
+        style = os.path.join(tmp, 'macros.tex')
+        _write(tex, "\\input{macros.tex}\n\\begin{document}\nOne\n\\end{document}")
+        _write(style, "\\newcommand{\\foo}{bar}")
+
+        key = compute_format_key(tex, [style], "pdfTeX 3.14")
+        assert key is not None
+
+        # Body edits do not invalidate the format
+        _write(tex, "\\input{macros.tex}\n\\begin{document}\nTwo\n\\end{document}")
+        assert compute_format_key(tex, [style], "pdfTeX 3.14") == key
+
+        assert compute_format_key(tex, [style], "pdfTeX 3.15") != key
+
+        _write(style, "\\newcommand{\\foo}{baz}")
+        assert compute_format_key(tex, [style], "pdfTeX 3.14") != key
+
+        assert compute_format_key(tex, [os.path.join(tmp, 'missing.tex')], "pdfTeX 3.14") is None
+
+
+def test_remove_stale_formats():
+    """Test stale formats are removed while the current one is kept."""
+    with tempfile.TemporaryDirectory() as tmp:
+        current = get_format_name('cv.tex', 'aaaa')
+        for name in [f'{current}.fmt', f'{current}.log', 'cv-bbbb.fmt', 'other-cccc.fmt']:
+            _write(os.path.join(tmp, name), '')
+
+        remove_stale_formats('cv.tex', tmp, keep=current)
+        assert sorted(os.listdir(tmp)) == [f'{current}.fmt', f'{current}.log', 'other-cccc.fmt']
+
+
+def test_evaluate_check():
+    """Test the check fails on errors, overfull boxes past tolerance and page overflow."""
+    clean = {'errors': [], 'overfull': [{'box': 'hbox', 'amount': 0.5, 'lines': [3, 3]}], 'pages': 1}
+    assert evaluate_check(clean, max_pages=1, overfull_tolerance=1.0) == []
+
+    broken = {
+        'errors': [{'file': './cv.tex', 'line': 9, 'message': 'Undefined control sequence.'}],
+        'overfull': [{'box': 'hbox', 'amount': 12.5, 'lines': [20, 22]}],
+        'pages': 2,
+    }
+    assert evaluate_check(broken, max_pages=1, overfull_tolerance=1.0) == [
+        'error: ./cv.tex:9: Undefined control sequence.',
+        'overfull hbox by 12.5pt at lines 20--22',
+        '2 pages, limit is 1',
+    ]
+    assert evaluate_check({'errors': [], 'overfull': [], 'pages': None})
+
+
+def test_pass_timings():
+    """Test timed engine passes are matched to latexmk's passes in order."""
+    with tempfile.TemporaryDirectory() as tmp:
+        timing_file = os.path.join(tmp, 'passes.jsonl')
+        assert run_timed_pass(timing_file, [sys.executable, '-c', 'pass']) == 0
+        assert run_timed_pass(timing_file, [sys.executable, '-c', 'raise SystemExit(3)']) == 3
+        with open(timing_file, encoding='utf-8') as f:
+            timings = [json.loads(line) for line in f]
+    assert [t['returncode'] for t in timings] == [0, 3]
+
+    passes = [
+        {'rule': 'pdflatex', 'run': 1, 'reasons': ['Initial setup']},
+        {'rule': 'bibtex cv', 'run': 1, 'reasons': []},
+        {'rule': 'pdflatex', 'run': 2, 'reasons': ['Changed files: cv.aux']},
+    ]
+    timed = attach_pass_timings(passes, timings, 'pdflatex')
+    assert [(p['run'], p['seconds'] is not None) for p in timed] == [(1, True), (1, False), (2, True)]
+    assert timed[2]['returncode'] == 3
+
+    # A timed pass latexmk's output did not announce is still reported
+    timed = attach_pass_timings(passes[:1], timings, 'pdflatex')
+    assert len(timed) == 2 and timed[1]['run'] is None and timed[1]['seconds'] == timings[1]['seconds']
+
+
+def test_load_time_hooks():
+    """Test the traced engine call keeps its jobname and ranks files by their own time."""
+    cmd = with_load_time_hooks(['pdflatex', '-interaction=nonstopmode', '-recorder', 'cv.tex'])
+    assert cmd[:4] == ['pdflatex', '-interaction=nonstopmode', '-recorder', '-jobname=cv']
+    assert cmd[4].startswith('\\AddToHook{file/before}') and cmd[4].endswith('\\input{cv.tex}')
+    assert with_load_time_hooks(['pdflatex', '-jobname=x', 'cv.tex'])[1:2] == ['-jobname=x']
+
+    ranked = rank_load_times([
+        {'file': 'cv.tex', 'seconds': None, 'self_seconds': None},
+        {'file': 'geometry.sty', 'seconds': 2.0, 'self_seconds': 0.5},
+        {'file': 'fontenc.sty', 'seconds': 1.0, 'self_seconds': 1.0},
+    ])
+    assert [entry['file'] for entry in ranked] == ['fontenc.sty', 'geometry.sty']
+
+
+TESTS = [
+    ("Preamble Extraction", test_get_preamble),
+    ("Format Cache Key", test_format_key_tracks_inputs),
+    ("Stale Format Cleanup", test_remove_stale_formats),
+    ("Check Thresholds", test_evaluate_check),
+    ("Pass Timings", test_pass_timings),
+    ("Load Time Hooks", test_load_time_hooks),
+]
+
+
+if __name__ == "__main__":
+    from test_utils import run_all_tests
+    sys.exit(0 if run_all_tests(TESTS, "PDF Build Tests") else 1)
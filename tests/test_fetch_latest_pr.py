@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Tests for latest-PR fetching against a local stub GitHub server.
+Run with: python -m pytest tests/
+Or: python tests/test_fetch_latest_pr.py
+"""
+
+import sys
+import os
+import json
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+# Add parent directory to path to import scripts
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+import fetch_latest_pr
+from fetch_latest_pr import (
+    get_latest_merged_pr_graphql, parse_graphql_pr, generate_latex_snippet,
+    get_cached_snippet_age, fetch_within_budget, write_snippet, FALLBACK_TEXT
+)
+
+GRAPHQL_RESPONSE = {
+    "data": {
+        "search": {
+            "nodes": [
+                {},
+                {
+                    "title": "Fix cache_key & retries",
+                    "url": "https://github.com/org/repo/pull/42",
+                    "repository": {"nameWithOwner": "org/repo"}
+                }
+            ]
+        }
+    }
+}
+
+
+class StubGraphQLServer:
+    """Serve a canned GraphQL response (JSON, or raw bytes) on localhost and record requests."""
+
+    def __init__(self, response):
+        self.requests = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                stub.requests.append(json.loads(self.rfile.read(length)))
+                body = response if isinstance(response, bytes) else json.dumps(response).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = HTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/graphql"
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@contextmanager
+def github_token(token):
+    """Temporarily set GITHUB_TOKEN."""
+    old_token = os.environ.get('GITHUB_TOKEN')
+    os.environ['GITHUB_TOKEN'] = token
+    try:
+        yield
+    finally:
+        if old_token is None:
+            del os.environ['GITHUB_TOKEN']
+        else:
+            os.environ['GITHUB_TOKEN'] = old_token
+
+
+def test_parse_graphql_pr():
+    """Test mapping of a GraphQL search response."""
+    pr = parse_graphql_pr(GRAPHQL_RESPONSE)
+    assert pr is not None
+    assert pr == {'title': 'Fix cache_key & retries', 'url': 'https://github.com/org/repo/pull/42',
+                  'repo': 'org/repo'}
+
+    assert parse_graphql_pr({"data": {"search": {"nodes": []}}}) is None
+
+
+def test_graphql_single_round_trip():
+    """Test the GraphQL backend makes one request and feeds the snippet generator."""
+    with github_token('test-token'), StubGraphQLServer(GRAPHQL_RESPONSE) as stub:
+        title, url, repo = get_latest_merged_pr_graphql(stub.url)
+
+    assert len(stub.requests) == 1
+    query = stub.requests[0]['query']
+    assert 'nameWithOwner' in query
+    for unused in ('mergedAt', 'additions', 'deletions', 'stargazerCount'):
+        assert unused not in query
+    assert 'is:merged' in stub.requests[0]['variables']['q']
+    assert title == r'Fix cache\_key \& retries'
+    assert url == 'https://github.com/org/repo/pull/42'
+    assert repo == 'org/repo'
+
+    snippet = generate_latex_snippet(title, url, repo)
+    assert r'\href{https://github.com/org/repo/pull/42}{org/repo}' in snippet
+
+
+def test_graphql_errors():
+    """Test GraphQL error payloads and non-JSON bodies yield no PR data."""
+    with github_token('test-token'), StubGraphQLServer({"errors": [{"message": "Bad credentials"}]}) as stub:
+        assert get_latest_merged_pr_graphql(stub.url) == (None, None, None)
+
+    # A non-JSON body is a hard failure, not retried like a network error
+    with github_token('test-token'), StubGraphQLServer(b'<html>Unicorn!</html>') as stub:
+        assert get_latest_merged_pr_graphql(stub.url) == (None, None, None)
+    assert len(stub.requests) == 1
+
+
+def test_cached_snippet_age():
+    """Test only real PR snippets count as a usable cache."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'latest_pr.tex')
+        assert get_cached_snippet_age(path) is None
+
+        assert write_snippet(FALLBACK_TEXT, path)
+        assert get_cached_snippet_age(path) is None
+
+        assert write_snippet(generate_latex_snippet('Title', 'https://x.y/pr/1', 'org/repo'), path)
+        old = time.time() - 3600
+        os.utime(path, (old, old))
+        age = get_cached_snippet_age(path)
+        assert age is not None and 3590 < age < 3700
+        assert not os.path.exists(path + '.tmp')
+
+
+def test_fetch_within_budget():
+    """Test the latency budget caps the wait on a slow fetch."""
+    pr = ('Title', 'https://x.y/pr/1', 'org/repo')
+    assert fetch_within_budget(1.0, lambda: pr) == pr
+
+    start = time.perf_counter()
+    assert fetch_within_budget(0.1, lambda: time.sleep(2) or pr) is None
+    assert time.perf_counter() - start < 1.0
+
+
+def test_swr_writes_before_refresh():
+    """Test a timed-out fetch writes the fallback before spawning the refresh."""
+    calls = []
+    patched = {
+        'get_cached_snippet_age': lambda: None,
+        'fetch_within_budget': lambda budget: None,
+        'write_snippet': lambda snippet: calls.append('write') or True,
+        'spawn_background_refresh': lambda: calls.append('refresh'),
+    }
+    saved = {name: getattr(fetch_latest_pr, name) for name in patched}
+    try:
+        for name, func in patched.items():
+            setattr(fetch_latest_pr, name, func)
+        fetch_latest_pr.main_swr(max_staleness=60, budget=0.1)
+    finally:
+        for name, func in saved.items():
+            setattr(fetch_latest_pr, name, func)
+    assert calls == ['write', 'refresh']
+
+
+TESTS = [
+    ("GraphQL Response Mapping", test_parse_graphql_pr),
+    ("GraphQL Single Round Trip", test_graphql_single_round_trip),
+    ("GraphQL Errors", test_graphql_errors),
+    ("Cached Snippet Age", test_cached_snippet_age),
+    ("Fetch Latency Budget", test_fetch_within_budget),
+    ("SWR Write Before Refresh", test_swr_writes_before_refresh),
+]
+
+
+if __name__ == "__main__":
+    from test_utils import run_all_tests
+    sys.exit(0 if run_all_tests(TESTS, "PR Fetch Tests") else 1)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the HTML / plain-text preview renderer.
+Run with: python -m pytest tests/
+Or: python tests/test_generate_html.py
+"""
+
+import sys
+import os
+import tempfile
+
+# Add parent directory to path to import scripts
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from generate_html import PreviewRenderer, HtmlRenderer, TextRenderer
+from utils import MacroTable
+
+FRAGMENT = r"""
+\section{Projects}
+\cventry{Cache \& Queue}{Java, Redis}{\href{https://github.com/u/p}{GitHub}}{
+\begin{itemizecompact}
+  \item Cut latency by 40\% with \textbf{batching}
+  \item Served <10ms p99
+\end{itemizecompact}
+}
+\section{Skills}
+\noindent\textbf{Languages:} Java\\[2pt]
+\noindent\textit{Tools:} Git \textbar{} Docker
+"""
+
+
+def test_html_renderer():
+    """Test structure, inline formatting and escaping in HTML output."""
+    rendered = HtmlRenderer().render(FRAGMENT)
+    assert rendered.count('<section>') == 2
+    assert '</section>' in rendered
+    assert '<strong>Cache &amp; Queue</strong>' in rendered
+    assert '<a href="https://github.com/u/p">GitHub</a>' in rendered
+    assert rendered.count('<li>') == 2 and rendered.count('</li>') == 2
+    assert '40% with <strong>batching</strong>' in rendered
+    assert 'Served &lt;10ms p99' in rendered
+    assert '<br>' in rendered
+    assert 'Git | Docker' in rendered
+    assert '\\' not in rendered
+
+
+def test_renderer_hooks_are_abstract():
+    """Test the shared walker cannot be used without a renderer's markup hooks."""
+    assert PreviewRenderer.__abstractmethods__ == {
+        'section', 'cventry', 'href', 'list_start', 'list_end', 'item_start', 'header'
+    }
+    renderer_class: type = PreviewRenderer
+    try:
+        renderer_class()
+    except TypeError as e:
+        assert 'section' in str(e)
+    else:
+        raise AssertionError("PreviewRenderer instantiated without its abstract hooks")
+
+
+def test_recursive_macro_stops():
+    """Test self-referencing user macros are cut off instead of recursing forever."""
+    macros = MacroTable.from_text(r"\newcommand{\loopy}{x\loopy}\newcommand{\x}{a\x\x}")
+    renderer = TextRenderer()
+    renderer.macros = macros
+    assert renderer.render(r"\loopy{} done") == 'x' * 32 + ' done'
+    assert renderer.budget.exhausted
+
+    renderer = TextRenderer()
+    renderer.macros = macros
+    assert renderer.render(r"\x") == 'a' * 32
+
+
+def test_text_renderer():
+    """Test plain-text output."""
+    rendered = TextRenderer().document(TextRenderer().render(FRAGMENT))
+    assert 'PROJECTS\n========' in rendered
+    assert 'Cache & Queue | Java, Redis | GitHub <https://github.com/u/p>' in rendered
+    assert '- Cut latency by 40% with batching' in rendered
+    assert '<' not in rendered.replace('<https://github.com/u/p>', '').replace('<10ms', '')
+
+
+def test_render_document():
+    """Test the full resume renders every section of cv.tex."""
+    page = HtmlRenderer().render_document()
+    assert page is not None
+    assert page.startswith('<!DOCTYPE html>')
+    for title in ('Summary', 'Projects', 'Open Source Contributions', 'Skills', 'Education'):
+        assert f'<h2>{title}</h2>' in page
+    assert page.count('class="cventry"') == 2
+
+
+def test_user_macros_expand():
+    """Test macros newly defined in style/macros.tex render without code changes."""
+    with tempfile.TemporaryDirectory() as tmp:
+        os.makedirs(os.path.join(tmp, 'style'))
+        with open(os.path.join(tmp, 'style', 'macros.tex'), 'w', encoding='utf-8') as f:
+            f.write("\\newcommand{\\metric}[2]{\\textbf{#1} #2}\n"
+                    "\\newenvironment{wins}{\\begin{itemize}}{\\end{itemize}}\n")
+        rendered = HtmlRenderer(tmp).render(
+            "\\begin{wins}\\item Cut p99 by \\metric{40\\%}{latency}\\end{wins}"
+        )
+    assert rendered.count('<ul>') == 1 and rendered.count('</ul>') == 1
+    assert 'Cut p99 by <strong>40%</strong> latency' in rendered
+
+
+TESTS = [
+    ("HTML Rendering", test_html_renderer),
+    ("Abstract Renderer Hooks", test_renderer_hooks_are_abstract),
+    ("Recursive Macro", test_recursive_macro_stops),
+    ("Plain Text Rendering", test_text_renderer),
+    ("Full Document Preview", test_render_document),
+    ("User Macro Expansion", test_user_macros_expand),
+]
+
+
+if __name__ == "__main__":
+    from test_utils import run_all_tests
+    sys.exit(0 if run_all_tests(TESTS, "Preview Renderer Tests") else 1)
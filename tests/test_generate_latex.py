@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the JSON Resume -> LaTeX generator.
+Run with: python -m pytest tests/
+Or: python tests/test_generate_latex.py
+"""
+
+import sys
+import os
+import json
+import shutil
+import argparse
+import tempfile
+
+# Add parent directory to path to import scripts
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from generate_latex import render_sections, render_projects, generate_latex, parse_shard
+from utils import parse_cventry, get_summary_text
+
+RESUME = {
+    "basics": {"name": "Jane Doe", "summary": "Engineer building 100% reliable systems."},
+    "projects": [
+        {
+            "name": "Cache_Service",
+            "keywords": ["Java", "Redis"],
+            "url": "https://github.com/jane/cache",
+            "highlights": ["Cut latency by 40%", "Handled {burst} traffic"]
+        },
+        {"name": "Notes", "keywords": [], "highlights": []}
+    ],
+    "skills": [{"name": "Languages & Tools", "keywords": ["Java", "C#"]}],
+    "education": [{"institution": "Uni", "studyType": "B.Tech", "area": "CS",
+                   "startDate": "2020", "endDate": "2024", "score": "9/10",
+                   "courses": ["OS", "DBMS"]}]
+}
+
+
+def test_projects_round_trip():
+    """Test rendered \\cventry blocks parse back with parse_cventry."""
+    entries = parse_cventry(render_projects(RESUME["projects"]))
+    assert len(entries) == 2
+    assert entries[0]['title'] == r'Cache\_Service'
+    assert entries[0]['tech'] == 'Java, Redis'
+    assert entries[0]['link_url'] == 'https://github.com/jane/cache'
+    assert r'40\%' in entries[0]['content']
+    assert r'\{burst\}' in entries[0]['content']
+    assert entries[1]['link_url'] == ''
+
+
+def test_render_sections():
+    """Test every section renders and escapes its text."""
+    sections = render_sections(RESUME)
+    assert set(sections) == {"summary", "projects", "skills", "education"}
+    assert r'\textbf{Languages \& Tools:} Java, C\#' in sections["skills"]
+    assert r'\textit{2020 - 2024}' in sections["education"]
+    assert r'\textit{B.Tech in CS}' in sections["education"]
+    assert r'100\% reliable' in sections["summary"]
+
+    empty = render_sections({})
+    assert all(r'\section' not in content for content in empty.values())
+
+
+def test_generate_latex_ndjson():
+    """Test NDJSON batches write one tree per document and count bad lines."""
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'resumes.ndjson')
+        with open(source, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(RESUME) + '\n')
+            f.write(json.dumps(RESUME) + '\n')
+            f.write('{not json\n')
+            f.write(json.dumps({"basics": {}}) + '\n')
+
+        out = os.path.join(tmp, 'out')
+        counts = generate_latex(source, out)
+        assert counts == {"generated": 3, "skipped": 0, "failed": 1}
+        assert sorted(os.listdir(out)) == ['jane-doe', 'jane-doe-2', 'resume-4']
+
+        summary_file = os.path.join(out, 'jane-doe', 'sections', 'summary.tex')
+        assert get_summary_text(summary_file).startswith('Engineer building')
+
+
+def _person(name):
+    return dict(RESUME, basics={"name": name})
+
+
+def test_journal_resume_and_shards():
+    """Test restarts skip journaled trees and shards partition the input."""
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'resumes.ndjson')
+        people = ['Ann', 'Bob', 'Ann', 'Cy', 'Di']
+        with open(source, 'w', encoding='utf-8') as f:
+            f.writelines(json.dumps(_person(name)) + '\n' for name in people)
+
+        out = os.path.join(tmp, 'out')
+        journal = os.path.join(tmp, 'progress.jsonl')
+        assert generate_latex(source, out, journal_file=journal) == {"generated": 5, "skipped": 0, "failed": 0}
+
+        # Simulate an interruption: the last journal record torn mid-write and a lost tree
+        with open(journal, 'r+b') as f:
+            f.truncate(os.path.getsize(journal) - 20)
+        shutil.rmtree(os.path.join(out, 'ann-2'))
+        # ...and an edited input document
+        lines = open(source, encoding='utf-8').read().splitlines()
+        lines[1] = json.dumps(dict(_person('Bob'), projects=[]))
+        with open(source, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+
+        assert generate_latex(source, out, journal_file=journal) == {"generated": 3, "skipped": 2, "failed": 0}
+        # The torn fragment must not swallow the records appended after it
+        assert generate_latex(source, out, journal_file=journal) == {"generated": 0, "skipped": 5, "failed": 0}
+
+        sharded = os.path.join(tmp, 'sharded')
+        trees = []
+        for i in (1, 2):
+            generate_latex(source, sharded, shard=(i, 2))
+            trees.append(sorted(os.listdir(sharded)))
+        assert trees[0] == ['ann', 'ann-2', 'di']
+        assert trees[1] == ['ann', 'ann-2', 'bob', 'cy', 'di']
+
+    assert parse_shard('2/4') == (2, 4)
+    for bad in ('0/4', '5/4', 'x', '1/2/3'):
+        try:
+            parse_shard(bad)
+        except argparse.ArgumentTypeError:
+            continue
+        raise AssertionError(f"{bad} accepted")
+
+
+TESTS = [
+    ("Projects Round Trip", test_projects_round_trip),
+    ("Section Rendering", test_render_sections),
+    ("NDJSON Batch", test_generate_latex_ndjson),
+    ("Journal and Shards", test_journal_resume_and_shards),
+]
+
+
+if __name__ == "__main__":
+    from test_utils import run_all_tests
+    sys.exit(0 if run_all_tests(TESTS, "LaTeX Generator Tests") else 1)
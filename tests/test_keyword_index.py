@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the inverted keyword index.
+Run with: python -m pytest tests/
+Or: python tests/test_keyword_index.py
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+
+# Add parent directory to path to import scripts
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from keyword_index import KeywordIndex, normalize_keyword, split_keywords, extract_skill_keywords
+
+
+def _make_tree(root, name, projects, skills):
+    sections = os.path.join(root, name, 'sections')
+    os.makedirs(sections, exist_ok=True)
+    with open(os.path.join(sections, 'projects.tex'), 'w', encoding='utf-8') as f:
+        for title, tech in projects:
+            f.write(f"\\cventry{{{title}}}{{{tech}}}{{}}{{Details}}\n")
+    with open(os.path.join(sections, 'skills.tex'), 'w', encoding='utf-8') as f:
+        f.write(f"\\section{{Skills}}\n\\noindent\\textbf{{Tools:}} {skills}\n")
+    return os.path.join(root, name)
+
+
+def test_keyword_normalization():
+    """Test keywords are normalized and split consistently."""
+    assert normalize_keyword(r'  Spring  Boot ') == 'spring boot'
+    assert normalize_keyword(r'Tools \& More') == 'tools & more'
+    assert split_keywords('Java, CI/CD (GitHub Actions, Jenkins), C++') == [
+        'java', 'ci/cd (github actions, jenkins)', 'c++'
+    ]
+    skills = r"\noindent\textbf{Languages:} Java, Python\\[2pt]" "\n" r"\noindent\textbf{DB:} Redis"
+    assert extract_skill_keywords(skills) == ['java', 'python', 'redis']
+
+
+def test_index_queries():
+    """Test AND/OR queries at resume and project level."""
+    with tempfile.TemporaryDirectory() as tmp:
+        alice = _make_tree(tmp, 'alice', [('Api', 'Spring Boot, Redis')], 'Git')
+        bob = _make_tree(tmp, 'bob', [('Api', 'Spring Boot'), ('Cache', 'Redis')], 'Docker')
+        carol = _make_tree(tmp, 'carol', [('Web', 'React')], 'Redis')
+
+        index = KeywordIndex()
+        assert index.update([tmp]) == {'indexed': 3, 'unchanged': 0, 'removed': 0}
+
+        assert index.query(['spring boot', 'REDIS'], scope='projects') == [alice, bob]
+        assert index.query(['Spring Boot', 'Redis'], level='project') == [f"{alice}::1"]
+        assert index.project_title(f"{alice}::1") == 'api'
+        assert index.query(['redis'], level='project') == [f"{alice}::1", f"{bob}::2"]
+        assert index.query(['react', 'docker'], mode='or') == [bob, carol]
+        assert index.query(['redis'], scope='skills') == [carol]
+        assert index.query(['cobol']) == []
+
+
+def test_incremental_update_and_persistence():
+    """Test only changed trees are re-indexed and removed trees are dropped."""
+    with tempfile.TemporaryDirectory() as tmp:
+        alice = _make_tree(tmp, 'alice', [('Api', 'Java')], 'Git')
+        bob = _make_tree(tmp, 'bob', [('Api', 'Go')], 'Git')
+
+        index = KeywordIndex()
+        index.update([tmp])
+        index_file = os.path.join(tmp, 'index.sqlite')
+        assert index.save(index_file)
+
+        index = KeywordIndex.load(index_file)
+        assert index.query(['java']) == [alice]
+        assert index.update([tmp]) == {'indexed': 0, 'unchanged': 2, 'removed': 0}
+
+        _make_tree(tmp, 'alice', [('Api', 'Rust, Kotlin')], 'Git')
+        shutil.rmtree(bob)
+        assert index.update([tmp]) == {'indexed': 1, 'unchanged': 0, 'removed': 1}
+        assert index.query(['java']) == []
+        assert index.query(['go']) == []
+        assert index.query(['rust']) == [alice]
+        assert 'java' not in index.to_dict()['postings']['projects']
+        assert index.save()
+
+        # Unsaved changes are not persisted
+        _make_tree(tmp, 'alice', [('Api', 'Java')], 'Git')
+        assert index.update([tmp])['indexed'] == 1
+        index.close()
+        index = KeywordIndex.load(index_file)
+        assert index.query(['java']) == [] and index.query(['rust']) == [alice]
+
+
+def test_tree_ids_are_absolute():
+    """Test the same trees reached through different paths are indexed once."""
+    with tempfile.TemporaryDirectory() as tmp:
+        alice = _make_tree(tmp, 'corpus/alice', [('Api', 'Java')], 'Git')
+        index = KeywordIndex()
+        cwd = os.getcwd()
+        try:
+            os.chdir(tmp)
+            assert index.update(['corpus'])['indexed'] == 1
+        finally:
+            os.chdir(cwd)
+        assert index.update([os.path.join(tmp, 'corpus')]) == {'indexed': 0, 'unchanged': 1, 'removed': 0}
+        assert index.query(['java']) == [os.path.abspath(alice)]
+
+
+def test_unreadable_index_is_rebuilt():
+    """Test an index file that is not a current SQLite index starts over empty."""
+    with tempfile.TemporaryDirectory() as tmp:
+        index_file = os.path.join(tmp, 'index.sqlite')
+        with open(index_file, 'w') as f:
+            f.write('{"version": 2, "trees": {}}')
+        index = KeywordIndex.load(index_file)
+        assert index.stats() == {'trees': 0, 'keywords': 0}
+
+
+def test_duplicate_project_titles():
+    """Test projects with the same title are indexed separately."""
+    with tempfile.TemporaryDirectory() as tmp:
+        tree = _make_tree(tmp, 'alice', [('Api', 'Java'), ('Api', 'Go')], 'Git')
+        index = KeywordIndex()
+        index.update([tmp])
+        assert index.query(['java'], level='project') == [f"{tree}::1"]
+        assert index.query(['go'], level='project') == [f"{tree}::2"]
+        assert index.query(['java', 'go'], level='project') == []
+
+        index_file = os.path.join(tmp, 'index.sqlite')
+        assert index.save(index_file)
+        index = KeywordIndex.load(index_file)
+        _make_tree(tmp, 'alice', [('Api', 'Java')], 'Git')
+        assert index.update([tmp])['indexed'] == 1
+        assert index.query(['go']) == [] and 'go' not in index.to_dict()['project_postings']
+        assert index.query(['java'], level='project') == [f"{tree}::1"]
+
+
+def test_parallel_update():
+    """Test parsing trees on a thread pool builds the same index."""
+    with tempfile.TemporaryDirectory() as tmp:
+        for i in range(12):
+            _make_tree(tmp, f't{i:02d}', [('Api', f'Java, Lang{i % 3}'), (f'P{i}', 'Redis')], f'Git, Tool{i}')
+
+        serial, parallel = KeywordIndex(), KeywordIndex()
+        assert serial.update([tmp]) == parallel.update([tmp], jobs=4)
+        assert parallel.to_dict() == serial.to_dict()
+        assert parallel.update([tmp], jobs=4) == {'indexed': 0, 'unchanged': 12, 'removed': 0}
+
+
+TESTS = [
+    ("Keyword Normalization", test_keyword_normalization),
+    ("Index Queries", test_index_queries),
+    ("Incremental Update", test_incremental_update_and_persistence),
+    ("Absolute Tree Ids", test_tree_ids_are_absolute),
+    ("Unreadable Index", test_unreadable_index_is_rebuilt),
+    ("Duplicate Project Titles", test_duplicate_project_titles),
+    ("Parallel Update", test_parallel_update),
+]
+
+
+if __name__ == "__main__":
+    from test_utils import run_all_tests
+    sys.exit(0 if run_all_tests(TESTS, "Keyword Index Tests") else 1)
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Unit tests for TeX log parsing.
+Run with: python -m pytest tests/
+Or: python tests/test_latex_log.py
+"""
+
+import sys
+import os
+
+# Add parent directory to path to import scripts
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from latex_log import parse_log, parse_fls, summarize_inputs, parse_latexmk_output
+
+LOG = r"""This is pdfTeX, Version 3.141592653-2.6-1.40.25 (TeX Live 2023) (preloaded format=pdflatex 2023.5.1)
+entering extended mode
+(./cv.tex
+LaTeX2e <2022-11-01> patch level 1
+(./sections/projects.tex
+./sections/projects.tex:14: Undefined control sequence.
+l.14 \cvenrty
+             {Cache}{Java}{}{
+Overfull \hbox (12.5pt too wide) in paragraph at lines 20--22
+[]\OT1/cmr/m/n/10 Some very long line
+ []
+
+Overfull \hbox (0.3pt too wide) in paragraph at lines 30--30
+[]
+)
+Overfull \vbox (4.0pt too high) has occurred while \output is active []
+
+! Missing $ inserted.
+<inserted text>
+                $
+l.41 a_b
+
+[1{/usr/share/texlive/texmf-dist/fonts/map/pdftex/updmap/pdftex.map}] [2]
+Pages shipped: 2
+ )
+"""
+
+
+def test_parse_errors():
+    """Test file:line errors and "!" errors with their l.<n> location."""
+    errors = parse_log(LOG.splitlines(True))['errors']
+    assert errors == [
+        {'file': './sections/projects.tex', 'line': 14, 'message': 'Undefined control sequence.'},
+        {'file': None, 'line': 41, 'message': 'Missing $ inserted.'},
+    ]
+
+
+def test_parse_overfull_and_pages():
+    """Test overfull boxes keep amounts and source lines, and pages are read."""
+    log = parse_log(LOG.splitlines(True))
+    assert log['overfull'] == [
+        {'box': 'hbox', 'amount': 12.5, 'lines': [20, 22]},
+        {'box': 'hbox', 'amount': 0.3, 'lines': [30, 30]},
+        {'box': 'vbox', 'amount': 4.0, 'lines': None},
+    ]
+    assert log['pages'] == 2
+
+    assert parse_log(["Output written on cv.pdf (1 page, 61234 bytes).\n"])['pages'] == 1
+    assert parse_log(["No pages of output.\n"])['pages'] == 0
+    assert parse_log(["! Emergency stop.\n", "<*> cv.tex\n"] + ["\n"] * 10)['pages'] is None
+
+
+def test_parse_warnings():
+    """Test warnings are collected with their continuation lines and input line."""
+    log = parse_log([
+        "LaTeX Warning: Label(s) may have changed. Rerun to get cross-references right.\n",
+        "Package hyperref Warning: Token not allowed in a PDF string (Unicode):\n",
+        "(hyperref)                removing `math shift' on input line 12.\n",
+        "\n",
+        "LaTeX Font Warning: Font shape `OT1/cmr/bx/sc' undefined\n",
+        "(Font)              using `OT1/cmr/bx/n' instead on input line 5.\n",
+        "(./sections/skills.tex)\n",
+    ])
+    assert log['warnings'] == [
+        {'source': 'LaTeX', 'line': None,
+         'message': 'Label(s) may have changed. Rerun to get cross-references right.'},
+        {'source': 'Package hyperref', 'line': 12,
+         'message': "Token not allowed in a PDF string (Unicode): removing `math shift' on input line 12."},
+        {'source': 'LaTeX Font', 'line': 5,
+         'message': "Font shape `OT1/cmr/bx/sc' undefined using `OT1/cmr/bx/n' instead on input line 5."},
+    ]
+
+
+
+def test_warning_before_file_trace():
+    """Test file-open trace lines after a warning are not read as its continuation."""
+    log = parse_log([
+        "LaTeX Warning: Reference `fig' on page 1 undefined on input line 3.\n",
+        "(./sections/experience.tex) (./sections/skills.tex [1]\n",
+        "Package hyperref Warning: Token not allowed in a PDF string (Unicode):\n",
+        "(./sections/education.tex)\n",
+        "Overfull \\hbox (2.0pt too wide) in paragraph at lines 7--7\n",
+        "Pages shipped: 1\n",
+    ])
+    assert [w['message'] for w in log['warnings']] == [
+        "Reference `fig' on page 1 undefined on input line 3.",
+        "Token not allowed in a PDF string (Unicode):",
+    ]
+    assert log['overfull'] == [{'box': 'hbox', 'amount': 2.0, 'lines': [7, 7]}]
+    assert log['pages'] == 1
+
+
+def test_parse_load_times():
+    """Test load time markers give per-file time with and without nested files."""
+    log = parse_log([
+        "Load time: begin cv.tex 0\n",
+        "Load time: begin geometry.sty 65536\n",
+        "Load time: begin keyval.sty 98304\n",
+        "Load time: end keyval.sty 131072\n",
+        "Load time: end geometry.sty 196608\n",
+        "Load time: begin sections/skills.tex 196608\n",
+        "Load time: end sections/skills.tex 212992\n",
+    ])
+    assert log['load_times'] == [
+        {'file': 'cv.tex', 'seconds': None, 'self_seconds': None},
+        {'file': 'geometry.sty', 'seconds': 2.0, 'self_seconds': 1.5},
+        {'file': 'keyval.sty', 'seconds': 0.5, 'self_seconds': 0.5},
+        {'file': 'sections/skills.tex', 'seconds': 0.25, 'self_seconds': 0.25},
+    ]
+
+
+def test_parse_fls():
+    """Test recorder files are deduplicated and made relative to the compile directory."""
+    fls = parse_fls([
+        "PWD /home/u/resume\n",
+        "INPUT /usr/share/texmf-dist/tex/latex/base/article.cls\n",
+        "INPUT ./cv.tex\n",
+        "INPUT /home/u/resume/style/header.tex\n",
+        "INPUT /usr/share/texmf-dist/tex/latex/geometry/geometry.sty\n",
+        "INPUT cv.tex\n",
+        "OUTPUT cv.log\n",
+    ])
+    assert fls['inputs'] == [
+        '/usr/share/texmf-dist/tex/latex/base/article.cls', 'cv.tex',
+        os.path.join('style', 'header.tex'), '/usr/share/texmf-dist/tex/latex/geometry/geometry.sty',
+    ]
+    assert fls['outputs'] == ['cv.log']
+
+    summary = summarize_inputs(fls['inputs'])
+    assert summary['count'] == 4
+    assert summary['by_extension'] == {'.tex': 2, '.cls': 1, '.sty': 1}
+    assert summary['classes'] == ['article'] and summary['packages'] == ['geometry']
+    assert summary['project'] == ['cv.tex', os.path.join('style', 'header.tex')]
+
+
+LATEXMK_OUTPUT = """Latexmk: This is Latexmk, John Collins, 4.83
+Latexmk: applying rule 'pdflatex'...
+Rule 'pdflatex':  Reasons for rerun
+Category 'other':
+  Rerun of 'pdflatex' forced or previously required:
+    Reason or flag: 'Initial setup'
+
+------------
+Run number 1 of rule 'pdflatex'
+------------
+------------
+Running 'pdflatex  -interaction=nonstopmode -recorder  "cv.tex"'
+------------
+This is pdfTeX, Version 3.141592653
+Transcript written on cv.log.
+Latexmk: Getting log file 'cv.log'
+Rule 'pdflatex': File changes, etc:
+   Changed files, or newly in use since previous run(s):
+      'cv.aux'
+      'cv.out'
+------------
+Run number 2 of rule 'pdflatex'
+------------
+Latexmk: All targets (cv.pdf) are up-to-date
+"""
+
+
+def test_parse_latexmk_output():
+    """Test passes and rerun reasons in both latexmk output styles."""
+    assert parse_latexmk_output(LATEXMK_OUTPUT.splitlines(True)) == [
+        {'rule': 'pdflatex', 'run': 1,
+         'reasons': ["Rerun of 'pdflatex' forced or previously required: Reason or flag: 'Initial setup'"]},
+        {'rule': 'pdflatex', 'run': 2,
+         'reasons': ['Changed files, or newly in use since previous run(s): cv.aux, cv.out']},
+    ]
+    assert parse_latexmk_output(["Latexmk: All targets (cv.pdf) are up-to-date\n"]) == []
+
+
+TESTS = [
+    ("Log Errors", test_parse_errors),
+    ("Overfull Boxes and Pages", test_parse_overfull_and_pages),
+    ("Log Warnings", test_parse_warnings),
+    ("Warning Before File Trace", test_warning_before_file_trace),
+    ("Load Times", test_parse_load_times),
+    ("Recorder File List", test_parse_fls),
+    ("Latexmk Passes", test_parse_latexmk_output),
+]
+
+
+if __name__ == "__main__":
+    from test_utils import run_all_tests
+    sys.exit(0 if run_all_tests(TESTS, "LaTeX Log Tests") else 1)
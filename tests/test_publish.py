@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Unit tests for artifact publishing.
+Run with: python -m pytest tests/
+Or: python tests/test_publish.py
+"""
+
+import sys
+import os
+import gzip
+import io
+import json
+import tempfile
+
+# Add parent directory to path to import scripts
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from publish import publish_file, precompress, publish, file_sha256
+from utils import configure_logging
+
+
+def _write(path, data):
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def test_publish_file_skips_identical():
+    """Test identical artifacts are not rewritten and changed ones are."""
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, 'cv.pdf')
+        dest = os.path.join(tmp, 'docs', 'index.pdf')
+        _write(src, b'%PDF-one')
+
+        assert publish_file(src, dest) == "copied"
+        mtime = os.stat(dest).st_mtime_ns
+        assert publish_file(src, dest) == "unchanged"
+        assert os.stat(dest).st_mtime_ns == mtime
+
+        _write(src, b'%PDF-two')
+        assert publish_file(src, dest, link=True) == "linked"
+        assert file_sha256(dest) == file_sha256(src)
+
+        assert publish_file(os.path.join(tmp, 'missing.pdf'), dest) is None
+
+
+def test_precompress_is_deterministic():
+    """Test .gz siblings round-trip and are stable across runs."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'resume.json')
+        _write(path, b'{"basics": {"name": "Test"}}' * 20)
+
+        encodings = precompress(path)
+        with open(path + '.gz', 'rb') as f:
+            first = f.read()
+        assert gzip.decompress(first) == b'{"basics": {"name": "Test"}}' * 20
+        assert encodings["gzip"] == {"file": "resume.json.gz", "size": len(first)}
+
+        precompress(path)
+        with open(path + '.gz', 'rb') as f:
+            assert f.read() == first
+
+
+def test_publish_manifest():
+    """Test the manifest lists hashes, versions and encodings."""
+    with tempfile.TemporaryDirectory() as tmp:
+        docs = os.path.join(tmp, 'docs')
+        src = os.path.join(tmp, 'cv.pdf')
+        resume = os.path.join(docs, 'resume.json')
+        manifest_file = os.path.join(docs, 'manifest.json')
+        _write(src, b'%PDF')
+        os.makedirs(docs)
+        _write(resume, b'{}')
+
+        artifacts = {src: os.path.join(docs, 'index.pdf'), resume: resume}
+        assert publish(artifacts, [resume], manifest_file)
+
+        with open(manifest_file) as f:
+            manifest = json.load(f)
+        entry = manifest["files"]["index.pdf"]
+        assert entry["sha256"] == file_sha256(src)
+        assert entry["version"] == entry["sha256"][:12]
+        assert "gzip" in manifest["files"]["resume.json"]["encodings"]
+
+        assert not publish({os.path.join(tmp, 'missing.pdf'): os.path.join(docs, 'x.pdf')}, [], manifest_file)
+
+
+def test_publish_quiet():
+    """Test quiet mode silences the per-artifact lines."""
+    stream = io.StringIO()
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, 'cv.pdf')
+        resume = os.path.join(tmp, 'docs', 'resume.json')
+        _write(src, b'%PDF')
+        os.makedirs(os.path.dirname(resume))
+        _write(resume, b'{}')
+        try:
+            configure_logging(quiet=True, stream=stream)
+            assert publish({src: os.path.join(tmp, 'docs', 'index.pdf')}, [resume],
+                           os.path.join(tmp, 'docs', 'manifest.json'))
+        finally:
+            configure_logging()
+    assert "✓" not in stream.getvalue()
+
+
+TESTS = [
+    ("Skip Identical Artifacts", test_publish_file_skips_identical),
+    ("Deterministic Precompression", test_precompress_is_deterministic),
+    ("Publish Manifest", test_publish_manifest),
+    ("Quiet Publishing", test_publish_quiet),
+]
+
+
+if __name__ == "__main__":
+    from test_utils import run_all_tests
+    sys.exit(0 if run_all_tests(TESTS, "Publishing Tests") else 1)
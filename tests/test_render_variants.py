@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Unit tests for resume variant rendering.
+Run with: python -m pytest tests/
+Or: python tests/test_render_variants.py
+"""
+
+import sys
+import os
+import tempfile
+
+# Add parent directory to path to import scripts
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from render_variants import render_variant_tex, validate_variant
+from generate_json import build_resume_data
+
+BASE_TEX = r"""\input{style/header.tex}
+\begin{document}
+\makeheader
+
+% Sections
+\input{sections/summary.tex}
+\input{sections/projects.tex}
+% keep me
+\input{sections/skills.tex}
+
+\end{document}
+"""
+
+
+def test_render_variant_tex():
+    """Test section inputs are replaced in the requested order."""
+    tex = render_variant_tex(BASE_TEX, ["skills", "summary"])
+    assert "\\input{sections/projects.tex}" not in tex
+    assert tex.index("sections/skills.tex") < tex.index("sections/summary.tex")
+    assert tex.index("\\makeheader") < tex.index("sections/skills.tex")
+    assert tex.index("sections/summary.tex") < tex.index("\\end{document}")
+    assert "% keep me" in tex
+    assert "\\input{style/header.tex}" in tex
+
+    overridden = render_variant_tex(BASE_TEX, ["summary"], {"summary": "variants/short_summary.tex"})
+    assert "\\input{variants/short_summary.tex}" in overridden
+    assert "sections/summary.tex" not in overridden
+
+
+def test_render_variant_tex_requires_inputs():
+    """Test a base document without section inputs is rejected."""
+    try:
+        render_variant_tex("\\begin{document}\\end{document}", ["summary"])
+    except ValueError:
+        return
+    assert False, "Expected ValueError"
+
+
+def test_validate_variant():
+    """Test variant spec validation."""
+    assert validate_variant("ok", {"sections": ["summary", "projects"]}) == []
+    assert validate_variant("empty", {"sections": []}) != []
+    assert validate_variant("missing", {"sections": ["does_not_exist"]}) != []
+    assert validate_variant("unused", {"sections": ["summary"], "overrides": {"skills": "x.tex"}}) != []
+    assert validate_variant("json-fixed", {"sections": ["education"], "overrides": {"education": "x.tex"}}) != []
+
+
+def test_skills_override_reaches_json():
+    """Test a variant's skills override is what its JSON Resume lists."""
+    with tempfile.TemporaryDirectory() as tmp:
+        skills_file = os.path.join(tmp, "skills.tex")
+        with open(skills_file, "w") as f:
+            f.write("\\section{Skills}\n"
+                    "\\noindent\\textbf{Languages:} Go, Rust % not OCaml\\\\[2pt]\n"
+                    "\\noindent\\textbf{Ops \\& Tools:} Kubernetes, CI/CD (GitHub Actions, Jenkins)\n")
+        data = build_resume_data(["skills"], {"skills": skills_file})
+    assert data["skills"] == [
+        {"name": "Languages", "level": "", "keywords": ["Go", "Rust"]},
+        {"name": "Ops & Tools", "level": "", "keywords": ["Kubernetes", "CI/CD (GitHub Actions, Jenkins)"]},
+    ]
+
+
+TESTS = [
+    ("Variant Root Rendering", test_render_variant_tex),
+    ("Variant Without Inputs", test_render_variant_tex_requires_inputs),
+    ("Variant Validation", test_validate_variant),
+    ("Skills Override In JSON", test_skills_override_reaches_json),
+]
+
+
+if __name__ == "__main__":
+    from test_utils import run_all_tests
+    sys.exit(0 if run_all_tests(TESTS, "Variant Rendering Tests") else 1)
@@ -15,6 +15,7 @@ from utils import (
     find_matching_brace,
     extract_latex_args,
     escape_latex_chars,
+    escape_latex_many,
     clean_latex_to_plain,
     parse_cventry,
     validate_url,
@@ -61,6 +62,14 @@ def test_escape_latex_chars():
     assert r'\$' in escaped
     assert r'\&' in escaped
     assert r'\%' in escaped
+    
+    # Replacements are not escaped again
+    assert escape_latex_chars("a\\b{c}") == r'a\textbackslash{}b\{c\}'
+    
+    # Bulk escaping matches item-by-item escaping
+    items = ["C#", "50%", "plain", "x\x00y"]
+    assert escape_latex_many(items) == [escape_latex_chars(i) for i in items]
+    assert escape_latex_many([]) == []
 
 
 def test_clean_latex_to_plain():
@@ -192,6 +201,125 @@ def test_latex_parser():
     assert isinstance(errors, list)
 
 
+def test_cventry_error_recovery():
+    """Test malformed cventries are reported with line/column and parsing recovers."""
+    from utils import LatexParser
+    
+    latex = (
+        "\\section{Projects}\n"
+        "\\cventry{Good}{Java}{}{Done}\n"
+        "\\cventry{Broken}{Go}{}{ never closed\n"
+        "  \\item still inside\n"
+        "\\cventry{Also Good}{Rust}{\\href{https://x.dev}{Link}}{Fine}\n"
+        "\\cventry{Short}{Only two}\n"
+        "\\section{Skills}\n"
+        "\\cventry{Tail}{C}{}{End}\n"
+    )
+    parser = LatexParser(latex, "projects.tex")
+    entries = parser.parse_cventries()
+    assert [e['title'] for e in entries] == ['Good', 'Also Good', 'Tail']
+    assert entries[1]['link_url'] == 'https://x.dev'
+    assert parser.get_errors() == [
+        "projects.tex:3:23: \\cventry: unmatched brace in argument 4/4",
+        "projects.tex:6:26: \\cventry: missing argument 3/4",
+    ]
+    assert parser.position(0) == (1, 1)
+    assert parse_cventry(latex) == entries
+
+
+def test_cventry_commented_boundaries():
+    """Test commented-out \\section / \\cventry lines do not split an entry."""
+    from utils import LatexParser
+    
+    latex = (
+        "\\cventry{A}{Java}{}{Body\n"
+        "% \\section{Old}\n"
+        "  more}\n"
+        "% \\cventry{Dropped}{Go}{}{Gone}\n"
+        "\\cventry{B}{Go}{}{%\\cventry\n"
+        "Done}\n"
+    )
+    parser = LatexParser(latex)
+    assert [e['title'] for e in parser.parse_cventries()] == ['A', 'B']
+    assert parser.get_errors() == []
+
+
+def test_macro_table():
+    """Test \\newcommand / \\newenvironment definitions compile and expand."""
+    from utils import MacroTable
+    
+    table = MacroTable.from_text(r"""
+    % \newcommand{\commented}{no}
+    \newcommand{\tech}[1]{\textit{#1}}
+    \newcommand\role[2][Developer]{#1 at #2}
+    \renewcommand*{\stack}[1]{Stack: \tech{#1}}
+    \newcommand{\cventry}[5]{#1#2#3#4#5}
+    \newenvironment{highlights}[1]{\section{#1}\begin{itemize}}{\end{itemize}}
+    """)
+    assert sorted(table.commands) == ['cventry', 'role', 'stack', 'tech']
+    assert table.arity('cventry') == 5 and table.arity('role') == 2
+    assert table.arity('textbf') is None
+    
+    assert table.expand(r"\stack{Java} \role{Acme} \role[Lead]{Initech}") == \
+        r"Stack: \textit{Java} Developer at Acme Lead at Initech"
+    assert table.expand(r"\begin{highlights}{Wins}\item A\end{highlights}") == \
+        r"\section{Wins}\begin{itemize}\item A\end{itemize}"
+    assert table.expand(r"\tech{A} \\tech", keep={'tech'}) == r"\tech{A} \\tech"
+    # Malformed uses are left alone
+    assert table.expand(r"\tech oops") == r"\tech oops"
+    
+    assert clean_latex_to_plain(r"Cut costs 40\% \tech{fast} % comment", table) == "Cut costs 40% fast"
+
+
+def test_macro_expansion_budget():
+    """Test recursive macros stop expanding with a single warning."""
+    import logging
+    from utils import MacroTable, ExpansionBudget
+    
+    table = MacroTable.from_text(r"\newcommand{\x}{a\x\x}\newcommand{\loopy}{x\loopy}\newcommand{\ok}{fine}")
+    warnings = []
+    handler = logging.Handler()
+    handler.emit = lambda record: warnings.append(record.getMessage())
+    logging.getLogger('utils').addHandler(handler)
+    try:
+        exploded = table.expand(r"\x \ok")
+        looped = table.expand(r"\loopy")
+        budget = ExpansionBudget(max_expansions=3)
+        counted = table.expand(r"\ok\ok\ok\ok", budget=budget)
+    finally:
+        logging.getLogger('utils').removeHandler(handler)
+    
+    assert len(exploded) < 200 and exploded.startswith('a' * 32) and exploded.endswith(r"\ok")
+    assert looped == 'x' * 32 + r"\loopy"
+    assert counted == r"finefinefine\ok" and budget.exhausted
+    assert len(warnings) == 3 and all('Stopped expanding' in w for w in warnings)
+
+
+def test_cventry_arity_from_macros():
+    """Test the cventry arity comes from the macro table."""
+    from utils import LatexParser, MacroTable
+    
+    import logging
+    
+    table = MacroTable.from_text(r"\newcommand{\cventry}[3]{#1 #2 #3}")
+    parser = LatexParser(r"\cventry{App}{Go}{\href{https://a.dev}{Site}}\cventry{Next}{Rust}", macros=table)
+    warnings = []
+    handler = logging.Handler()
+    handler.emit = lambda record: warnings.append(record.getMessage())
+    logging.getLogger('utils').addHandler(handler)
+    try:
+        entries = parser.parse_cventries()
+        LatexParser(r"\cventry{Again}{Go}{}", macros=table).parse_cventries()
+    finally:
+        logging.getLogger('utils').removeHandler(handler)
+    # The arity differs from the known fields: reported once per definition
+    assert len(warnings) == 1 and 'cventry takes 3 arguments but is read as 4' in warnings[0]
+    assert [(e['title'], e['tech'], e['link_url'], e['content']) for e in entries] == [
+        ('App', 'Go', 'https://a.dev', '')
+    ]
+    assert parser.get_errors() == ["<string>:1:66: \\cventry: missing argument 3/3"]
+
+
 def test_double_backslash_braces():
     """Test find_matching_brace with double backslashes."""
     # Test that \\{ is not treated as escaped (the backslash is escaped, not the brace)
@@ -203,9 +331,129 @@ def test_double_backslash_braces():
     assert text[pos-1] == '}'
 
 
-def run_all_tests():
+def test_structured_logging():
+    """Test JSON log mode, per-tree context, quiet mode and queued logging."""
+    import io
+    import json
+    from utils import configure_logging, stop_logging, log_context, logger, write_file_safe
+    import tempfile
+    
+    stream = io.StringIO()
+    try:
+        configure_logging(json_format=True, quiet=True, use_queue=True, stream=stream)
+        with log_context(tree='jane-doe'):
+            logger.info("Parsed %d entries", 3)
+            with tempfile.TemporaryDirectory() as tmp:
+                assert write_file_safe(os.path.join(tmp, 'x.tex'), 'x')
+        logger.warning("outside")
+        stop_logging()
+        
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert len(lines) == 2  # "✓ Generated" suppressed by quiet mode
+        assert lines[0]['message'] == 'Parsed 3 entries'
+        assert lines[0]['tree'] == 'jane-doe'
+        assert lines[0]['level'] == 'INFO'
+        assert 'tree' not in lines[1]
+    finally:
+        configure_logging()
+
+
+def test_import_has_no_side_effects():
+    """Test importing utils neither changes directory nor configures logging."""
+    import subprocess
+    scripts = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts')
+    probe = (
+        "import os, logging\n"
+        "before = os.getcwd()\n"
+        "import utils, generate_json, generate_html, keyword_index\n"
+        "assert os.getcwd() == before, os.getcwd()\n"
+        "assert not logging.getLogger().handlers\n"
+    )
+    result = subprocess.run([sys.executable, '-c', probe], cwd=scripts,
+                            capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+def test_context_for_tree():
+    """Test trees are parsed through their own Context, concurrently."""
+    import tempfile
+    from concurrent.futures import ThreadPoolExecutor
+    from utils import get_default_context
+    from generate_json import build_resume_data
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        contexts = []
+        for name in ('alice', 'bob', 'carol', 'dave'):
+            sections = os.path.join(tmp, name, 'sections')
+            os.makedirs(sections)
+            with open(os.path.join(sections, 'summary.tex'), 'w', encoding='utf-8') as f:
+                f.write(f"\\section{{Summary}}\n\\noindent Summary of {name}.\n")
+            with open(os.path.join(sections, 'projects.tex'), 'w', encoding='utf-8') as f:
+                f.write(f"\\cventry{{{name} Api}}{{Go}}{{}}{{Details}}\n")
+            contexts.append(get_default_context().for_tree(os.path.join(tmp, name)))
+        
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda ctx: build_resume_data(ctx=ctx), contexts))
+    
+    for ctx, data in zip(contexts, results):
+        name = os.path.basename(ctx.root_dir)
+        assert data['basics']['summary'] == f"Summary of {name}."
+        assert [p['name'] for p in data['projects']] == [f"{name} Api"]
+    assert contexts[0].macros_file == get_default_context().macros_file
+
+
+def test_context_config_and_logging():
+    """Test two contexts in one process keep their own output paths and loggers."""
+    import logging
+    import tempfile
+    import types
+    import config
+    from utils import Context
+    from generate_json import generate_json_resume
+    from generate_html import generate_preview
+    
+    records = {}
+    
+    def capture(name):
+        log = logging.getLogger(f"test_context.{name}")
+        log.propagate = False
+        log.setLevel(logging.DEBUG)
+        handler = logging.Handler()
+        handler.emit = lambda record: records.setdefault(name, []).append(record.getMessage())
+        log.addHandler(handler)
+        return log
+    
+    module_records = []
+    module_handler = logging.Handler()
+    module_handler.emit = lambda record: module_records.append(record.getMessage())
+    logging.getLogger('utils').addHandler(module_handler)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            with open(os.path.join(tmp, config.MAIN_TEX_FILE), 'w', encoding='utf-8') as f:
+                f.write("\\begin{document}\\section{Hello}\\end{document}\n")
+            for name in ('alice', 'bob'):
+                settings = {key: getattr(config, key) for key in dir(config) if key.isupper()}
+                settings['OUTPUT_FILES'] = dict(config.OUTPUT_FILES, json=f"out/{name}.json",
+                                                html=f"out/{name}.html")
+                ctx = Context(tmp, types.SimpleNamespace(**settings), capture(name),
+                              macros_file=os.path.join(tmp, 'missing.tex'))
+                assert generate_json_resume(ctx=ctx) == os.path.join(tmp, 'out', f"{name}.json")
+                assert generate_preview(ctx=ctx)
+            assert sorted(os.listdir(os.path.join(tmp, 'out'))) == [
+                'alice.html', 'alice.json', 'bob.html', 'bob.json'
+            ]
+    finally:
+        logging.getLogger('utils').removeHandler(module_handler)
+    
+    for name in ('alice', 'bob'):
+        assert any(f"out/{name}.json" in message for message in records[name])
+        assert any('missing.tex' in message for message in records[name])
+    assert module_records == []
+
+
+def run_all_tests(tests=None, title="Resume Generator Test Suite"):
     """Run all tests and print results."""
-    tests = [
+    tests = tests or [
         ("Brace Matching", test_find_matching_brace),
         ("Argument Extraction", test_extract_latex_args),
         ("LaTeX Escaping", test_escape_latex_chars),
@@ -218,7 +466,16 @@ def run_all_tests():
         ("File Size Formatting", test_format_file_size),
         ("Summary Text Extraction", test_get_summary_text),
         ("LaTeX Parser", test_latex_parser),
+        ("CVEntry Error Recovery", test_cventry_error_recovery),
+        ("CVEntry Commented Boundaries", test_cventry_commented_boundaries),
+        ("Macro Expansion Budget", test_macro_expansion_budget),
+        ("Macro Table", test_macro_table),
+        ("CVEntry Arity From Macros", test_cventry_arity_from_macros),
         ("Double Backslash Braces", test_double_backslash_braces),
+        ("Structured Logging", test_structured_logging),
+        ("Import Side Effects", test_import_has_no_side_effects),
+        ("Context Config And Logging", test_context_config_and_logging),
+        ("Context Per Tree", test_context_for_tree),
     ]
     
     passed = 0
@@ -226,7 +483,7 @@ def run_all_tests():
     errors = []
     
     print("="*60)
-    print("Running Resume Generator Test Suite")
+    print(f"Running {title}")
     print("="*60 + "\n")
     
     for name, test_func in tests:
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Unit tests for offline JSON Resume schema validation.
+Run with: python -m pytest tests/
+Or: python tests/test_validate_resume.py
+"""
+
+import sys
+import os
+import json
+import tempfile
+
+# Add parent directory to path to import scripts
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from validate_resume import SchemaCompiler, validate_resume, validate_source
+from generate_json import build_resume_data
+
+
+def test_violation_paths():
+    """Test each violation is reported with its exact path."""
+    resume = {
+        "basics": {"name": "Jane", "email": "not-an-email", "profiles": [{"url": "github.com/jane"}]},
+        "projects": [{"name": "Ok", "startDate": "2024-05"}, {"name": 7, "endDate": "May 2024"}],
+        "skills": [{"keywords": ["Java", None]}],
+        "$schema": "https://example.com/schema.json",
+        "extra": True,
+    }
+    assert sorted(path for path, _ in validate_resume(resume)) == [
+        '$.basics.email',
+        '$.basics.profiles[0].url',
+        '$.extra',
+        '$.projects[1].endDate',
+        '$.projects[1].name',
+        '$.skills[0].keywords[1]',
+    ]
+    assert validate_resume({}) == []
+    assert validate_resume([]) == [('$', 'expected object, got array')]
+
+
+def test_compiler_keywords():
+    """Test $ref, required, enum and non-identifier keys."""
+    schema = {
+        "definitions": {"node": {"type": "object", "required": ["id"],
+                                 "properties": {"id": {"enum": [1, 2]},
+                                                "children": {"type": "array", "items": {"$ref": "#/definitions/node"}}}}},
+        "$ref": "#/definitions/node",
+    }
+    check = SchemaCompiler(schema).compile()
+    errors = []
+    check({"id": 1, "children": [{"id": 3}, {"children": []}]}, "$", errors)
+    assert errors == [
+        ("$.children[0].id", "3 is not one of [1, 2]"),
+        ("$.children[1]", "missing required property 'id'"),
+    ]
+
+    errors = []
+    SchemaCompiler({"properties": {"a-b": {"type": "string"}}}).compile()({"a-b": 1}, "$", errors)
+    assert errors == [('$["a-b"]', "expected string, got integer")]
+
+
+def test_validate_ndjson_batch():
+    """Test NDJSON batches count valid, invalid and unparseable lines."""
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'resumes.ndjson')
+        with open(source, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({"basics": {"name": "A"}}) + '\n')
+            f.write(json.dumps({"work": [{"startDate": ""}]}) + '\n')
+            f.write('{oops\n')
+        assert validate_source(source) == {"valid": 1, "invalid": 1, "failed": 1}
+
+
+def test_generated_resume_is_valid():
+    """Test generate_json output validates against the schema."""
+    assert validate_resume(build_resume_data()) == []
+
+
+TESTS = [
+    ("Violation Paths", test_violation_paths),
+    ("Compiler Keywords", test_compiler_keywords),
+    ("NDJSON Batch", test_validate_ndjson_batch),
+    ("Generated Resume", test_generated_resume_is_valid),
+]
+
+
+if __name__ == "__main__":
+    from test_utils import run_all_tests
+    sys.exit(0 if run_all_tests(TESTS, "Schema Validation Tests") else 1)